@@ -61,9 +61,51 @@ class TestConfig:
     # Non-routable IP (TEST-NET) — з'єднання не встановлюється, гарантовано conn-timeout.
     # httpbin.org/delay повертає JSON за ~10 сек → помилка валідації XML, не таймаут.
     TEST_TIMEOUT_FEED_URL = os.getenv("TEST_TIMEOUT_FEED_URL", "http://192.0.2.1/xml")
+    # URL з протоколом http (публічний HTTP фід floatrates)
+    TEST_HTTP_XML_FEED_URL = os.getenv("TEST_HTTP_XML_FEED_URL", "http://www.floatrates.com/daily/usd.xml")
+    # Фід з двома варіантами (1-й запит=1 товар, 2-й=2 товари), mock serve-all-feeds.js у tests-ts
+    TEST_XML_FEED_TWO_VERSIONS_URL = os.getenv("TEST_XML_FEED_TWO_VERSIONS_URL", "http://localhost:9877/feed.xml")
+    # Повільний і завислий фіди — доступні лише з локальним сервером фідів (див. нижче)
+    TEST_SLOW_FEED_URL = os.getenv("TEST_SLOW_FEED_URL", "")
+    TEST_STALLED_FEED_URL = os.getenv("TEST_STALLED_FEED_URL", "")
+    
+    # Локальний сервер фідів (utils/feed_server.py) замість зовнішніх URL (gist, dropbox, floatrates).
+    # Вмикається TEST_LOCAL_FEEDS=1; HUB має мати доступ до сервера:
+    # TEST_LOCAL_FEEDS_PUBLIC_URL — адреса, за якою HUB бачить сервер (тунель, host.docker.internal:9878)
+    LOCAL_FEEDS_ENABLED = os.getenv("TEST_LOCAL_FEEDS", "").lower() in ("1", "true", "yes")
+    LOCAL_FEEDS_HOST = os.getenv("TEST_LOCAL_FEEDS_HOST", "0.0.0.0")
+    LOCAL_FEEDS_PORT = int(os.getenv("TEST_LOCAL_FEEDS_PORT", "9878"))
+    LOCAL_FEEDS_PUBLIC_URL = os.getenv("TEST_LOCAL_FEEDS_PUBLIC_URL", "")
     
     # Постачальник для тестування XML-фідів
     TEST_SUPPLIER_NAME = os.getenv("TEST_SUPPLIER_NAME", "Парфюмс")
+    # ID того ж постачальника для індексу постачальників (вибір постачальника без пошуку в меню); порожньо — з меню
+    TEST_SUPPLIER_ID = os.getenv("TEST_SUPPLIER_ID", "")
+    # Індекс постачальників (utils/supplier_index.py): назва -> supplier_id зі списку постачальників HUB,
+    # щоб вибирати постачальника запитом/URL, а не пошуком у меню. Порожньо - індекс лише в межах процесу
+    SUPPLIER_INDEX_PATH = os.getenv(
+        "TEST_SUPPLIER_INDEX", str(Path(__file__).resolve().parent.parent / ".cache" / "supplier_index.json")
+    )
+    # Через скільки годин список постачальників завантажується заново
+    SUPPLIER_INDEX_TTL_HOURS = float(os.getenv("TEST_SUPPLIER_INDEX_TTL_HOURS", "24"))
+    # API списку і шаблон URL вибору постачальника з {supplier_id}; порожньо - перехоплюються з першого вибору через UI
+    SUPPLIERS_API_URL = os.getenv("TEST_SUPPLIERS_API_URL", "")
+    SUPPLIER_SWITCH_URL = os.getenv("TEST_SUPPLIER_SWITCH_URL", "")
+    # API постачальника HUB (handlers у src/hub/api/handlers/supplier.clj, див. docs/XML_AUTOMATION_PLAN.md).
+    # Шлях будується як у /api/admin-tools/trigger-feedload; для стенду з іншим префіксом задається повністю.
+    # set-feeds - збереження фіду (upsert за origin_url), з полем file - завантаження Excel мапінгу.
+    # Arrange/cleanup без UI (utils/feed_api.py) зберігає фіди через set-feeds, а feed_id і стан фідів читає з БД
+    # (налаштування DB_* нижче): API списку і видалення фідів у HUB немає
+    SUPPLIER_API_URL = os.getenv("TEST_SUPPLIER_API_URL", f"{BASE_URL}/api/supplier")
+    SET_FEEDS_API_URL = os.getenv("TEST_SET_FEEDS_API_URL", f"{SUPPLIER_API_URL}/set-feeds")
+    # gen-mapping-file - скачування Excel мапінгу фіду (utils/mapping_api.py), URL з {feed_id}.
+    # Завантаження мапінгу - set-feeds з полями origin_url і file (як кнопка на сторінці фіду)
+    GEN_MAPPING_FILE_API_URL = os.getenv(
+        "TEST_GEN_MAPPING_FILE_API_URL", f"{SUPPLIER_API_URL}/gen-mapping-file?feed_id={{feed_id}}"
+    )
+    # Пул заздалегідь створених фідів (utils/feed_pool.py): розмір і чи лишати фіди після сесії
+    FEED_POOL_SIZE = int(os.getenv("TEST_FEED_POOL_SIZE", "4"))
+    FEED_POOL_KEEP = os.getenv("TEST_FEED_POOL_KEEP", "1").lower() in ("1", "true", "yes")
     # URL для тесту "Додавання одного URL двічі" (Парфюмс, фід не створює дубль, лише оновлює)
     TEST_DUPLICATE_FEED_URL = os.getenv(
         "TEST_DUPLICATE_FEED_URL",
@@ -77,6 +119,60 @@ class TestConfig:
     # Вмикаємо 3, при спробі вмикнути 4-й — очікується помилка
     _feed_ids_str = os.getenv("TEST_FEED_IDS_FOR_LIMIT", "R3DV,R2K3,R3DX,R3DY")
     TEST_FEED_IDS_FOR_LIMIT = [x.strip() for x in _feed_ids_str.split(",") if x.strip()]
+    # Паралельний запуск (pytest -n N): слоти "постачальник|supplier_id|existing_feed_id|feed_ids_for_limit" через ";"
+    # Воркер i отримує слот i % кількість (utils/worker_resources.py). Порожньо — значення вище для всіх воркерів
+    WORKER_SLOTS = os.getenv("TEST_WORKER_SLOTS", "")
+    # Скільки секунд тест чекає на ресурс, зайнятий іншим воркером
+    RESOURCE_LOCK_TIMEOUT = int(os.getenv("TEST_RESOURCE_LOCK_TIMEOUT", "900"))
+    # Кількість рядків "Категорія+" для тесту масштабування завантаження мапінгу (через кому, напр. "1000,100000")
+    # Порожнє значення — тест не запускається (синтетичний мапінг перезаписує мапінг фіду TEST_EXISTING_FEED_ID)
+    _mapping_scale_rows_str = os.getenv("TEST_MAPPING_SCALE_ROWS", "")
+    TEST_MAPPING_SCALE_ROWS = [int(x) for x in _mapping_scale_rows_str.split(",") if x.strip()]
+    
+    # Профіль маршрутизації (utils/route_profile.py): типи ресурсів і хости, запити до яких блокуються.
+    # Порожні значення - нічого не блокується. Типи ресурсів за замовчуванням не блокуються (сторінка як у
+    # користувача); увімкнути - напр. TEST_BLOCK_RESOURCE_TYPES=image,font,media
+    _block_types_str = os.getenv("TEST_BLOCK_RESOURCE_TYPES", "")
+    BLOCK_RESOURCE_TYPES = [x.strip() for x in _block_types_str.split(",") if x.strip()]
+    _block_hosts_str = os.getenv(
+        "TEST_BLOCK_HOSTS",
+        "google-analytics.com,googletagmanager.com,doubleclick.net,facebook.net,"
+        "mc.yandex.ru,hotjar.com,clarity.ms"
+    )
+    BLOCK_HOSTS = [x.strip() for x in _block_hosts_str.split(",") if x.strip()]
+    
+    # Дисковий кеш незмінної статики HUB (utils/asset_cache.py), спільний для контекстів, воркерів і запусків.
+    # За замовчуванням вимкнено; увімкнути - TEST_ASSET_CACHE=1
+    ASSET_CACHE_ENABLED = os.getenv("TEST_ASSET_CACHE", "").lower() in ("1", "true", "yes")
+    ASSET_CACHE_DIR = os.getenv("TEST_ASSET_CACHE_DIR", str(Path(__file__).resolve().parent.parent / ".cache" / "assets"))
+    
+    # Статистика варіантів локаторів (utils/locator_registry.py): який варіант спрацьовує, щоб наступні запуски
+    # перевіряли його першим. Порожньо - статистика лише в межах процесу
+    LOCATOR_STATS_PATH = os.getenv(
+        "TEST_LOCATOR_STATS", str(Path(__file__).resolve().parent.parent / ".cache" / "locator_stats.json")
+    )
+    
+    # HAR-режим (utils/har_replay.py): record - записати трафік HUB кожного тесту, replay - відтворити без живого HUB
+    HAR_MODE = os.getenv("TEST_HAR_MODE", "").lower()
+    HAR_DIR = os.getenv("TEST_HAR_DIR", str(Path(__file__).resolve().parent.parent / "hars"))
+    
+    # Локальна заміна HUB (utils/hub_stub.py): логін, таблиця і API фідів, ліміт активних фідів, мапінг.
+    # TEST_HUB_STUB=1 - URL HUB підміняються на заміну; затримка (мс) і частка відповідей 503 - для відтворення
+    # нестабільних за таймінгом падінь (однаковий seed - однакова послідовність збоїв)
+    HUB_STUB_ENABLED = os.getenv("TEST_HUB_STUB", "").lower() in ("1", "true", "yes")
+    HUB_STUB_PORT = int(os.getenv("TEST_HUB_STUB_PORT", "0"))
+    HUB_STUB_LATENCY_MS = int(os.getenv("TEST_HUB_STUB_LATENCY_MS", "0"))
+    HUB_STUB_FAILURE_RATE = float(os.getenv("TEST_HUB_STUB_FAILURE_RATE", "0"))
+    HUB_STUB_SEED = int(os.getenv("TEST_HUB_STUB_SEED", "0"))
+    
+    # SQL injection тести логіну: payloads з tests/data/sql_injection_payloads.json відправляються через API пакетом.
+    # Скільки запитів одночасно; payloads у полі пароля для TEST_USER_EMAIL - лише явно (ризик блокування акаунта)
+    SQLI_CONCURRENCY = int(os.getenv("TEST_SQLI_CONCURRENCY", "8"))
+    SQLI_PASSWORD_FIELD = os.getenv("TEST_SQLI_PASSWORD_FIELD", "").lower() in ("1", "true", "yes")
+    
+    # Пул готових контекстів браузера (conftest.py): скільки контекстів тримати напоготові.
+    # За замовчуванням 0 - вимкнено (новий контекст pytest-playwright на кожен тест); увімкнути - напр. 2
+    CONTEXT_POOL_SIZE = int(os.getenv("TEST_CONTEXT_POOL_SIZE", "0"))
     
     # Налаштування бази даних для очищення тестових даних
     DB_HOST = os.getenv("TEST_DB_HOST", "")
@@ -84,6 +180,9 @@ class TestConfig:
     DB_NAME = os.getenv("TEST_DB_NAME", "")
     DB_USER = os.getenv("TEST_DB_USER", "")
     DB_PASSWORD = os.getenv("TEST_DB_PASSWORD", "")
+    # Локи спільних ресурсів (маркер exclusive) через advisory locks у цій БД замість файлових -
+    # для кількох паралельних пайплайнів на різних машинах (DBHelper.acquire_lease)
+    DB_LEASES_ENABLED = os.getenv("TEST_DB_LEASES", "").lower() in ("1", "true", "yes")
     
     @classmethod
     def validate(cls):
@@ -1,9 +1,34 @@
+import os
 import pytest
 import platform
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict
+from urllib.parse import urlparse
 from config.settings import TestConfig
+from utils.asset_cache import AssetCache
+from utils.auth_session import AuthSession
+from utils.context_pool import ContextPool
+from utils.db_helper import DBHelper
+from utils.feed_api import FeedApiClient, FeedFactory, FeedStore, RequestsApiContext
+from utils.feed_pool import FeedPool
+from utils.feed_server import FeedServer
+from utils.har_replay import HarReplayer, har_path_for, record_har
+from utils.hub_stub import HubFaults, HubStubServer
+from utils.local_feeds import register_test_feeds
+from utils.locator_registry import LocatorRegistry, set_registry
+from utils.mapping_api import MappingApiClient
+from utils.route_profile import RouteProfile
+from utils.supplier_index import SupplierIndex, set_supplier_index
+from utils.worker_resources import (
+    ResourceLock, artifact_name, parse_worker_slots, slot_for_worker, worker_id, worker_index
+)
+
+
+# Файли локів ресурсів, спільні для всіх воркерів pytest-xdist
+LOCKS_DIR = Path(__file__).resolve().parent / ".locks"
+# Пул контекстів браузера сесії (для хука pytest_runtest_protocol)
+CONTEXT_POOL_KEY = pytest.StashKey[ContextPool]()
 
 
 def pytest_configure(config):
@@ -11,6 +36,15 @@ def pytest_configure(config):
     Налаштування pytest перед запуском тестів.
     Видаляє старі HTML-репорти та створює новий звіт з timestamp.
     """
+    config.addinivalue_line(
+        "markers",
+        "exclusive(*resources): тест змінює спільні ресурси HUB (атрибути TestConfig, напр. "
+        "\"TEST_EXISTING_FEED_ID\"); під pytest-xdist такі тести серіалізуються локом"
+    )
+    # Воркери pytest-xdist: звіт пише лише головний процес, старі репорти теж чистить він
+    if hasattr(config, "workerinput"):
+        return
+    
     # Репорти зберігаємо в корені репозиторію (HUB_login/reports)
     reports_dir = Path(__file__).resolve().parent.parent / "reports"
     reports_dir.mkdir(parents=True, exist_ok=True)
@@ -61,6 +95,130 @@ def browser_type_launch_args(browser_type_launch_args):
     }
 
 
+@pytest.fixture(scope="session")
+def network_handlers():
+    """
+    Обробники запитів, що встановлюються на кожен контекст браузера тестів.
+    Кожен має install(context) і snapshot() (лічильники для звіту тесту).
+    
+    - RouteProfile: блокує TEST_BLOCK_HOSTS (аналітика) і TEST_BLOCK_RESOURCE_TYPES (за замовчуванням порожньо)
+    - AssetCache (TEST_ASSET_CACHE=1): віддає незмінні JS/CSS HUB з дискового кешу TEST_ASSET_CACHE_DIR
+    Обробники встановлюються в порядку списку; Playwright викликає першим останній встановлений.
+    """
+    handlers = []
+    profile = RouteProfile(TestConfig.BLOCK_RESOURCE_TYPES, TestConfig.BLOCK_HOSTS)
+    if profile.enabled:
+        handlers.append(profile)
+    cache = None
+    if TestConfig.ASSET_CACHE_ENABLED:
+        cache = AssetCache(TestConfig.ASSET_CACHE_DIR, hosts=[urlparse(TestConfig.BASE_URL).hostname])
+        handlers.append(cache)
+    yield handlers
+    if profile.enabled:
+        print(f"\n>>> Профіль маршрутизації: {profile.summary()}")
+    if cache is not None:
+        print(f">>> Кеш статики: {cache.summary()}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def locator_registry():
+    """
+    Реєстр варіантів локаторів для BasePage.find_locator (utils/locator_registry.py).
+    Статистика з TEST_LOCATOR_STATS задає порядок перевірки варіантів; після сесії приріст дописується у файл
+    (кожен воркер під локом), а частка спрацювань кожного варіанта виводиться в підсумку.
+    """
+    registry = LocatorRegistry(TestConfig.LOCATOR_STATS_PATH)
+    set_registry(registry)
+    yield registry
+    registry.save()
+    summary = registry.summary()
+    if summary:
+        print(f"\n>>> Варіанти локаторів (частка спрацювань за всі запуски):\n{summary}")
+    set_registry(LocatorRegistry())
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, browser_context_args, pytestconfig, request, network_handlers):
+    """
+    Пул готових контекстів браузера (utils/context_pool.py), TEST_CONTEXT_POOL_SIZE на кожен вид
+    (з авторизацією для тестів з auth_session / без неї). 0 (за замовчуванням) - пул вимкнено.
+    """
+    if TestConfig.CONTEXT_POOL_SIZE <= 0:
+        yield None
+        return
+    
+    pool = ContextPool(
+        browser,
+        browser_context_args,
+        size=TestConfig.CONTEXT_POOL_SIZE,
+        storage_state=lambda: request.getfixturevalue("auth_session").ensure_state()
+    )
+    for handler in network_handlers:
+        pool.add_preparer(handler.install)
+    pytestconfig.stash[CONTEXT_POOL_KEY] = pool
+    try:
+        yield pool
+    finally:
+        del pytestconfig.stash[CONTEXT_POOL_KEY]
+        pool.close()
+
+
+@pytest.fixture(scope="function")
+def page(request, pytestconfig, context_pool, network_handlers):
+    """
+    Сторінка тесту з пулу готових контекстів.
+    Контекст плагіна pytest-playwright (новий на кожен тест) використовується, якщо пул вимкнено,
+    для тесту задано маркер browser_context_args або увімкнено --tracing/--video/--screenshot
+    (ці артефакти пише фікстура context плагіна).
+    """
+    use_plugin_context = (
+        context_pool is None
+        or request.node.get_closest_marker("browser_context_args") is not None
+        or any(pytestconfig.getoption(option) != "off" for option in ("--tracing", "--video", "--screenshot"))
+    )
+    har_path = har_path_for(TestConfig.HAR_DIR, request.node.nodeid)
+    if TestConfig.HAR_MODE == "replay" and not har_path.exists():
+        pytest.skip(f"HAR для тесту не записано (TEST_HAR_MODE=record): {har_path}")
+    
+    # Лічильники обробників запитів на початок тесту - різницю додає у звіт pytest_runtest_makereport
+    request.node.network_stats_start = [(handler, handler.snapshot()) for handler in network_handlers]
+    if use_plugin_context:
+        context = request.getfixturevalue("context")
+        for handler in network_handlers:
+            handler.install(context)
+        test_page = context.new_page()
+    else:
+        authenticated = "auth_session" in request.fixturenames
+        if authenticated:
+            # Сесію створюємо до контексту: пул бере з неї storage state
+            request.getfixturevalue("auth_session")
+        context, test_page = context_pool.acquire(authenticated=authenticated)
+    
+    # HAR-режим: запис трафіку HUB тесту або його відтворення без живого HUB
+    if TestConfig.HAR_MODE == "record":
+        record_har(context, har_path, TestConfig.BASE_URL)
+    elif TestConfig.HAR_MODE == "replay":
+        replayer = HarReplayer(str(har_path))
+        replayer.install(context, TestConfig.BASE_URL)
+        request.node.network_stats_start.append((replayer, {}))
+    
+    yield test_page
+    if not use_plugin_context:
+        context_pool.release(context)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Після тесту (поза setup/call/teardown) поповнюємо пул, щоб наступний тест отримав готову сторінку.
+    Використані контексти закриваються у фоні (ContextPool.maintain не чекає на закриття).
+    """
+    yield
+    pool = item.config.stash.get(CONTEXT_POOL_KEY, None)
+    if pool is not None and nextitem is not None:
+        pool.maintain()
+
+
 @pytest.hookimpl(tryfirst=True)
 def pytest_runtest_setup(item):
     """
@@ -98,8 +256,12 @@ def setup_devtools_network_tab(request):
     try:
         page = request.getfixturevalue("page")
         if page:
-            # Чекаємо трохи, щоб DevTools встигли відкритися
-            page.wait_for_timeout(2000)
+            # Чекаємо трохи, щоб DevTools встигли відкритися.
+            # Сторінку з пулу контекстів створено до тесту (DevTools відкривались, поки йшов попередній тест),
+            # тому для неї очікування немає
+            pool = request.config.stash.get(CONTEXT_POOL_KEY, None)
+            if pool is None or pool.page_age_ms(page) is None:
+                page.wait_for_timeout(2000)
             
             # Намагаємося перемкнути DevTools на вкладку Network через CDP
             # Використовуємо різні методи для максимальної сумісності
@@ -220,7 +382,7 @@ def _save_bug_report(item, rep, screenshot_path=None):
     """
     reports_dir = Path("reports")
     reports_dir.mkdir(exist_ok=True)
-    bug_report_path = reports_dir / "last_failure_bug_report.txt"
+    bug_report_path = reports_dir / artifact_name("last_failure_bug_report", ".txt")
     
     test_name = item.nodeid
     test_short = item.name.split("[")[0] if "[" in item.name else item.name
@@ -321,6 +483,22 @@ def pytest_runtest_makereport(item, call):
                 "value": error_text
             })
     
+    # Статистика мережі за тест (заблоковані запити, кеш статики)
+    network_stats_start = getattr(item, "network_stats_start", None)
+    if rep.when == "call" and network_stats_start:
+        lines = []
+        for handler, before in network_stats_start:
+            for key, value in handler.snapshot().items():
+                delta = value - before.get(key, 0)
+                if delta:
+                    lines.append(f"{type(handler).__name__}: {key} = {delta}")
+        if lines:
+            extra_items.append({
+                "type": "text",
+                "name": "Мережа",
+                "value": "\n".join(lines)
+            })
+    
     # Зберігаємо скріншот, bug report та trace тільки якщо тест завершився з помилкою
     screenshot_path = None
     if rep.when == "call" and rep.failed:
@@ -335,7 +513,7 @@ def pytest_runtest_makereport(item, call):
                 # Генеруємо унікальне ім'я файлу
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 test_name_safe = item.name.replace("::", "_").replace("[", "_").replace("]", "")
-                screenshot_path = screenshots_dir / f"{test_name_safe}_{timestamp}.png"
+                screenshot_path = screenshots_dir / artifact_name(f"{test_name_safe}_{timestamp}", ".png")
                 
                 try:
                     # Зберігаємо скріншот
@@ -366,3 +544,339 @@ def test_config():
     # Валідація конфігурації при завантаженні
     TestConfig.validate()
     return TestConfig
+
+
+@pytest.fixture(scope="session", autouse=True)
+def worker_slot():
+    """
+    Ресурси HUB цього воркера при паралельному запуску (pytest -n N).
+    Якщо задано TEST_WORKER_SLOTS - постачальник і фіди з TestConfig підміняються на слот воркера
+    (воркер i отримує слот i % кількість), після сесії значення відновлюються.
+    Без TEST_WORKER_SLOTS усі воркери використовують одні й ті самі ресурси, а тести з маркером
+    exclusive серіалізуються фікстурою resource_locks.
+    """
+    slot = slot_for_worker(parse_worker_slots(TestConfig.WORKER_SLOTS))
+    if slot is None:
+        yield None
+        return
+    
+    original = slot.apply_to(TestConfig)
+    print(f"\n>>> [{worker_id()}] Слот ресурсів: {slot}")
+    try:
+        yield slot
+    finally:
+        for attr, value in original.items():
+            setattr(TestConfig, attr, value)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def resource_locks(request, worker_slot):
+    """
+    Локи спільних ресурсів HUB для тесту.
+    
+    - Тест, що працює з постачальником (використовує auth_session), тримає спільний лок постачальника.
+    - @pytest.mark.exclusive("TEST_XML_FEED_URL", ...) - ексклюзивні локи значень цих атрибутів
+      TestConfig (URL, feed_id, список feed_id) у межах постачальника.
+    - @pytest.mark.exclusive("TEST_SUPPLIER_NAME") - ексклюзивний лок усього постачальника
+      (напр. тест ліміту активних фідів).
+    Локи захоплюються в одному порядку (постачальник, далі за назвою), тому взаємоблокувань немає.
+    
+    Без TEST_DB_LEASES це файлові локи (воркери pytest-xdist на цій машині). З TEST_DB_LEASES=1 -
+    advisory locks у Postgres HUB (DBHelper.acquire_lease): їх бачать усі паралельні пайплайни
+    (tests-Python, tests-ts, інші гілки), що працюють з тією ж БД.
+    """
+    marker = request.node.get_closest_marker("exclusive")
+    resources = list(marker.args) if marker else []
+    if not resources and "auth_session" not in request.fixturenames:
+        yield
+        return
+    
+    supplier = TestConfig.TEST_SUPPLIER_NAME
+    specs = [(f"supplier:{supplier}", "TEST_SUPPLIER_NAME" not in resources)]
+    names = set()
+    for attr in resources:
+        if attr == "TEST_SUPPLIER_NAME":
+            continue
+        value = getattr(TestConfig, attr)
+        for item in (value if isinstance(value, (list, tuple)) else [value]):
+            if item:
+                names.add(f"{supplier}:{item}")
+    specs += [(name, False) for name in sorted(names)]
+    
+    if TestConfig.DB_LEASES_ENABLED:
+        db = DBHelper(
+            host=TestConfig.DB_HOST,
+            port=TestConfig.DB_PORT,
+            database=TestConfig.DB_NAME,
+            user=TestConfig.DB_USER,
+            password=TestConfig.DB_PASSWORD
+        )
+        try:
+            db.set_lease_owner(f"tests-Python {worker_id()} {request.node.name}")
+            for name, shared in specs:
+                db.acquire_lease(name, shared=shared, timeout=TestConfig.RESOURCE_LOCK_TIMEOUT)
+            yield
+        finally:
+            # Закриття підключення звільняє всі його advisory locks
+            db.disconnect()
+        return
+    
+    acquired = []
+    try:
+        for name, shared in specs:
+            lock = ResourceLock(str(LOCKS_DIR), name, shared=shared, timeout=TestConfig.RESOURCE_LOCK_TIMEOUT)
+            lock.acquire()
+            acquired.append(lock)
+        yield
+    finally:
+        for lock in reversed(acquired):
+            lock.release()
+
+
+@pytest.fixture(scope="session")
+def auth_session(browser, browser_context_args, test_config):
+    """
+    Збережена сесія авторизації (utils/auth_session.py), одна на процес pytest.
+    Логін через форму виконується один раз, далі тести відкривають сторінки з cookies з файлу
+    .auth/storage_state_<воркер>.json. Якщо HUB перекинув на логін - сесія оновлюється.
+    Тести логіну (test_login.py) цю фікстуру не використовують.
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    state_path = Path(__file__).resolve().parent / ".auth" / f"storage_state_{worker}.json"
+    session = AuthSession(
+        browser,
+        offline=TestConfig.HAR_MODE == "replay",
+        login_url=test_config.LOGIN_URL,
+        email=test_config.USER_EMAIL,
+        password=test_config.USER_PASSWORD,
+        state_path=str(state_path),
+        context_args=browser_context_args
+    )
+    yield session
+    print(f"\n>>> Логінів через форму за сесію: {session.logins}")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_feed_server():
+    """
+    Фікстура локального сервера фідів (одна на сесію).
+    Якщо TEST_LOCAL_FEEDS=1 — запускає сервер з усіма варіантами фідів
+    (валідний, JSON всередині .xml, зламаний XML, 404, два варіанти, повільний, завислий)
+    та підміняє відповідні URL у TestConfig на локальні. Після сесії URL відновлюються.
+    Якщо вимкнено — тести використовують зовнішні URL з .env, фікстура повертає None.
+    """
+    if not TestConfig.LOCAL_FEEDS_ENABLED:
+        yield None
+        return
+    
+    # Під pytest-xdist кожен воркер піднімає свій сервер, тому без публічного URL порт зсувається на номер воркера
+    port = TestConfig.LOCAL_FEEDS_PORT
+    if not TestConfig.LOCAL_FEEDS_PUBLIC_URL:
+        port += worker_index()
+    server = FeedServer(
+        host=TestConfig.LOCAL_FEEDS_HOST,
+        port=port,
+        public_base_url=TestConfig.LOCAL_FEEDS_PUBLIC_URL or None
+    ).start()
+    
+    original_urls = {}
+    for attr, url in register_test_feeds(server).items():
+        original_urls[attr] = getattr(TestConfig, attr)
+        setattr(TestConfig, attr, url)
+    print(f"\n>>> Локальний сервер фідів: {server.base_url}")
+    
+    try:
+        yield server
+    finally:
+        for attr, url in original_urls.items():
+            setattr(TestConfig, attr, url)
+        server.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def hub_stub(local_feed_server, worker_slot):
+    """
+    Локальна заміна HUB (utils/hub_stub.py), одна на сесію.
+    Якщо TEST_HUB_STUB=1 — запускає заміну, підміняє URL HUB у TestConfig на її адреси та заповнює її
+    користувачами і фідами з TestConfig (фід для мапінгу, фіди для тесту ліміту). Затримка і частка збоїв —
+    TEST_HUB_STUB_LATENCY_MS і TEST_HUB_STUB_FAILURE_RATE; тест може змінити їх для своїх шляхів:
+    hub_stub.set_faults("/api/", HubFaults(latency_s=2, failure_rate=0.3)).
+    Після сесії значення TestConfig відновлюються. Якщо вимкнено — фікстура повертає None.
+    """
+    if not TestConfig.HUB_STUB_ENABLED:
+        yield None
+        return
+    
+    # Під pytest-xdist кожен воркер піднімає свою заміну, тому фіксований порт зсувається на номер воркера
+    port = TestConfig.HUB_STUB_PORT + worker_index() if TestConfig.HUB_STUB_PORT else 0
+    stub = HubStubServer(port=port, seed=TestConfig.HUB_STUB_SEED).start()
+    overrides = dict(stub.config_urls())
+    # Без облікових даних стенду заміна працює з власним користувачем
+    if not TestConfig.USER_EMAIL or not TestConfig.USER_PASSWORD:
+        overrides.update(USER_EMAIL="stub.user@kasta.ua", USER_PASSWORD="stub-password")
+    if not TestConfig.NON_EXISTENT_USER_EMAIL:
+        overrides["NON_EXISTENT_USER_EMAIL"] = "nobody@example.com"
+    original = {attr: getattr(TestConfig, attr) for attr in overrides}
+    for attr, value in overrides.items():
+        setattr(TestConfig, attr, value)
+    
+    stub.add_user(TestConfig.USER_EMAIL, TestConfig.USER_PASSWORD)
+    # Деактивований користувач з test_login_with_deactivated_user
+    stub.add_user("i.i.kontent+test123@gmail.com", "Qwerty123", code="no-supplier")
+    stub.add_supplier(TestConfig.TEST_SUPPLIER_NAME, TestConfig.TEST_SUPPLIER_ID or None)
+    for feed_id in dict.fromkeys([TestConfig.TEST_EXISTING_FEED_ID, *TestConfig.TEST_FEED_IDS_FOR_LIMIT]):
+        if feed_id:
+            # Окремий URL для кожного фіду: set-feeds робить upsert за URL, тож фід, створений тестом, з ними не злипається
+            separator = "&" if "?" in TestConfig.TEST_XML_FEED_URL else "?"
+            stub.add_feed(f"{TestConfig.TEST_XML_FEED_URL}{separator}stub={feed_id}", feed_id=feed_id)
+    if TestConfig.HUB_STUB_LATENCY_MS or TestConfig.HUB_STUB_FAILURE_RATE:
+        stub.set_faults("", HubFaults(latency_s=TestConfig.HUB_STUB_LATENCY_MS / 1000,
+                                      failure_rate=TestConfig.HUB_STUB_FAILURE_RATE))
+    print(f"\n>>> Локальна заміна HUB: {stub.base_url}")
+    
+    try:
+        yield stub
+    finally:
+        for attr, value in original.items():
+            setattr(TestConfig, attr, value)
+        stub.stop()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def supplier_index(hub_stub):
+    """
+    Індекс постачальників для XMLFeedPage.select_supplier (utils/supplier_index.py).
+    Кеш TEST_SUPPLIER_INDEX (окремо для кожного BASE_URL) дає supplier_id за назвою, TEST_SUPPLIER_ID доповнює
+    його постачальником тестів. Якщо способу перемикання ще немає, перший вибір через меню його перехоплює
+    разом зі списком постачальників, і наступні тести вибирають постачальника одним запитом.
+    """
+    index = SupplierIndex(
+        TestConfig.SUPPLIER_INDEX_PATH, TestConfig.BASE_URL, TestConfig.SUPPLIER_INDEX_TTL_HOURS,
+        list_url=TestConfig.SUPPLIERS_API_URL, switch_url=TestConfig.SUPPLIER_SWITCH_URL
+    )
+    index.add(TestConfig.TEST_SUPPLIER_NAME, TestConfig.TEST_SUPPLIER_ID)
+    set_supplier_index(index)
+    yield index
+    set_supplier_index(SupplierIndex())
+
+
+def _feed_store(hub_stub):
+    """
+    Стан фідів для FeedApiClient: пам'ять локальної заміни HUB або таблиця feed у БД HUB.
+    
+    Args:
+        hub_stub: Значення фікстури hub_stub (None - тести йдуть на стенд)
+        
+    Returns:
+        StubFeedStore або FeedStore (без TEST_DB_HOST/TEST_DB_NAME кожен запит дає FeedApiError)
+    """
+    if hub_stub is not None:
+        return hub_stub.feed_store()
+    if not TestConfig.DB_HOST or not TestConfig.DB_NAME:
+        return FeedStore(None)
+    return FeedStore(DBHelper(
+        host=TestConfig.DB_HOST,
+        port=TestConfig.DB_PORT,
+        database=TestConfig.DB_NAME,
+        user=TestConfig.DB_USER,
+        password=TestConfig.DB_PASSWORD
+    ))
+
+
+@pytest.fixture(scope="function")
+def feed_api(page, test_config, hub_stub):
+    """
+    Клієнт API фідів (utils/feed_api.py) на авторизованому контексті page.
+    Фіди зберігаються через set-feeds з cookies контексту (викликати після логіну),
+    feed_id і стан фідів читаються з БД HUB.
+    """
+    store = _feed_store(hub_stub)
+    yield FeedApiClient(page.request, set_feeds_url=test_config.SET_FEEDS_API_URL, store=store)
+    store.close()
+
+
+@pytest.fixture(scope="function")
+def mapping_api(page, test_config, hub_stub):
+    """
+    Клієнт API Excel мапінгу (utils/mapping_api.py): скачування через gen-mapping-file і завантаження
+    через set-feeds без UI (origin_url фіду - з БД HUB). Cookies авторизованого контексту page копіюються
+    перед кожним запитом, тому клієнт працює після auth_session.open.
+    Після тесту розміри і час передач (передача і обробка на сервері окремо) - у звіті.
+    """
+    store = _feed_store(hub_stub)
+    client = MappingApiClient(test_config.GEN_MAPPING_FILE_API_URL, test_config.SET_FEEDS_API_URL, store=store,
+                              page=page)
+    yield client
+    if client.transfers:
+        print(f"\n>>> Передачі мапінгу:\n{client.summary()}")
+    client.close()
+    store.close()
+
+
+@pytest.fixture(scope="function")
+def feed_factory(feed_api):
+    """
+    Фабрика фідів для arrange-кроків: створює/вмикає фіди через API замість UI.
+    Після тесту вимикає увімкнені та видаляє створені фіди.
+    """
+    factory = FeedFactory(feed_api)
+    yield factory
+    errors = factory.cleanup()
+    if errors:
+        pytest.fail(f"КРИТИЧНА ПОМИЛКА: Cleanup фідів через API не вдався - {'; '.join(errors)}")
+
+
+@pytest.fixture(scope="session")
+def feed_pool(auth_session, test_config, hub_stub):
+    """
+    Пул фідів (utils/feed_pool.py), один на процес pytest.
+    Готується на старті сесії (фікстура feed_pool_provisioning): TEST_FEED_POOL_SIZE фідів постачальника
+    готуються паралельно через set-feeds
+    (фіди пулу з попередніх запусків знаходяться в БД і перевикористовуються). Після сесії фіди лишаються
+    вимкненими для наступного запуску (TEST_FEED_POOL_KEEP=0 - видалити).
+    """
+    store = _feed_store(hub_stub)
+    api = FeedApiClient(
+        RequestsApiContext(auth_session.ensure_state()),
+        set_feeds_url=test_config.SET_FEEDS_API_URL,
+        store=store
+    )
+    try:
+        pool = FeedPool(api, base_url=test_config.TEST_XML_FEED_URL, size=test_config.FEED_POOL_SIZE,
+                        tag=worker_id()).provision()
+        yield pool
+        pool.close(delete=not test_config.FEED_POOL_KEEP)
+    finally:
+        store.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def feed_pool_provisioning(request):
+    """
+    Підготовка пулу фідів до першого тесту, а не під час першої оренди.
+    Пул готується лише якщо серед зібраних тестів є такі, що беруть фіди (pooled_feeds),
+    тому запуск лише тестів логіну не логіниться і не створює фідів.
+    """
+    if not any("pooled_feeds" in getattr(item, "fixturenames", ()) for item in request.session.items):
+        yield None
+        return
+    
+    yield request.getfixturevalue("feed_pool")
+
+
+@pytest.fixture(scope="function")
+def pooled_feeds(feed_pool):
+    """
+    Оренда фідів з пулу: pooled_feeds(n) -> n фідів у базовому стані (вимкнені) або [] якщо пул недоступний.
+    Пул вже підготовлено на старті сесії (feed_pool_provisioning). Після тесту фіди скидаються і повертаються в пул.
+    """
+    leased = []
+    
+    def lease(count: int = 1):
+        feeds = feed_pool.lease(count)
+        leased.extend(feeds)
+        return feeds
+    
+    yield lease
+    if leased:
+        feed_pool.release(leased)
@@ -18,12 +18,23 @@ class XMLFeedLocators:
     SUPPLIERS_SEARCH_INPUT = "[placeholder*='Постачальник']"  # Використовуємо частину тексту через атрибут
     SUPPLIER_OPTION = "text=v4Парфюмс"  # Приклад: динамічний локатор, метод select_supplier використовує пошук по тексту
     
+    # Варіанти локаторів для BasePage.find_locator (utils/locator_registry.py): перевіряються одночасно,
+    # першим - той, що спрацьовував останнім часом. {supplier} / {pattern} - назва постачальника як є / для регулярного виразу
+    SUPPLIERS_SEARCH_INPUT_VARIANTS = ("input[placeholder*='Постачальники' i]", SUPPLIERS_SEARCH_INPUT)
+    SUPPLIER_OPTION_VARIANTS = ("text={supplier}", "text=/{pattern}/i")
+    # Вибраний постачальник у шапці сторінки / меню користувача (перевірка перемикання без меню)
+    SELECTED_SUPPLIER_VARIANTS = (
+        ".ant-layout-header >> text=/{pattern}/i", "header >> text=/{pattern}/i", "nav >> text=/{pattern}/i"
+    )
+    
     # Кнопки
     ADD_NEW_FEED_BUTTON = "role=button[name='Додати новий фід']"
     SAVE_BUTTON = "role=button[name='Зберегти']"
     
     # Поля форми додавання XML-фіду
     FEED_URL_INPUT = "placeholder=https://127.0.0.1:8000/fmt."
+    FEED_URL_INPUT_ANY = "input[placeholder*='fmt']"  # Те саме поле через частину placeholder
+    FEED_URL_INPUT_VARIANTS = ("input[placeholder*='https://127.0.0.1:8000/fmt.' i]", FEED_URL_INPUT_ANY)
     
     # Чекбокси
     # Чекбокс "Завантажити товари з xml" - використовуємо складний локатор через filter
@@ -31,18 +42,32 @@ class XMLFeedLocators:
     
     # Повідомлення про успіх/помилки
     SUCCESS_MESSAGE = "text=Дані збережено!"
+    VALIDATION_ERROR_MESSAGE = "text=/Помилка валідації/i"  # Повідомлення про помилку валідації фіду
     
     # Таблиця XML-фідів
     FEEDS_TABLE = "#root-content"
     FEED_ID_COLUMN = "div:nth-child(3) > .ag-header-cell-comp-wrapper > .ag-cell-label-container > .ag-header-cell-label"
     FEED_LINK_COLUMN_HEADER = "text=Лінк фіду"  # Заголовок стовпця "Лінк фіду"
     LAST_UPLOAD_COLUMN_HEADER = "text=Останнє завантаження"  # Стовпець для сортування найсвіжіших фідів
+    # Заголовок того ж стовпця після сортування (AG Grid ставить aria-sort="ascending"/"descending")
+    LAST_UPLOAD_COLUMN_SORTED = ".ag-header-cell[aria-sort='{direction}']:has-text('Останнє завантаження')"
     FEED_LINK_FILTER_ICON = "div:nth-child(4) > .ag-header-cell-comp-wrapper > .ag-cell-label-container > .ag-header-icon > .ag-icon"  # Іконка фільтра для "Лінк фіду"
     FEED_LINK_FILTER_INPUT = "placeholder=Фільтр"  # Поле фільтра
+    FEEDS_TABLE_ROW = ".ag-row"  # Рядок таблиці AG Grid
+    FEEDS_TABLE_EMPTY = ".ag-overlay-no-rows-wrapper"  # Оверлей порожньої таблиці
     MANAGEMENT_BUTTON = "text=Управління[exact=true]"  # Кнопка "Управління"
     EDIT_BUTTON = "role=button[name=' Редагувати']"  # Кнопка редагування (з пробілом перед текстом!)
+    EDIT_BUTTON_VARIANTS = (EDIT_BUTTON, "button:has-text('Редагувати')")
     
     # Excel мапінг
     DOWNLOAD_EXCEL_MAPPING_BUTTON = "text=Отримати файл для ручного мапінгу"  # Кнопка скачування Excel файлу мапінгу
+    DOWNLOAD_EXCEL_MAPPING_BUTTON_VARIANTS = (
+        DOWNLOAD_EXCEL_MAPPING_BUTTON, "button:has-text('Отримати файл для ручного мапінгу')"
+    )
     UPLOAD_EXCEL_MAPPING_BUTTON = "text=Завантажити ручний мапінг категорій"  # Кнопка завантаження Excel файлу мапінгу
     UPLOAD_EXCEL_INPUT = "input[type='file']"  # Поле для завантаження Excel файлу (може бути приховане)
+    
+    # Запити HUB API (регулярні вирази для URL xhr/fetch-відповіді, див. BasePage.wait_for_api_response)
+    # Збереження фіду і завантаження Excel мапінгу йдуть в один handler set-feeds (з полем file - мапінг);
+    # {set_feeds} - екранований шлях TestConfig.SET_FEEDS_API_URL, метод запиту фільтрує окремо
+    SET_FEEDS_API = r"{set_feeds}/?([?#]|$)"
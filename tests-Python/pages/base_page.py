@@ -2,7 +2,13 @@
 Базовий клас для всіх Page Objects.
 Містить загальні методи для роботи зі сторінками.
 """
-from playwright.sync_api import Page, expect
+import re
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Union
+from playwright.sync_api import Locator, Page, Response, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils.locator_registry import get_registry
+from utils.ui_messages import MessageLog
 
 
 class BasePage:
@@ -16,6 +22,10 @@ class BasePage:
             page: Екземпляр Playwright Page
         """
         self.page = page
+        # Журнал очікувань: що чекали, скільки це тривало і чи дочекались
+        self.wait_timings: List[Dict[str, object]] = []
+        # Журнал alert/toast/помилок валідації, який веде сторінка (спільний для всіх Page Objects сторінки)
+        self.messages = MessageLog.for_page(page)
     
     def goto(self, url: str):
         """Перехід на сторінку"""
@@ -32,3 +42,176 @@ class BasePage:
     def take_screenshot(self, path: str):
         """Зробити скріншот сторінки"""
         self.page.screenshot(path=path)
+    
+    def _record_wait(self, name: str, started: float, ok: bool) -> float:
+        """
+        Записати тривалість очікування в журнал wait_timings
+        
+        Returns:
+            Тривалість очікування в секундах
+        """
+        elapsed = time.perf_counter() - started
+        self.wait_timings.append({"name": name, "seconds": round(elapsed, 3), "ok": ok})
+        status = "✓" if ok else "✗ таймаут"
+        print(f"Очікування '{name}': {elapsed:.2f} с {status}")
+        return elapsed
+    
+    def _any_locator(self, selectors: Sequence[str]) -> Locator:
+        """Локатор, що знаходить елемент за будь-яким із селекторів"""
+        locator = self.page.locator(selectors[0])
+        for selector in selectors[1:]:
+            locator = locator.or_(self.page.locator(selector))
+        return locator
+    
+    def find_locator(self, name: str, variants: Sequence[str], timeout: int = 10000,
+                     state: str = "visible", **params) -> Optional[Locator]:
+        """
+        Знайти елемент за будь-яким з варіантів локатора (utils/locator_registry.py)
+        
+        Варіанти чекаються одночасно, тому промах першого не коштує окремого таймауту;
+        варіант, що спрацював, запам'ятовується і наступного разу перевіряється першим.
+        
+        Args:
+            name: Назва локатора (ключ статистики і журналу очікувань)
+            variants: Селектори-шаблони (див. *_VARIANTS у locators/)
+            timeout: Максимальний час очікування в мс
+            state: "visible" або "attached"
+            params: Значення для шаблонів селекторів
+        
+        Returns:
+            Локатор знайденого елемента або None якщо жоден варіант не з'явився до дедлайну
+        """
+        started = time.perf_counter()
+        locator = get_registry().resolve(self.page, name, variants, timeout=timeout, state=state, **params)
+        self._record_wait(name, started, locator is not None)
+        return locator
+    
+    def wait_for_api_response(self, url_pattern: str, action: Callable[[], None],
+                              methods: Sequence[str] = (), timeout: int = 15000,
+                              or_selectors: Sequence[str] = (), name: Optional[str] = None,
+                              poll_interval: int = 100) -> Optional[Response]:
+        """
+        Виконати дію і дочекатись відповіді HUB API, яку вона викликає
+        
+        Очікування завершується одразу, як тільки прийшла відповідь або став видимим
+        один з or_selectors (наприклад toast з результатом), але не пізніше дедлайну.
+        
+        Args:
+            url_pattern: Регулярний вираз для URL запиту (пошук по підрядку, без урахування регістру)
+            action: Дія, що ініціює запит (клік, goto, set_input_files, ...)
+            methods: HTTP-методи запиту (порожньо - будь-який)
+            timeout: Максимальний час очікування в мс
+            or_selectors: Селектори DOM, поява яких теж завершує очікування
+            name: Назва очікування для журналу (за замовчуванням - url_pattern)
+            poll_interval: Інтервал перевірки умов у мс
+        
+        Returns:
+            Відповідь API або None якщо вона не прийшла (DOM-умова або дедлайн)
+        """
+        regex = re.compile(url_pattern, re.I)
+        allowed = {method.upper() for method in methods}
+        matched: List[Response] = []
+        
+        def on_response(response: Response):
+            # Лише запити застосунку (xhr/fetch), не документи і статика
+            if response.request.resource_type not in ("xhr", "fetch"):
+                return
+            if allowed and response.request.method.upper() not in allowed:
+                return
+            if regex.search(response.url):
+                matched.append(response)
+        
+        dom_condition = self._any_locator(or_selectors) if or_selectors else None
+        
+        started = time.perf_counter()
+        deadline = started + timeout / 1000
+        dom_matched = False
+        self.page.on("response", on_response)
+        try:
+            action()
+            # wait_for_timeout віддає керування Playwright, тому обробник відповідей встигає спрацювати
+            while not matched and time.perf_counter() < deadline:
+                if dom_condition is not None and dom_condition.first.is_visible():
+                    dom_matched = True
+                    break
+                self.page.wait_for_timeout(poll_interval)
+        finally:
+            self.page.remove_listener("response", on_response)
+        
+        if matched:
+            self._record_wait(name or f"{url_pattern} -> {matched[0].status}", started, True)
+            return matched[0]
+        self._record_wait(name or url_pattern, started, dom_matched)
+        return None
+    
+    def wait_for_any_visible(self, selectors: Sequence[str], timeout: int = 10000,
+                             name: Optional[str] = None) -> bool:
+        """
+        Чекати поки стане видимим хоча б один з селекторів (DOM-умова з дедлайном)
+        
+        Args:
+            selectors: Список селекторів Playwright
+            timeout: Максимальний час очікування в мс
+            name: Назва очікування для журналу
+        
+        Returns:
+            True якщо елемент з'явився до дедлайну, False якщо ні
+        """
+        locator = self._any_locator(selectors)
+        started = time.perf_counter()
+        try:
+            locator.first.wait_for(state="visible", timeout=timeout)
+        except PlaywrightTimeoutError:
+            self._record_wait(name or " | ".join(selectors), started, False)
+            return False
+        self._record_wait(name or " | ".join(selectors), started, True)
+        return True
+    
+    def wait_for_body_text(self, text: Union[str, "re.Pattern"], timeout: int = 10000,
+                           name: Optional[str] = None) -> bool:
+        """
+        Чекати появи тексту на сторінці (рядок шукається без урахування регістру)
+        
+        Args:
+            text: Очікуваний текст або регулярний вираз
+            timeout: Максимальний час очікування в мс
+            name: Назва очікування для журналу
+        
+        Returns:
+            True якщо текст з'явився до дедлайну, False якщо ні
+        """
+        pattern = re.compile(re.escape(text), re.I) if isinstance(text, str) else text
+        started = time.perf_counter()
+        try:
+            expect(self.page.locator("body")).to_contain_text(pattern, timeout=timeout)
+        except AssertionError:
+            self._record_wait(name or f"текст '{pattern.pattern}'", started, False)
+            return False
+        self._record_wait(name or f"текст '{pattern.pattern}'", started, True)
+        return True
+    
+    def wait_for_url_change(self, previous_url: str, timeout: int = 10000,
+                            name: Optional[str] = None) -> bool:
+        """
+        Чекати зміни URL сторінки (редирект після дії)
+        
+        Args:
+            previous_url: URL до дії
+            timeout: Максимальний час очікування в мс
+            name: Назва очікування для журналу
+        
+        Returns:
+            True якщо URL змінився до дедлайну, False якщо ні
+        """
+        started = time.perf_counter()
+        try:
+            self.page.wait_for_url(lambda url: url != previous_url, timeout=timeout)
+        except PlaywrightTimeoutError:
+            self._record_wait(name or "зміна URL", started, False)
+            return False
+        self._record_wait(name or "зміна URL", started, True)
+        return True
+    
+    def get_total_wait_seconds(self) -> float:
+        """Сумарний час усіх записаних очікувань у секундах"""
+        return round(sum(float(timing["seconds"]) for timing in self.wait_timings), 3)
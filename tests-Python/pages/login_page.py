@@ -2,11 +2,17 @@
 Page Object для сторінки логіну.
 Містить методи для роботи зі сторінкою логіну.
 """
+import re
 from playwright.sync_api import Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pages.base_page import BasePage
 from locators.login_locators import LoginLocators
 
 
+# Текст помилки обов'язкового поля (з різними апострофами або без)
+REQUIRED_FIELD_RE = re.compile(r"обов['’ʼ]?язкове поле", re.I)
+
+
 class LoginPage(BasePage):
     """Page Object для сторінки логіну"""
     
@@ -56,11 +62,12 @@ class LoginPage(BasePage):
             login_button.click()
     
     def click_login_button_without_navigation(self):
-        """Натиснути кнопку входу без очікування навігації (для негативних тестів)"""
+        """
+        Натиснути кнопку входу без очікування навігації (для негативних тестів).
+        Реакцію форми чекає викликач: wait_for_login_feedback або журнал повідомлень (self.messages)
+        """
         login_button = self.page.locator(self.locators.LOGIN_BUTTON)
         login_button.click()
-        # Чекаємо трохи для появи повідомлення про помилку
-        self.page.wait_for_timeout(1000)
     
     def login(self, email: str, password: str):
         """
@@ -110,6 +117,26 @@ class LoginPage(BasePage):
         assert "/user/login" in current_url, \
             f"Очікувалось залишитись на сторінці логіну, але перейшли на: {current_url}"
     
+    def wait_for_login_feedback(self, timeout: int = 10000, url_part: str = None) -> bool:
+        """
+        Дочекатися реакції форми на спробу логіну (alert, помилка під полем або toast)
+        замість фіксованої паузи
+        
+        Args:
+            timeout: Максимальний час очікування (мс)
+            url_part: Спершу дочекатися переадресації на URL з цим фрагментом (напр. "supplier-reg=true")
+        
+        Returns:
+            True якщо реакція з'явилась, False якщо ні за timeout
+        """
+        if url_part:
+            try:
+                self.page.wait_for_url(lambda url: url_part in url, timeout=timeout)
+            except PlaywrightTimeoutError:
+                return False
+        # Журнал повідомлень: спрацьовує і на toast, що вже зник
+        return self.messages.wait_for_next(timeout=timeout) is not None
+    
     def is_error_message_visible(self) -> bool:
         """
         Перевірити чи видиме повідомлення про помилку (alert)
@@ -165,6 +192,13 @@ class LoginPage(BasePage):
         except:
             return False
     
+    def _find_field_validation_error(self, timeout: int = 2000):
+        """Запис журналу про видиму помилку валідації під полем (клас Ant Design або текст "Обов'язкове поле")"""
+        entry = self.messages.wait_for(kinds=("validation",), timeout=timeout, visible_only=True)
+        if entry is None:
+            entry = self.messages.find(REQUIRED_FIELD_RE, visible_only=True)
+        return entry
+    
     def is_field_validation_error_visible(self) -> bool:
         """
         Перевірити чи видима помилка валідації під полями (Обов'язкове поле)
@@ -172,31 +206,7 @@ class LoginPage(BasePage):
         Returns:
             True якщо помилка валідації видима
         """
-        try:
-            # Спробуємо знайти через клас Ant Design
-            validation_error = self.page.locator(self.locators.FIELD_VALIDATION_ERROR)
-            if validation_error.is_visible(timeout=2000):
-                return True
-        except:
-            pass
-        
-        # Якщо не знайдено через клас, спробуємо через текст
-        try:
-            text_locator = self.page.locator("text=Обов'язкове поле")
-            if text_locator.is_visible(timeout=2000):
-                return True
-        except:
-            pass
-        
-        # Також спробуємо альтернативний варіант тексту
-        try:
-            text_locator = self.page.locator("text=Обовязкове поле")
-            if text_locator.is_visible(timeout=2000):
-                return True
-        except:
-            pass
-        
-        return False
+        return self._find_field_validation_error() is not None
     
     def get_field_validation_error_text(self) -> str:
         """
@@ -205,85 +215,5 @@ class LoginPage(BasePage):
         Returns:
             Текст помилки валідації
         """
-        # Спочатку спробуємо через клас
-        try:
-            validation_error = self.page.locator(self.locators.FIELD_VALIDATION_ERROR)
-            if validation_error.is_visible(timeout=2000):
-                return validation_error.text_content() or ""
-        except:
-            pass
-        
-        # Якщо не знайдено, спробуємо через текстовий локатор
-        try:
-            text_locator = self.page.locator("text=Обов'язкове поле")
-            if text_locator.is_visible(timeout=2000):
-                return text_locator.text_content() or ""
-        except:
-            pass
-        
-        # Альтернативний варіант
-        try:
-            text_locator = self.page.locator("text=Обовязкове поле")
-            if text_locator.is_visible(timeout=2000):
-                return text_locator.text_content() or ""
-        except:
-            pass
-        
-        return ""
-    
-    def verify_error_messages(self, expected_texts: list):
-        """
-        Перевірити що повідомлення про помилку містить всі очікувані тексти
-        
-        Args:
-            expected_texts: Список очікуваних текстів в повідомленні про помилку
-        """
-        # Чекаємо трохи більше для появи повідомлення
-        self.page.wait_for_timeout(2000)
-        
-        # Спробуємо знайти через різні локатори (notification, alert, error message)
-        found_texts = []
-        page_text = self.page.locator("body").text_content().lower()
-        
-        # Також перевіряємо через різні можливі селектори
-        possible_selectors = [
-            ".ant-message",
-            ".ant-notification",
-            ".error-message",
-            ".alert",
-            "[role='alert']",
-            ".notification",
-            ".toast"
-        ]
-        
-        for selector in possible_selectors:
-            try:
-                element = self.page.locator(selector)
-                if element.count() > 0:
-                    element_text = element.text_content().lower()
-                    page_text += " " + element_text
-            except:
-                pass
-        
-        # Перевіряємо наявність очікуваних текстів
-        for expected_text in expected_texts:
-            if expected_text.lower() in page_text:
-                found_texts.append(expected_text)
-            else:
-                # Спробуємо знайти через текстовий локатор
-                try:
-                    text_locator = self.page.locator(f"text={expected_text}")
-                    if text_locator.count() > 0:
-                        found_texts.append(expected_text)
-                except:
-                    pass
-        
-        # Перевірка що всі тексти знайдені
-        missing_texts = [text for text in expected_texts if text not in found_texts]
-        if missing_texts:
-            # Виводимо більше інформації для дебагу
-            visible_text = self.page.locator("body").text_content()[:500]
-            assert False, \
-                f"Не знайдено очікувані тексти: {missing_texts}. " \
-                f"Знайдено: {found_texts}. " \
-                f"Видимий текст на сторінці: {visible_text}"
+        entry = self._find_field_validation_error()
+        return entry["text"] if entry else ""
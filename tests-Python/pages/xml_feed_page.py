@@ -3,23 +3,134 @@ Page Object для сторінки XML-фідів.
 Містить методи для роботи зі сторінкою завантаження та валідації XML-фідів.
 """
 import re
-from playwright.sync_api import Page, expect
+import time
+import weakref
+from typing import Callable, List, Optional
+from urllib.parse import urlsplit
+from playwright.sync_api import Page, Request, Response, expect
 from pages.base_page import BasePage
+from config.settings import TestConfig
 from locators.xml_feed_locators import XMLFeedLocators
+from utils.ag_grid import GridRow, GridSnapshot, collect_grid, read_grid, scroll_grid_to_row
+from utils.feed_list_model import FeedListModel
+from utils.supplier_index import SUPPLIER_API_RE, get_supplier_index
+from utils.worker_resources import artifact_name
+
+
+# feed_id у таблиці: літера + 2-9 літер/цифр (наприклад R3DV)
+FEED_ID_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9]{2,9}$")
+
+
+class _FeedsPageState:
+    """
+    Стан сторінки фідів, спільний для всіх XMLFeedPage однієї сторінки Playwright: кеш таблиці і
+    перехоплені JSON-відповіді сторінки фідів. Маршрут API списку фідів HUB не задокументований, тому
+    список розпізнається за формою відповіді (FeedListModel.from_payload), а не за URL.
+    Слухачі сторінки реєструються один раз на сторінку.
+    """
+    
+    _states: "weakref.WeakKeyDictionary[Page, _FeedsPageState]" = weakref.WeakKeyDictionary()
+    
+    def __init__(self, page: Page, feeds_path: str):
+        """
+        Args:
+            page: Сторінка Playwright
+            feeds_path: Шлях сторінки XML-фідів (відповіді інших сторінок не запам'ятовуються)
+        """
+        self.page = page
+        self.feeds_path = feeds_path
+        # Повний список рядків таблиці фідів (collect_feeds_table) - діє до наступної навігації
+        self.table_cache: Optional[GridSnapshot] = None
+        # JSON-відповіді сторінки фідів після останньої навігації (розбираються ліниво)
+        self.list_responses: List[Response] = []
+        self.json_responses = 0
+        self.list_model: Optional[FeedListModel] = None
+        self.empty_logged = False
+    
+    @classmethod
+    def for_page(cls, page: Page) -> "_FeedsPageState":
+        """Стан сторінки: слухачі реєструються при першому виклику, далі повертається той самий стан"""
+        state = cls._states.get(page)
+        if state is None:
+            state = cls(page, urlsplit(TestConfig.XML_FEEDS_URL).path.rstrip("/"))
+            page.on("framenavigated", state._on_frame_navigated)
+            page.on("response", state._on_response)
+            cls._states[page] = state
+        return state
+    
+    def _on_frame_navigated(self, frame):
+        """Скинути кеш таблиці і модель списку фідів при навігації головного фрейму"""
+        if frame == self.page.main_frame:
+            self.table_cache = None
+            self.list_responses.clear()
+            self.json_responses = 0
+            self.list_model = None
+            self.empty_logged = False
+    
+    def _on_response(self, response: Response):
+        """Запам'ятати JSON-відповідь xhr/fetch на сторінці фідів (кандидат у список фідів)"""
+        request = response.request
+        if request.resource_type not in ("xhr", "fetch") or request.method != "GET":
+            return
+        if urlsplit(self.page.url).path.rstrip("/") != self.feeds_path:
+            return
+        if "json" in (response.headers.get("content-type") or ""):
+            self.list_responses.append(response)
+            self.json_responses += 1
 
 
 class XMLFeedPage(BasePage):
     """Page Object для сторінки XML-фідів"""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, set_feeds_url: Optional[str] = None):
         """
         Ініціалізація сторінки XML-фідів
         
         Args:
             page: Екземпляр Playwright Page
+            set_feeds_url: URL handler-а set-feeds, з шляху якого будується шаблон запитів збереження фіду
+                і завантаження мапінгу (за замовчуванням - TestConfig.SET_FEEDS_API_URL)
         """
         super().__init__(page)
         self.locators = XMLFeedLocators()
+        set_feeds_path = urlsplit(set_feeds_url or TestConfig.SET_FEEDS_API_URL).path.rstrip("/")
+        self._set_feeds_api_pattern = self.locators.SET_FEEDS_API.format(set_feeds=re.escape(set_feeds_path))
+        # Кеш таблиці і відповіді сторінки фідів - спільні для всіх Page Objects цієї сторінки
+        self._state = _FeedsPageState.for_page(page)
+    
+    def get_feed_list_model(self, timeout: int = 0) -> Optional[FeedListModel]:
+        """
+        Модель списку фідів з перехопленої відповіді HUB API: найсвіжіша JSON-відповідь сторінки фідів,
+        яку FeedListModel.from_payload розбирає як список фідів
+        
+        Args:
+            timeout: Скільки чекати відповідь, якщо її ще немає (мс)
+        
+        Returns:
+            FeedListModel або None якщо жодна відповідь не схожа на список фідів
+        """
+        deadline = time.perf_counter() + timeout / 1000
+        while True:
+            while self._state.list_responses:
+                response = self._state.list_responses.pop()
+                try:
+                    model = FeedListModel.from_payload(response.json())
+                except Exception:
+                    continue
+                if model is not None:
+                    self._state.list_model = model
+                    # Старіші відповіді вже неактуальні
+                    self._state.list_responses.clear()
+            if self._state.list_model is not None:
+                return self._state.list_model
+            if time.perf_counter() >= deadline:
+                if not self._state.empty_logged:
+                    # Формат відповіді HUB змінився або список ще не завантажено - пошук піде таблицею
+                    print(f">>> Список фідів не розпізнано серед {self._state.json_responses} JSON-відповідей "
+                          f"сторінки фідів, feed_id шукаються в таблиці")
+                    self._state.empty_logged = True
+                return None
+            self.page.wait_for_timeout(100)
     
     def navigate_to_xml_feeds(self, xml_feeds_url: str):
         """
@@ -38,11 +149,9 @@ class XMLFeedPage(BasePage):
         """
         # Клік на меню "Товари"
         self.page.locator(self.locators.PRODUCTS_MENU).click()
-        self.page.wait_for_timeout(500)
         
         # Клік на "Імпорт новинок"
         self.page.locator(self.locators.IMPORT_NEW_ITEMS_LINK).click()
-        self.page.wait_for_timeout(500)
         
         # Клік на вкладку "XML"
         self.page.locator(self.locators.XML_TAB_LINK).click()
@@ -53,10 +162,14 @@ class XMLFeedPage(BasePage):
         Відкрити фід для редагування, клікнувши кнопку "Редагувати" в рядку таблиці.
         Потрібно бути на сторінці з таблицею фідів.
         """
-        self.page.wait_for_timeout(3000)
-        row = self.page.get_by_role("row").filter(has_text=feed_id).first
-        row.wait_for(state="visible", timeout=10000)
-        edit_btn = row.get_by_role("button", name=re.compile(r"Редагувати", re.I))
+        row = self.find_feed_row(lambda r: feed_id in r.values, timeout=10000)
+        if row is None:
+            raise AssertionError(f"Фід '{feed_id}' не знайдено в таблиці фідів. Поточний URL: {self.get_url()}")
+        # Рядок може бути за межами видимої області віртуалізованого гріда
+        scroll_grid_to_row(self.page, row.row_index)
+        # Закріплені колонки рендеряться окремими .ag-row з тим самим row-index
+        row_locator = self.page.locator(f".ag-row[row-index='{row.row_index}']")
+        edit_btn = row_locator.get_by_role("button", name=re.compile(r"Редагувати", re.I)).first
         edit_btn.click()
         self.wait_for_load_state("networkidle")
     
@@ -69,9 +182,12 @@ class XMLFeedPage(BasePage):
         header = self.page.locator(self.locators.LAST_UPLOAD_COLUMN_HEADER).first
         header.wait_for(state="visible", timeout=5000)
         header.click()
-        self.page.wait_for_timeout(1500)
+        self.wait_for_any_visible((self.locators.LAST_UPLOAD_COLUMN_SORTED.format(direction="ascending"),),
+                                  timeout=5000, name="сортування за зростанням")
         header.click()  # Другий клік — descending (найсвіжіші зверху)
-        self.page.wait_for_timeout(2000)
+        self.wait_for_any_visible((self.locators.LAST_UPLOAD_COLUMN_SORTED.format(direction="descending"),),
+                                  timeout=5000, name="сортування за спаданням")
+        self.invalidate_feeds_table_cache()
     
     def get_first_n_feed_ids(self, n: int = 4) -> list:
         """
@@ -83,110 +199,202 @@ class XMLFeedPage(BasePage):
         Returns:
             Список feed_id (наприклад ['R3DV', 'R2K3', ...])
         """
-        self.page.wait_for_selector(".ag-row", timeout=10000)
-        rows = self.page.locator(".ag-row").all()
         feed_ids = []
-        for i, row in enumerate(rows):
-            if i >= n:
-                break
-            try:
-                cells = row.locator(".ag-cell").all()
-                feed_id = None
-                for cell in cells[:4]:  # Перевіряємо перші 4 комірки
-                    text = (cell.text_content() or "").strip()
-                    if text and re.match(r"^[A-Za-z][A-Za-z0-9]{2,9}$", text) and text not in feed_ids:
-                        feed_id = text
-                        break
-                if feed_id:
-                    feed_ids.append(feed_id)
-            except Exception:
-                continue
+        for row in self.read_feeds_table().rows[:n]:
+            # Перевіряємо перші 4 комірки
+            for text in row.values[:4]:
+                if FEED_ID_PATTERN.match(text) and text not in feed_ids:
+                    feed_ids.append(text)
+                    break
         return feed_ids
     
+    def read_feeds_table(self, timeout: int = 10000) -> GridSnapshot:
+        """
+        Прочитати відрендерену таблицю фідів одним запитом у браузер
+        (рядки зі словником col-id -> текст і посиланнями, без IPC на кожну комірку)
+        
+        Args:
+            timeout: Скільки чекати появи першого рядка в мс
+        
+        Returns:
+            GridSnapshot з рядками таблиці
+        """
+        self.page.wait_for_selector(self.locators.FEEDS_TABLE_ROW, timeout=timeout)
+        return read_grid(self.page)
+    
+    def collect_feeds_table(self, timeout: int = 10000, use_cache: bool = True) -> GridSnapshot:
+        """
+        Зібрати всі рядки таблиці фідів, включно з тими, що AG Grid не рендерить поза viewport.
+        Результат кешується до наступної навігації (або invalidate_feeds_table_cache).
+        
+        Args:
+            timeout: Скільки чекати появи першого рядка в мс
+            use_cache: Повернути закешований список, якщо він є
+        
+        Returns:
+            GridSnapshot з усіма рядками таблиці
+        """
+        if use_cache and self._state.table_cache is not None:
+            return self._state.table_cache
+        self.page.wait_for_selector(self.locators.FEEDS_TABLE_ROW, timeout=timeout)
+        started = time.perf_counter()
+        snapshot = collect_grid(self.page)
+        self._record_wait(f"збір таблиці фідів ({len(snapshot)} рядків)", started, True)
+        self._state.table_cache = snapshot
+        return snapshot
+    
+    def invalidate_feeds_table_cache(self):
+        """Скинути кеш таблиці фідів (після сортування, фільтрації, збереження)"""
+        self._state.table_cache = None
+    
+    def find_feed_row(self, predicate: Callable[[GridRow], bool], timeout: int = 5000,
+                      poll_interval: int = 200) -> Optional[GridRow]:
+        """
+        Знайти рядок таблиці фідів, що задовольняє умову (таблицю перечитуємо до дедлайну,
+        бо після сортування/фільтрації грід перемальовується не одразу)
+        
+        Args:
+            predicate: Умова для рядка
+            timeout: Максимальний час очікування в мс
+            poll_interval: Інтервал між читаннями таблиці в мс
+        
+        Returns:
+            Знайдений рядок або None
+        """
+        deadline = time.perf_counter() + timeout / 1000
+        while True:
+            for row in self.collect_feeds_table(timeout=timeout):
+                if predicate(row):
+                    return row
+            if time.perf_counter() >= deadline:
+                return None
+            self.invalidate_feeds_table_cache()
+            self.page.wait_for_timeout(poll_interval)
+    
+    @staticmethod
+    def _feed_id_from_hrefs(row: GridRow) -> str:
+        """feed_id з посилання рядка виду ...?feed_id=XXX (або порожній рядок)"""
+        for href in row.hrefs:
+            match = re.search(r'feed_id=([^&]+)', href)
+            if match:
+                return match.group(1).replace("%20", " ").strip()
+        return ""
+    
     def get_feeds_table_row_count(self) -> int:
         """
-        Отримати кількість рядків у таблиці фідів.
+        Отримати кількість рядків у таблиці фідів (усіх, не лише відрендерених).
         Потрібно бути на сторінці з таблицею фідів.
         """
-        self.page.wait_for_selector(".ag-row", timeout=10000)
-        return self.page.locator(".ag-row").count()
+        return len(self.collect_feeds_table())
     
     def select_supplier(self, supplier_name: str):
         """
-        Вибір постачальника зі списку
+        Вибір постачальника
+        
+        Спершу напряму (utils/supplier_index.py): supplier_id з кешованого індексу і запит або URL перемикання,
+        після чого сторінка має показати вибраного постачальника. Якщо індекс ще не знає постачальника
+        чи способу перемикання, або постачальник після перемикання не відображається - через меню користувача,
+        з якого індекс запам'ятовує список постачальників і запит перемикання для наступних тестів.
         
         Args:
             supplier_name: Назва постачальника (наприклад, "Парфюмс")
         """
-        # Клік на меню користувача (може бути динамічним)
-        try:
-            user_menu = self.page.locator(self.locators.USER_MENU)
-            if user_menu.is_visible(timeout=2000):
-                user_menu.click()
-                self.page.wait_for_timeout(500)
-        except:
-            # Якщо меню користувача не знайдено, спробуємо знайти інший спосіб
-            # Можливо, меню вже відкрите або постачальник вже вибрано
-            pass
+        if get_supplier_index().switch_to(self.page, supplier_name,
+                                          verify=lambda: self.is_supplier_selected(supplier_name)):
+            return
+        self.select_supplier_via_ui(supplier_name)
+    
+    def is_supplier_selected(self, supplier_name: str, timeout: int = 5000) -> bool:
+        """
+        Чи показує сторінка вибраного постачальника (шапка / меню користувача)
         
-        # Клік на "Всі" для відкриття списку постачальників
-        try:
-            all_suppliers = self.page.locator(self.locators.ALL_SUPPLIERS_OPTION)
-            if all_suppliers.is_visible(timeout=2000):
-                all_suppliers.click()
-                self.page.wait_for_timeout(500)
-        except:
-            # Якщо "Всі" не знайдено, можливо список вже відкритий
-            pass
+        Args:
+            supplier_name: Назва постачальника
+            timeout: Скільки чекати появи назви в мс
+        """
+        return self.find_locator(
+            "вибраний постачальник", self.locators.SELECTED_SUPPLIER_VARIANTS, timeout=timeout,
+            pattern=re.escape(supplier_name)
+        ) is not None
+    
+    def select_supplier_via_ui(self, supplier_name: str):
+        """
+        Вибір постачальника зі списку в меню користувача
         
-        # Введення назви постачальника в поле пошуку
-        # Використовуємо get_by_placeholder для надійності
-        try:
-            search_input = self.page.get_by_placeholder("Постачальники")
-            search_input.click()
-            search_input.fill(supplier_name)
-        except:
-            # Альтернативний спосіб через локатор
-            search_input = self.page.locator(self.locators.SUPPLIERS_SEARCH_INPUT)
-            search_input.click()
-            search_input.fill(supplier_name)
-        self.page.wait_for_timeout(1000)
+        Args:
+            supplier_name: Назва постачальника (наприклад, "Парфюмс")
+        """
+        # Відповіді API постачальників (список для індексу) і запити сторінки (з кліку - перемикання)
+        supplier_responses: List[Response] = []
+        page_requests: List[Request] = []
         
-        # Вибір постачальника зі списку (шукаємо по тексту, що містить назву)
-        # Спробуємо кілька варіантів локаторів
-        supplier_found = False
+        def on_response(response: Response):
+            if response.request.resource_type in ("xhr", "fetch") and SUPPLIER_API_RE.search(response.url) \
+                    and "json" in (response.headers.get("content-type") or ""):
+                supplier_responses.append(response)
+        
+        def on_request(request: Request):
+            if request.resource_type in ("xhr", "fetch", "document"):
+                page_requests.append(request)
+        
+        self.page.on("response", on_response)
+        self.page.on("request", on_request)
         try:
-            # Варіант 1: Точний текст
-            supplier_option = self.page.locator(f"text={supplier_name}").first
-            if supplier_option.is_visible(timeout=2000):
-                supplier_option.click()
-                supplier_found = True
-        except:
-            pass
+            # Клік на меню користувача (може бути динамічним)
+            try:
+                user_menu = self.page.locator(self.locators.USER_MENU)
+                if user_menu.is_visible(timeout=2000):
+                    user_menu.click()
+                    self.page.wait_for_timeout(500)
+            except:
+                # Якщо меню користувача не знайдено, спробуємо знайти інший спосіб
+                # Можливо, меню вже відкрите або постачальник вже вибрано
+                pass
         
-        if not supplier_found:
+            # Клік на "Всі" для відкриття списку постачальників
             try:
-                # Варіант 2: Текст з префіксом (як в коді: "v4Парфюмс")
-                supplier_option = self.page.locator(f"text=/.*{supplier_name}.*/i").first
-                if supplier_option.is_visible(timeout=2000):
-                    supplier_option.click()
-                    supplier_found = True
+                all_suppliers = self.page.locator(self.locators.ALL_SUPPLIERS_OPTION)
+                if all_suppliers.is_visible(timeout=2000):
+                    all_suppliers.click()
+                    self.page.wait_for_timeout(500)
             except:
+                # Якщо "Всі" не знайдено, можливо список вже відкритий
                 pass
         
-        if not supplier_found:
-            # Варіант 3: Будь-який елемент що містить назву
-            supplier_option = self.page.locator(f"text=/.*{supplier_name}.*/i").first
-            supplier_option.click()
+            # Введення назви постачальника в поле пошуку (варіанти placeholder чекаються одночасно)
+            search_input = self.find_locator("поле пошуку постачальника", self.locators.SUPPLIERS_SEARCH_INPUT_VARIANTS)
+            if search_input is None:
+                search_input = self.page.locator(self.locators.SUPPLIERS_SEARCH_INPUT)
+            search_input.click()
+            search_input.fill(supplier_name)
         
-        self.wait_for_load_state("networkidle")
+            # Вибір постачальника зі списку: точний текст або текст з префіксом (як в коді: "v4Парфюмс")
+            supplier_option = self.find_locator(
+                "постачальник у списку", self.locators.SUPPLIER_OPTION_VARIANTS, timeout=5000,
+                supplier=supplier_name, pattern=re.escape(supplier_name)
+            )
+            if supplier_option is None:
+                # Будь-який елемент що містить назву (click сам чекає і впаде з таймаутом, якщо його немає)
+                supplier_option = self.page.locator(f"text=/{re.escape(supplier_name)}/i").first
+            first_switch_request = len(page_requests)
+            supplier_option.click()
+            self.wait_for_load_state("networkidle")
+        finally:
+            self.page.remove_listener("request", on_request)
+            self.page.remove_listener("response", on_response)
+        get_supplier_index().learn(supplier_name, supplier_responses, page_requests[first_switch_request:])
     
     def click_add_new_feed_button(self):
         """Натиснути кнопку 'Додати новий фід'"""
         # Використовуємо get_by_role з exact для точної відповідності
         add_button = self.page.get_by_role("button", name="Додати новий фід", exact=True)
         add_button.click()
-        self.page.wait_for_timeout(1000)
+        self.wait_for_any_visible((self.locators.FEED_URL_INPUT_ANY,), timeout=10000, name="форма нового фіду")
+    
+    def _feed_url_input(self):
+        """Поле URL фіду (варіанти локатора чекаються одночасно); якщо не з'явилось - локатор для помилки Playwright"""
+        url_input = self.find_locator("поле URL фіду", self.locators.FEED_URL_INPUT_VARIANTS)
+        return url_input if url_input is not None else self.page.locator(self.locators.FEED_URL_INPUT_ANY)
     
     def fill_feed_url(self, url: str):
         """
@@ -195,27 +403,15 @@ class XMLFeedPage(BasePage):
         Args:
             url: URL XML-фіду
         """
-        # Використовуємо get_by_placeholder для надійності
-        try:
-            url_input = self.page.get_by_placeholder("https://127.0.0.1:8000/fmt.")
-            url_input.click()
-            url_input.fill(url)
-        except:
-            # Альтернативний спосіб через локатор з частиною тексту
-            url_input = self.page.locator("input[placeholder*='fmt']")
-            url_input.click()
-            url_input.fill(url)
+        url_input = self._feed_url_input()
+        url_input.click()
+        url_input.fill(url)
     
     def clear_feed_url(self):
         """Очистити поле URL XML-фіду (залишити порожнім)"""
-        try:
-            url_input = self.page.get_by_placeholder("https://127.0.0.1:8000/fmt.")
-            url_input.click()
-            url_input.fill("")
-        except:
-            url_input = self.page.locator("input[placeholder*='fmt']")
-            url_input.click()
-            url_input.fill("")
+        url_input = self._feed_url_input()
+        url_input.click()
+        url_input.fill("")
     
     def enable_upload_items_checkbox(self):
         """Увімкнути чекбокс 'Завантажити товари з xml'"""
@@ -253,61 +449,49 @@ class XMLFeedPage(BasePage):
         except Exception:
             return False
     
-    def click_save_button(self):
-        """Натиснути кнопку 'Зберегти' та очікувати навігацію"""
+    def click_save_button(self, timeout: int = 15000):
+        """
+        Натиснути кнопку 'Зберегти' та дочекатись відповіді API збереження
+        (або появи повідомлення про успіх/помилку - що станеться раніше)
+        
+        Args:
+            timeout: Максимальний час очікування в мс
+        """
         save_button = self.page.locator(self.locators.SAVE_BUTTON)
-        save_button.click()
-        # Чекаємо на появу повідомлення про успіх або редирект
-        self.page.wait_for_timeout(5000)
+        self.invalidate_feeds_table_cache()
+        self.wait_for_api_response(
+            self._set_feeds_api_pattern, save_button.click,
+            methods=("POST",), timeout=timeout,
+            or_selectors=(self.locators.SUCCESS_MESSAGE, self.locators.VALIDATION_ERROR_MESSAGE),
+            name="збереження фіду"
+        )
     
-    def verify_success_message(self, expected_text: str = "Дані збережено!"):
+    def verify_success_message(self, expected_text: str = "Дані збережено!", timeout: int = 20000):
         """
         Перевірити повідомлення про успішне збереження
         
         Args:
             expected_text: Очікуваний текст повідомлення
+            timeout: Максимальний час очікування повідомлення в мс
         """
-        # Чекаємо більше часу на появу повідомлення (може з'явитися після редиректу)
-        self.page.wait_for_timeout(10000)
-        
-        # Спробуємо кілька варіантів локаторів для повідомлення
-        success_found = False
-        
-        # Варіант 1: Точний текст
-        try:
-            success_message = self.page.locator(f"text={expected_text}")
-            if success_message.is_visible(timeout=10000):
-                expect(success_message).to_be_visible()
-                success_found = True
-                print(f"✓ Знайдено повідомлення про успіх: '{expected_text}'")
-        except:
-            pass
+        # Варіант 1: журнал повідомлень сторінки - toast міг з'явитися і зникнути ще до перевірки.
+        # Беремо лише новий запис, щоб повторна перевірка після наступного збереження не спрацювала на старому
+        partial_text = "збережено" if "збережено" in expected_text.lower() else expected_text[:5]
+        success_found = self.messages.wait_for_next(partial_text, timeout=0) is not None
         
-        # Варіант 2: Через локатор з класу
+        # Варіанти 2-4: точний текст, локатор з класу, частина тексту - чекаємо будь-який
+        # (повідомлення може з'явитися після редиректу, тому чекаємо з дедлайном, а не фіксовано)
         if not success_found:
-            try:
-                success_message = self.page.locator(self.locators.SUCCESS_MESSAGE)
-                if success_message.is_visible(timeout=10000):
-                    expect(success_message).to_be_visible()
-                    success_found = True
-                    print(f"✓ Знайдено повідомлення про успіх через локатор")
-            except:
-                pass
-        
-        # Варіант 3: Шукаємо будь-яке повідомлення що містить частину тексту
-        if not success_found:
-            try:
-                # Шукаємо по частині тексту
-                partial_text = "збережено" if "збережено" in expected_text.lower() else expected_text[:5]
-                success_message = self.page.locator(f"text=/{partial_text}/i")
-                if success_message.is_visible(timeout=10000):
-                    expect(success_message).to_be_visible()
-                    success_found = True
-                    print(f"✓ Знайдено повідомлення про успіх з текстом '{partial_text}'")
-            except:
-                pass
+            success_found = self.wait_for_any_visible(
+                (f"text={expected_text}", self.locators.SUCCESS_MESSAGE, f"text=/{re.escape(partial_text)}/i"),
+                timeout=timeout, name="повідомлення про успіх"
+            )
+            # Toast міг з'явитися і зникнути між опитуваннями локатора
+            success_found = self.messages.wait_for_next(partial_text, timeout=0) is not None or success_found
+        if success_found:
+            print(f"✓ Знайдено повідомлення про успіх: '{expected_text}'")
         
-        # Варіант 4: Перевіряємо чи є редирект на сторінку зі списком фідів (ознака успіху)
+        # Варіант 5: Перевіряємо чи є редирект на сторінку зі списком фідів (ознака успіху)
         if not success_found:
             current_url = self.get_url()
             if "/supplier-content/xml" in current_url and "feed_id" not in current_url:
@@ -343,9 +527,8 @@ class XMLFeedPage(BasePage):
             contains_text: Частина тексту помилки (наприклад "Помилка валідації xml структури фіду")
             timeout: Таймаут очікування в мс
         """
-        self.page.wait_for_timeout(3000)
-        page_content = self.page.locator("body").text_content() or ""
-        if contains_text.lower() not in page_content.lower():
+        if not self.wait_for_body_text(contains_text, timeout=timeout):
+            page_content = self.page.locator("body").text_content() or ""
             raise AssertionError(
                 f"Повідомлення про помилку з текстом '{contains_text}' не знайдено на сторінці. "
                 f"Поточний URL: {self.get_url()}. "
@@ -353,6 +536,24 @@ class XMLFeedPage(BasePage):
             )
         print(f"Знайдено повідомлення про помилку валідації з текстом: '{contains_text}'")
     
+    def wait_for_validation_error_message(self, contains_text: str, timeout: int = 90000) -> float:
+        """
+        Чекати появи повідомлення про помилку валідації (опитування сторінки замість фіксованої паузи).
+        
+        Args:
+            contains_text: Частина тексту помилки (без урахування регістру)
+            timeout: Максимальний час очікування в мс
+        
+        Returns:
+            Скільки секунд минуло до появи повідомлення
+        """
+        if not self.wait_for_body_text(contains_text, timeout=timeout):
+            raise AssertionError(
+                f"Повідомлення '{contains_text}' не з'явилось за {timeout / 1000:.0f} с. "
+                f"Поточний URL: {self.get_url()}"
+            )
+        return float(self.wait_timings[-1]["seconds"])
+    
     def verify_redirect_to_feeds_list(self, expected_url: str):
         """
         Перевірити редирект на сторінку зі списком фідів
@@ -370,9 +571,10 @@ class XMLFeedPage(BasePage):
             feeds_url: URL сторінки зі списком фідів
         """
         self.goto(feeds_url)
-        self.wait_for_load_state("networkidle")
-        # Чекаємо поки таблиця завантажиться
-        self.page.wait_for_timeout(2000)
+        # Таблиця рендериться з відповіді API списку фідів: коли є рядки (або оверлей порожньої таблиці),
+        # відповідь вже перехоплена і get_feed_list_model її розбере
+        table_ready = (self.locators.FEEDS_TABLE_ROW, self.locators.FEEDS_TABLE_EMPTY)
+        self.wait_for_any_visible(table_ready, timeout=15000, name="таблиця фідів")
     
     def get_feed_url_from_input(self) -> str:
         """
@@ -382,22 +584,12 @@ class XMLFeedPage(BasePage):
             URL фіду з поля введення або порожній рядок якщо не знайдено
         """
         try:
-            # Чекаємо поки поле з'явиться
-            self.page.wait_for_timeout(1000)
-            
-            # Отримуємо значення з поля URL
-            url_input = self.page.get_by_placeholder("https://127.0.0.1:8000/fmt.")
-            if url_input.is_visible(timeout=3000):
-                url_value = url_input.input_value()
-                return url_value.strip() if url_value else ""
-            
-            # Альтернативний спосіб через локатор
-            url_input_alt = self.page.locator(self.locators.FEED_URL_INPUT)
-            if url_input_alt.is_visible(timeout=2000):
-                url_value = url_input_alt.input_value()
-                return url_value.strip() if url_value else ""
-            
-            return ""
+            # Чекаємо поки поле з'явиться (усі варіанти локатора одночасно)
+            url_input = self.find_locator("поле URL фіду", self.locators.FEED_URL_INPUT_VARIANTS, timeout=5000)
+            if url_input is None:
+                return ""
+            url_value = url_input.input_value()
+            return url_value.strip() if url_value else ""
         except Exception as e:
             print(f"Помилка при отриманні URL з поля введення: {e}")
             return ""
@@ -413,12 +605,10 @@ class XMLFeedPage(BasePage):
             # Крок 1: Клік на заголовок "Лінк фіду"
             link_column_header = self.page.locator(self.locators.FEED_LINK_COLUMN_HEADER)
             link_column_header.click()
-            self.page.wait_for_timeout(500)
             
             # Крок 2: Клік на іконку фільтра
             filter_icon = self.page.locator(self.locators.FEED_LINK_FILTER_ICON)
             filter_icon.click()
-            self.page.wait_for_timeout(500)
             
             # Крок 3: Заповнення поля фільтра
             # Видаляємо "/raw" з кінця URL для фільтрації (як в рекордері)
@@ -426,7 +616,15 @@ class XMLFeedPage(BasePage):
             
             filter_input = self.page.get_by_placeholder("Фільтр")
             filter_input.fill(filter_url)
-            self.page.wait_for_timeout(2000)  # Чекаємо поки таблиця відфільтрується
+            # Таблиця відфільтрована, коли не лишилось рядків без цього URL
+            started = time.perf_counter()
+            rows_without_url = self.page.locator(self.locators.FEEDS_TABLE_ROW).filter(has_not_text=filter_url)
+            try:
+                expect(rows_without_url).to_have_count(0, timeout=10000)
+                self._record_wait("фільтр таблиці фідів", started, True)
+            except AssertionError:
+                self._record_wait("фільтр таблиці фідів", started, False)
+            self.invalidate_feeds_table_cache()
             
         except Exception as e:
             print(f"Помилка при фільтрації фідів: {e}")
@@ -434,46 +632,24 @@ class XMLFeedPage(BasePage):
     
     def get_feed_id_from_filtered_table(self) -> str:
         """
-        Отримати feed_id з відфільтрованої таблиці (знаходимо span з feed_id)
+        Отримати feed_id з відфільтрованої таблиці (знаходимо комірку з feed_id)
         
         Returns:
             feed_id або порожній рядок якщо не знайдено
         """
         try:
             # Чекаємо поки таблиця завантажиться
-            self.page.wait_for_selector(".ag-row", timeout=5000)
-            
-            # Знаходимо перший рядок з таблиці (після фільтрації)
-            first_row = self.page.locator(".ag-row").first
-            
-            if first_row.is_visible(timeout=3000):
-                # Шукаємо span з feed_id (як в рекордері: span з текстом feed_id)
-                # feed_id зазвичай в першій або другій колонці
-                cells = first_row.locator(".ag-cell").all()
-                
-                # Перевіряємо перші кілька комірок
-                for cell in cells[:3]:
-                    # Шукаємо span з текстом що виглядає як feed_id (наприклад R3E8)
-                    spans = cell.locator("span").all()
-                    for span in spans:
-                        text = span.text_content()
-                        if text and text.strip():
-                            # Перевіряємо чи це схоже на feed_id (починається з літери та містить цифри)
-                            feed_id_candidate = text.strip()
-                            if len(feed_id_candidate) > 0 and (feed_id_candidate[0].isalpha() or feed_id_candidate[0].isdigit()):
-                                # Перевіряємо що це не просто число або довгий текст
-                                if len(feed_id_candidate) <= 10:  # feed_id зазвичай короткий
-                                    print(f"Знайдено feed_id з відфільтрованої таблиці: '{feed_id_candidate}'")
-                                    return feed_id_candidate
+            snapshot = self.read_feeds_table(timeout=5000)
+            if snapshot.rows:
+                # Перший рядок таблиці (після фільтрації)
+                cells = snapshot.rows[0].values
                 
-                # Альтернативний спосіб - беремо текст з першої комірки
-                if len(cells) > 0:
-                    first_cell_text = cells[0].text_content()
-                    if first_cell_text:
-                        feed_id = first_cell_text.strip()
-                        if feed_id and len(feed_id) <= 10:
-                            print(f"Знайдено feed_id з першої комірки: '{feed_id}'")
-                            return feed_id
+                # feed_id зазвичай в першій або другій колонці (наприклад R3E8)
+                for text in cells[:3]:
+                    # Схоже на feed_id: починається з літери або цифри і короткий
+                    if text and (text[0].isalpha() or text[0].isdigit()) and len(text) <= 10:
+                        print(f"Знайдено feed_id з відфільтрованої таблиці: '{text}'")
+                        return text
         except Exception as e:
             print(f"Помилка при отриманні feed_id з таблиці: {e}")
         
@@ -486,22 +662,13 @@ class XMLFeedPage(BasePage):
             management_button = self.page.locator(self.locators.MANAGEMENT_BUTTON)
             if management_button.is_visible(timeout=3000):
                 management_button.click()
-                self.page.wait_for_timeout(500)
             
-            # Потім клікаємо на кнопку "Редагувати" (з пробілом перед текстом як в рекордері)
-            edit_button = self.page.get_by_role("button", name=" Редагувати")
-            if edit_button.is_visible(timeout=3000):
+            # Потім клікаємо на кнопку "Редагувати" (з пробілом перед текстом як в рекордері або за текстом)
+            edit_button = self.find_locator("кнопка 'Редагувати'", self.locators.EDIT_BUTTON_VARIANTS, timeout=5000)
+            if edit_button is not None:
                 edit_button.click()
                 self.wait_for_load_state("networkidle")
-                self.page.wait_for_timeout(2000)
-                return
-            
-            # Альтернативний спосіб якщо не знайдено
-            edit_button_alt = self.page.locator("button:has-text('Редагувати')").first
-            if edit_button_alt.is_visible(timeout=2000):
-                edit_button_alt.click()
-                self.wait_for_load_state("networkidle")
-                self.page.wait_for_timeout(2000)
+                self.wait_for_any_visible((self.locators.FEED_URL_INPUT_ANY,), timeout=10000, name="форма фіду")
                 return
                 
         except Exception as e:
@@ -519,7 +686,8 @@ class XMLFeedPage(BasePage):
         edit_url = f"{self.get_url().split('?')[0]}?feed_id={feed_id}&tab=feed"
         self.goto(edit_url)
         self.wait_for_load_state("networkidle")
-        self.page.wait_for_timeout(2000)
+        # Форма фіду готова, коли з'явилось поле URL
+        self.wait_for_any_visible((self.locators.FEED_URL_INPUT_ANY,), timeout=10000, name="форма фіду")
     
     def get_feed_id_by_url_from_table(self, feed_url: str) -> str:
         """
@@ -532,53 +700,42 @@ class XMLFeedPage(BasePage):
             feed_id або порожній рядок якщо не знайдено
         """
         try:
-            # Чекаємо поки таблиця з'явиться
-            self.page.wait_for_selector(".ag-row", timeout=10000)
+            # Таблиця рендериться з відповіді API списку фідів - коли є рядки, відповідь вже прийшла
+            self.page.wait_for_selector(self.locators.FEEDS_TABLE_ROW, timeout=10000)
+            model = self.get_feed_list_model()
+            if model is not None:
+                feed_id = model.feed_id_for_url(feed_url)
+                if feed_id:
+                    print(f"Знайдено feed_id '{feed_id}' для URL '{feed_url}' (відповідь API)")
+                    return feed_id
+                print(f"URL '{feed_url}' не знайдено у відповіді API ({len(model)} фідів), шукаємо в таблиці")
             
-            # Шукаємо рядки в таблиці
-            table_rows = self.page.locator(".ag-row").all()
+            # Збираємо всі рядки таблиці
+            snapshot = self.collect_feeds_table()
             
-            if len(table_rows) == 0:
+            if len(snapshot) == 0:
                 print("Таблиця фідів порожня")
                 return ""
             
+            # Можемо шукати по повному URL або по частині
+            url_parts = feed_url.split("/")
+            url_key = url_parts[-1] if len(url_parts) > 0 else feed_url
+            
             # Шукаємо рядок з нашим URL
-            for row in table_rows:
-                row_text = row.text_content() or ""
-                
-                # Перевіряємо чи містить рядок наш URL
-                # Можемо шукати по повному URL або по частині
-                url_parts = feed_url.split("/")
-                url_key = url_parts[-1] if len(url_parts) > 0 else feed_url
-                
+            for row in snapshot:
+                row_text = row.text
                 if feed_url in row_text or url_key in row_text:
-                    # Знайшли рядок з нашим URL
-                    cells = row.locator(".ag-cell").all()
-                    if len(cells) > 0:
-                        # Перша колонка зазвичай містить feed_id
-                        feed_id = cells[0].text_content()
-                        if feed_id:
-                            feed_id = feed_id.strip()
-                            if feed_id:
-                                print(f"Знайдено feed_id '{feed_id}' для URL '{feed_url}'")
-                                return feed_id
+                    # Перша колонка зазвичай містить feed_id
+                    feed_id = row.values[0] if row.values else ""
+                    if feed_id:
+                        print(f"Знайдено feed_id '{feed_id}' для URL '{feed_url}'")
+                        return feed_id
                     
-                    # Якщо не знайшли в першій колонці, шукаємо посилання на фід
-                    # Посилання може містити feed_id в href
-                    try:
-                        link = row.locator("a[href*='feed_id']").first
-                        if link.is_visible(timeout=2000):
-                            href = link.get_attribute("href")
-                            if href and "feed_id=" in href:
-                                match = re.search(r'feed_id=([^&]+)', href)
-                                if match:
-                                    feed_id = match.group(1).strip()
-                                    feed_id = feed_id.replace("%20", " ").strip()
-                                    if feed_id:
-                                        print(f"Знайдено feed_id '{feed_id}' з посилання для URL '{feed_url}'")
-                                        return feed_id
-                    except:
-                        pass
+                    # Якщо не знайшли в першій колонці - посилання може містити feed_id в href
+                    feed_id = self._feed_id_from_hrefs(row)
+                    if feed_id:
+                        print(f"Знайдено feed_id '{feed_id}' з посилання для URL '{feed_url}'")
+                        return feed_id
             
             print(f"Не знайдено feed_id для URL '{feed_url}' в таблиці")
             return ""
@@ -597,8 +754,11 @@ class XMLFeedPage(BasePage):
         Returns:
             True якщо ID знайдено в таблиці, False якщо ні
         """
-        # Чекаємо поки таблиця завантажиться
-        self.page.wait_for_timeout(2000)
+        # Чекаємо поки відрендериться таблиця фідів (або форма фіду після редиректу на нього)
+        self.wait_for_any_visible(
+            (self.locators.FEEDS_TABLE_ROW, self.locators.FEEDS_TABLE_EMPTY, self.locators.FEED_URL_INPUT_ANY),
+            timeout=10000, name="таблиця або форма фіду"
+        )
         
         # Перевіряємо наявність таблиці фідів
         try:
@@ -607,22 +767,11 @@ class XMLFeedPage(BasePage):
             feed_id_column = self.page.locator(self.locators.FEED_ID_COLUMN)
             if feed_id_column.is_visible(timeout=3000):
                 # Якщо колонка видима, це означає що таблиця завантажена
-                # Тепер шукаємо рядки з даними в таблиці
-                # AG Grid таблиця має структуру з рядками
-                table_rows = self.page.locator(".ag-row").all()
-                if len(table_rows) > 0:
-                    # Перевіряємо що є хоча б один рядок з ID
-                    # ID фіду зазвичай відображається в першій або другій колонці
-                    for row in table_rows[:5]:  # Перевіряємо перші 5 рядків
-                        cells = row.locator(".ag-cell").all()
-                        if len(cells) > 0:
-                            # Перша колонка зазвичай містить ID
-                            first_cell_text = cells[0].text_content()
-                            if first_cell_text and first_cell_text.strip():
-                                # Перевіряємо що ID не порожній і не складається з пробілів
-                                feed_id = first_cell_text.strip()
-                                if feed_id and feed_id != "":
-                                    return True
+                # Перевіряємо що є хоча б один рядок з ID (перші 5 рядків)
+                for row in read_grid(self.page).rows[:5]:
+                    # Перша колонка зазвичай містить ID
+                    if row.values and row.values[0]:
+                        return True
         except Exception as e:
             # Якщо не вдалося знайти через таблицю, спробуємо через URL
             pass
@@ -648,8 +797,11 @@ class XMLFeedPage(BasePage):
         Returns:
             ID фіду або порожній рядок якщо не знайдено
         """
-        # Чекаємо поки таблиця завантажиться
-        self.page.wait_for_timeout(3000)
+        # Чекаємо поки відрендериться таблиця фідів (або форма фіду після редиректу на нього)
+        self.wait_for_any_visible(
+            (self.locators.FEEDS_TABLE_ROW, self.locators.FEEDS_TABLE_EMPTY, self.locators.FEED_URL_INPUT_ANY),
+            timeout=10000, name="таблиця або форма фіду"
+        )
         
         # Спочатку перевіряємо чи є редирект на сторінку конкретного фіду
         current_url = self.get_url()
@@ -661,36 +813,29 @@ class XMLFeedPage(BasePage):
                 if feed_id and feed_id != "":
                     return feed_id
         
+        # Потім - у перехопленій відповіді API списку фідів
+        model = self.get_feed_list_model()
+        if feed_url and model is not None:
+            feed_id = model.feed_id_for_url(feed_url)
+            if feed_id:
+                return feed_id
+        
         # Якщо не знайдено в URL, шукаємо в таблиці
         try:
-            # Чекаємо поки таблиця з'явиться
-            self.page.wait_for_selector(".ag-row", timeout=5000)
-            
-            # Шукаємо рядки в таблиці
-            table_rows = self.page.locator(".ag-row").all()
-            if len(table_rows) > 0:
-                # Перевіряємо перші рядки
-                for row in table_rows[:10]:  # Перевіряємо перші 10 рядків
-                    cells = row.locator(".ag-cell").all()
-                    if len(cells) > 0:
-                        # Якщо вказано feed_url, шукаємо рядок з цим URL
-                        if feed_url:
-                            row_text = row.text_content()
-                            # Перевіряємо чи містить рядок URL (може бути скорочений)
-                            url_short = feed_url.split("/")[-1] if "/" in feed_url else feed_url
-                            if feed_url in row_text or url_short in row_text:
-                                # Знайшли рядок з нашим URL, беремо ID з першої колонки
-                                first_cell_text = cells[0].text_content()
-                                if first_cell_text:
-                                    return first_cell_text.strip()
-                        else:
-                            # Беремо ID з першого рядка (найновіший фід)
-                            first_cell_text = cells[0].text_content()
-                            if first_cell_text and first_cell_text.strip():
-                                feed_id = first_cell_text.strip()
-                                # Перевіряємо що це дійсно ID (не порожній рядок)
-                                if feed_id and len(feed_id) > 0:
-                                    return feed_id
+            # Чекаємо поки таблиця з'явиться і читаємо перші 10 рядків одним запитом
+            for row in self.read_feeds_table(timeout=5000).rows[:10]:
+                if not row.values:
+                    continue
+                # Якщо вказано feed_url, шукаємо рядок з цим URL
+                if feed_url:
+                    # Перевіряємо чи містить рядок URL (може бути скорочений)
+                    url_short = feed_url.split("/")[-1] if "/" in feed_url else feed_url
+                    if feed_url in row.text or url_short in row.text:
+                        # Знайшли рядок з нашим URL, беремо ID з першої колонки
+                        return row.values[0]
+                elif row.values[0]:
+                    # Беремо ID з першого рядка (найновіший фід)
+                    return row.values[0]
         except Exception as e:
             # Якщо не вдалося знайти через таблицю, повертаємо порожній рядок
             pass
@@ -716,24 +861,21 @@ class XMLFeedPage(BasePage):
             download_dir = Path(download_path)
             download_dir.mkdir(parents=True, exist_ok=True)
             
-            # Очікуємо появу кнопки скачування
-            download_button = self.page.locator(self.locators.DOWNLOAD_EXCEL_MAPPING_BUTTON)
-            if not download_button.is_visible(timeout=10000):
-                # Спробуємо альтернативний локатор через filter
-                download_button = self.page.locator("button").filter(has_text="Отримати файл для ручного мапінгу")
-                if not download_button.is_visible(timeout=5000):
-                    raise Exception("Кнопка скачування Excel файлу мапінгу не знайдена")
+            # Очікуємо появу кнопки скачування (текст або кнопка з текстом - одночасно)
+            download_button = self.find_locator(
+                "кнопка скачування мапінгу", self.locators.DOWNLOAD_EXCEL_MAPPING_BUTTON_VARIANTS, timeout=15000
+            )
+            if download_button is None:
+                raise Exception("Кнопка скачування Excel файлу мапінгу не знайдена")
             
             # Перевіряємо що кнопка клікабельна
             download_button.wait_for(state="visible", timeout=5000)
             download_button.wait_for(state="attached", timeout=5000)
-            self.page.wait_for_timeout(2000)  # Додаткове очікування перед кліком
             
             print("Клікаємо на кнопку скачування Excel файлу...")
             # Збільшений таймаут для кліку (завантаження файлу може тривати)
             with self.page.expect_download(timeout=90000) as download_info:
                 download_button.click(timeout=60000)
-                self.page.wait_for_timeout(3000)
             
             download = download_info.value
             print(f"Завантаження почалося: {download.suggested_filename}")
@@ -741,7 +883,7 @@ class XMLFeedPage(BasePage):
             # Формуємо ім'я файлу: feed_id + дата (якщо feed_id вказано)
             if feed_id:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                file_name = f"{feed_id}_{timestamp}.xlsx"
+                file_name = artifact_name(f"{feed_id}_{timestamp}", ".xlsx")
             else:
                 # Використовуємо оригінальне ім'я з додаванням дати
                 original_name = download.suggested_filename
@@ -749,7 +891,7 @@ class XMLFeedPage(BasePage):
                     original_name = original_name + '.xlsx'
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 name_parts = Path(original_name).stem
-                file_name = f"{name_parts}_{timestamp}.xlsx"
+                file_name = artifact_name(f"{name_parts}_{timestamp}", ".xlsx")
             
             # Зберігаємо файл з новим ім'ям
             file_path = download_dir / file_name
@@ -814,20 +956,28 @@ class XMLFeedPage(BasePage):
                 raise Exception("Поле для завантаження файлу (input[type='file']) не знайдено")
             
             # Завантажуємо файл (input може бути прихований, але set_input_files все одно працює)
-            file_input.set_input_files(str(file_path_obj))
-            self.page.wait_for_timeout(2000)
-            
-            # Після завантаження файлу може знадобитися натиснути кнопку завантаження
-            # (якщо файл не завантажується автоматично)
-            try:
-                upload_button = self.page.locator(self.locators.UPLOAD_EXCEL_MAPPING_BUTTON)
-                if upload_button.is_visible(timeout=2000):
-                    # Можливо після вибору файлу потрібно натиснути кнопку
-                    upload_button.click()
-                    self.page.wait_for_timeout(2000)
-            except:
-                # Якщо кнопка не знайдена або не потрібна, продовжуємо
-                pass
+            upload_done = (self.locators.SUCCESS_MESSAGE, self.locators.VALIDATION_ERROR_MESSAGE)
+            response = self.wait_for_api_response(
+                self._set_feeds_api_pattern, lambda: file_input.set_input_files(str(file_path_obj)),
+                methods=("POST",), timeout=10000, or_selectors=upload_done,
+                name="завантаження мапінгу"
+            )
+            # Без відповіді API очікування завершила DOM-умова (успіх або помилка валідації) або дедлайн
+            result_shown = response is None and bool(self.wait_timings[-1]["ok"])
+            
+            # Якщо файл не завантажився автоматично (ні запиту, ні результату на сторінці) - натискаємо кнопку
+            if response is None and not result_shown:
+                try:
+                    upload_button = self.page.locator(self.locators.UPLOAD_EXCEL_MAPPING_BUTTON)
+                    if upload_button.is_visible(timeout=2000):
+                        self.wait_for_api_response(
+                            self._set_feeds_api_pattern, upload_button.click,
+                            methods=("POST",), timeout=10000, or_selectors=upload_done,
+                            name="завантаження мапінгу (кнопка)"
+                        )
+                except:
+                    # Якщо кнопка не знайдена або не потрібна, продовжуємо
+                    pass
             
             print(f"Excel файл успішно завантажено: {file_path}")
             return True
@@ -2,20 +2,24 @@
 Тести для функціоналу Excel мапінгу фідів.
 Містить тест-кейси для скачування та завантаження Excel файлів мапінгу.
 """
+import time
 import pytest
 from pathlib import Path
 from playwright.sync_api import Page
 from config.settings import TestConfig
 from pages.xml_feed_page import XMLFeedPage
-from pages.login_page import LoginPage
 from utils.db_helper import DBHelper
 from utils.excel_validator import ExcelValidator
+from utils.mapping_workbook_generator import generate_mapping_workbook
+from utils.worker_resources import artifact_name
 
 
 class TestExcelMapping:
     """Тест сьют: Excel мапінг фідів - Скачування та завантаження"""
     
-    def test_excel_mapping_file_download_and_upload(self, page: Page, test_config: TestConfig):
+    @pytest.mark.exclusive("TEST_EXISTING_FEED_ID", "TEST_XML_FEED_URL")
+    def test_excel_mapping_file_download_and_upload(self, page: Page, test_config: TestConfig, auth_session,
+                                                    pooled_feeds):
         """
         Тест кейс: Скачування та завантаження Excel файлу мапінгу
         
@@ -27,17 +31,17 @@ class TestExcelMapping:
         5. Отримання повідомлення про успіх "Дані збережено!"
         6. Вимкнення фіду після тесту (прибрати галочку "Завантажити товари з xml")
         """
-        # Визначаємо feed_id: використовуємо існуючий з конфігу або створюємо новий
+        # Визначаємо feed_id: існуючий з конфігу, фід з пулу або (якщо пул недоступний) створюємо новий
         feed_id = test_config.TEST_EXISTING_FEED_ID
+        feed_from_pool = False
+        if not feed_id:
+            leased = pooled_feeds(1)
+            if leased:
+                feed_id = leased[0].feed_id
+                feed_from_pool = True
         
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника "Парфюмс"
         xml_feed_page = XMLFeedPage(page)
@@ -108,9 +112,7 @@ class TestExcelMapping:
             raise AssertionError("Не вдалося завантажити Excel файл мапінгу")
         
         # Крок 11: Перевірка повідомлення про успіх після завантаження
-        # Чекаємо трохи більше часу після завантаження файлу
-        page.wait_for_timeout(3000)
-        
+        # (verify_success_message сам чекає повідомлення з дедлайном)
         # Спробуємо знайти повідомлення про успіх
         try:
             xml_feed_page.verify_success_message("Дані збережено!")
@@ -196,7 +198,8 @@ class TestExcelMapping:
                 pytest.fail(error_msg)
         
         # Cleanup: Видалення фіду з БД виконуємо тільки якщо створювали новий фід
-        if not test_config.TEST_EXISTING_FEED_ID:
+        # (фід з пулу не видаляється - після тесту його скидає фікстура pooled_feeds)
+        if not test_config.TEST_EXISTING_FEED_ID and not feed_from_pool:
             # Якщо створювали новий фід - видаляємо його з БД
             cleanup_success = False
             try:
@@ -230,13 +233,14 @@ class TestExcelMapping:
         except:
             pass
     
-    def test_excel_mapping_file_validation(self, page: Page, test_config: TestConfig):
+    @pytest.mark.exclusive("TEST_EXISTING_FEED_ID")
+    def test_excel_mapping_file_validation(self, page: Page, test_config: TestConfig, auth_session, mapping_api):
         """
         Тест кейс: Валідація структури та даних Excel файлу мапінгу
         
         Перевіряє:
-        1. Відкриття існуючого фіду (використовується фід R3DV постачальника Парфюмс)
-        2. Скачування Excel файлу мапінгу
+        1. Існуючий фід (використовується фід R3DV постачальника Парфюмс)
+        2. Скачування Excel файлу мапінгу через API gen-mapping-file
         3. Перевірка наявності всіх очікуваних вкладок (10 вкладок)
         4. Перевірка даних у вкладці "Категорія+" - порівняння з XML-фідом:
            - Перевірка наявності всіх ID категорій з фіду
@@ -263,49 +267,28 @@ class TestExcelMapping:
             "Оффер+"
         ]
         
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника "Парфюмс"
         xml_feed_page = XMLFeedPage(page)
         xml_feed_page.select_supplier(test_config.TEST_SUPPLIER_NAME)
         
-        # Крок 3: Перехід в Товари - Імпорт новинок - XML
-        xml_feed_page.navigate_to_xml_feeds_via_menu()
-        
-        # Крок 4: Відкриваємо існуючий фід R3DV
-        print(f"Відкриваємо існуючий фід: {feed_id}")
-        feed_edit_url = f"{test_config.XML_FEEDS_URL}?feed_id={feed_id}&tab=feed"
-        xml_feed_page.goto(feed_edit_url)
-        xml_feed_page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(2000)
-        
-        # Перевіряємо що фід відкрився
-        current_url = xml_feed_page.get_url()
-        assert feed_id in current_url, f"Не вдалося відкрити фід {feed_id}. Поточний URL: {current_url}"
-        
-        # Крок 5: Скачуємо Excel файл мапінгу
+        # Крок 3: Скачуємо Excel файл мапінгу фіду R3DV через API (потоково на диск)
         download_dir = Path("test-results/excel_mappings")
-        excel_file_path = xml_feed_page.download_excel_mapping_file(str(download_dir), feed_id=feed_id)
+        download_dir.mkdir(parents=True, exist_ok=True)
+        excel_file = download_dir / artifact_name(f"{feed_id}_{time.strftime('%Y%m%d_%H%M%S')}", ".xlsx")
+        transfer = mapping_api.download(feed_id, excel_file)
+        excel_file_path = transfer.path
         
-        if not excel_file_path:
-            raise AssertionError("Не вдалося скачати Excel файл мапінгу")
-        
-        excel_file = Path(excel_file_path)
         assert excel_file.exists(), f"Скачаний Excel файл не знайдено: {excel_file_path}"
         assert excel_file.suffix.lower() in ['.xlsx', '.xls'], f"Файл не є Excel файлом: {excel_file_path}"
         
         print(f"Excel файл успішно скачано: {excel_file_path}")
         
-        # Крок 6: Валідація Excel файлу
+        # Крок 4: Валідація Excel файлу
         with ExcelValidator(excel_file_path) as excel_validator:
-            # Крок 6.1: Перевірка наявності всіх очікуваних вкладок
+            # Крок 4.1: Перевірка наявності всіх очікуваних вкладок
             print(f"Перевірка наявності очікуваних вкладок ({len(expected_sheets)} вкладок)...")
             all_found, missing_sheets = excel_validator.verify_sheets_exist(expected_sheets)
             
@@ -317,7 +300,7 @@ class TestExcelMapping:
             
             print(f"✓ Всі очікувані вкладки знайдено ({len(expected_sheets)} вкладок)")
             
-            # Крок 6.2: Перевірка даних у вкладці "Категорія+" - порівняння з XML-фідом
+            # Крок 4.2: Перевірка даних у вкладці "Категорія+" - порівняння з XML-фідом
             print("Перевірка даних у вкладці 'Категорія+'...")
             
             if not excel_validator.sheet_exists("Категорія+"):
@@ -442,3 +425,64 @@ class TestExcelMapping:
                 print(f"Скачаний Excel файл видалено: {excel_file_path}")
         except:
             pass
+    
+    @pytest.mark.parametrize("category_rows", TestConfig.TEST_MAPPING_SCALE_ROWS)
+    @pytest.mark.exclusive("TEST_EXISTING_FEED_ID")
+    def test_excel_mapping_upload_scaling(self, page: Page, test_config: TestConfig, auth_session, mapping_api,
+                                          category_rows: int):
+        """
+        Тест кейс: Масштабування завантаження Excel файлу мапінгу
+        
+        Перевіряє:
+        1. Генерацію синтетичного файлу мапінгу з category_rows рядками у вкладці "Категорія+"
+        2. Завантаження файлу у фід TEST_EXISTING_FEED_ID через API set-feeds і успішну відповідь HUB
+        3. Час генерації, передачі файлу та обробки на сервері - окремо (виводиться у звіт)
+        
+        Запускається лише якщо задано TEST_MAPPING_SCALE_ROWS (напр. "1000,100000,1000000").
+        """
+        feed_id = test_config.TEST_EXISTING_FEED_ID
+        if not feed_id:
+            pytest.skip("TEST_EXISTING_FEED_ID не вказано в конфігурації")
+        
+        # Крок 1: Генерація синтетичного файлу мапінгу (write-only, стала пам'ять)
+        excel_file = Path("test-results/excel_mappings") / artifact_name(f"synthetic_{feed_id}_{category_rows}", ".xlsx")
+        stats = generate_mapping_workbook(str(excel_file), category_rows=category_rows)
+        print(
+            f"Згенеровано файл мапінгу: {stats['path']} "
+            f"({category_rows} рядків, {stats['size_bytes']} байт, {stats['duration_s']} с)"
+        )
+        
+        try:
+            # Крок 2: Авторизація в хаб (збережена сесія)
+            auth_session.open(page, test_config.XML_FEEDS_URL)
+            
+            # Крок 3: Вибір постачальника
+            xml_feed_page = XMLFeedPage(page)
+            xml_feed_page.select_supplier(test_config.TEST_SUPPLIER_NAME)
+            
+            # Крок 4: Завантаження файлу через API (FeedApiError - HUB відхилив файл або API недоступне)
+            transfer = mapping_api.upload(feed_id, excel_file)
+            print(
+                f"Завантаження мапінгу: {category_rows} рядків, {transfer.size_bytes} байт — "
+                f"передача {transfer.transfer_s:.2f} с, обробка на сервері {transfer.server_s:.2f} с"
+            )
+        finally:
+            # Cleanup: Вимкнути фід (як і в інших тестах мапінгу) та видалити згенерований файл
+            if test_config.DB_HOST and test_config.DB_NAME:
+                try:
+                    with DBHelper(
+                        host=test_config.DB_HOST,
+                        port=test_config.DB_PORT,
+                        database=test_config.DB_NAME,
+                        user=test_config.DB_USER,
+                        password=test_config.DB_PASSWORD
+                    ) as db:
+                        if db.is_feed_active(feed_id):
+                            db.deactivate_feed_by_id(feed_id)
+                except Exception as e:
+                    print(f"Попередження: не вдалося вимкнути фід {feed_id}: {e}")
+            try:
+                if excel_file.exists():
+                    excel_file.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,105 @@
+"""
+Юніт-тести для утиліти валідації Excel мапінгу (utils/excel_validator.py).
+Не потребують браузера: працюють з файлами, створеними openpyxl у тимчасовому каталозі.
+"""
+import openpyxl
+import pytest
+from utils.excel_validator import ExcelValidator, SheetColumns
+
+
+@pytest.fixture
+def category_workbook(tmp_path):
+    """Файл мапінгу з вкладкою "Категорія+": порожній заголовок і рядок, ширший за заголовки"""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Категорія+"
+    sheet.append(["ID категорії з фід", "Назва категорії з фід", None])
+    sheet.append([1000, "Парфуми", "x", "зайва", "ще одна"])
+    sheet.append([None, None, None])
+    sheet.append([1001, "Догляд"])
+    path = tmp_path / "mapping.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+class TestSheetColumns:
+    """Тест сьют: SheetColumns - проєкція рядків на колонки"""
+    
+    def test_projector_selects_columns_in_requested_order(self):
+        """Проєкція повертає значення у порядку запитаних колонок"""
+        columns = SheetColumns(("a", "b", "c"))
+        
+        assert columns.projector(["c", "a"])((1, 2, 3)) == (3, 1)
+        assert columns.projector(["b"])((1, 2, 3)) == (2,)
+    
+    def test_projector_without_columns_keeps_cells_beyond_headers(self):
+        """Без колонок рядок, ширший за заголовки, не обрізається"""
+        columns = SheetColumns(("a", "b"))
+        
+        assert columns.projector()((1, 2, 3, 4)) == (1, 2, 3, 4)
+    
+    def test_projector_rejects_unknown_columns(self):
+        """Невідомі колонки - ValueError з їх переліком"""
+        columns = SheetColumns(("a", "b"))
+        
+        with pytest.raises(ValueError, match="x, y"):
+            columns.projector(["a", "x", "y"])
+    
+    def test_duplicate_headers_resolve_to_last_column(self):
+        """Для дублікатів заголовків береться остання колонка"""
+        columns = SheetColumns(("a", "b", "a"))
+        
+        assert columns.projector(["a"])((1, 2, 3)) == (3,)
+    
+    def test_names_for_wide_rows(self):
+        """Зайві комірки отримують назви Column_N, кортеж назв спільний для однакової ширини"""
+        columns = SheetColumns(("a", "b"))
+        
+        assert columns.names_for(2) is columns.headers
+        assert columns.names_for(1) is columns.headers
+        assert columns.names_for(4) == ("a", "b", "Column_3", "Column_4")
+        assert columns.names_for(4) is columns.names_for(4)
+
+
+class TestExcelValidatorSheetData:
+    """Тест сьют: ExcelValidator - читання вкладки"""
+    
+    def test_read_sheet_data_keeps_extra_cells(self, category_workbook):
+        """Порожні рядки пропускаються, зайві комірки і порожні заголовки доступні як Column_N"""
+        validator = ExcelValidator(category_workbook)
+        try:
+            rows = validator.read_sheet_data("Категорія+")
+        finally:
+            validator.close()
+        
+        assert len(rows) == 2
+        assert rows[0]["ID категорії з фід"] == 1000
+        assert rows[0]["Column_3"] == "x"
+        assert rows[0]["Column_4"] == "зайва"
+        assert rows[0]["Column_5"] == "ще одна"
+        assert rows[1]["Назва категорії з фід"] == "Догляд"
+        assert rows[1].get("Column_4") is None
+    
+    def test_read_sheet_data_as_dict_and_projection(self, category_workbook):
+        """as_dict повертає всі комірки рядка, columns - лише запитані"""
+        validator = ExcelValidator(category_workbook)
+        try:
+            as_dict = validator.read_sheet_data("Категорія+", as_dict=True)
+            projected = validator.read_sheet_data("Категорія+", columns=["Назва категорії з фід"])
+        finally:
+            validator.close()
+        
+        assert as_dict[0]["Column_5"] == "ще одна"
+        assert [row.as_dict() for row in projected] == [
+            {"Назва категорії з фід": "Парфуми"},
+            {"Назва категорії з фід": "Догляд"},
+        ]
+    
+    def test_missing_sheet(self, category_workbook):
+        """Неіснуюча вкладка - ValueError"""
+        validator = ExcelValidator(category_workbook)
+        try:
+            with pytest.raises(ValueError, match="не знайдена"):
+                validator.get_sheet_columns("Немає")
+        finally:
+            validator.close()
@@ -0,0 +1,220 @@
+"""
+Юніт-тести для утиліт фідів: генератор YML-фідів, локальний сервер фідів, модель списку фідів,
+індекс постачальників. Не потребують браузера і HUB.
+"""
+import urllib.error
+import urllib.request
+import xml.etree.ElementTree as ET
+import pytest
+from utils.feed_generator import CATEGORY_ID_BASE, YmlFeedGenerator
+from utils.feed_list_model import FeedListModel, FeedRecord, normalize_feed_url
+from utils.feed_server import FeedServer
+from utils.supplier_index import SupplierIndex
+
+
+def _fetch(url: str):
+    """GET запит до локального сервера: (статус, тіло)"""
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+@pytest.fixture
+def feed_server():
+    """Локальний сервер фідів на вільному порту (лише для цього тесту)"""
+    with FeedServer(host="127.0.0.1") as server:
+        yield server
+
+
+class TestYmlFeedGenerator:
+    """Тест сьют: YmlFeedGenerator - синтетичні YML-фіди"""
+    
+    def test_generated_feed_is_valid_xml(self):
+        """Фід розбирається XML-парсером і містить задану кількість категорій, товарів і зображень"""
+        generator = YmlFeedGenerator(categories=7, offers=25, images_per_offer=2, category_depth=3)
+        
+        root = ET.fromstring(b"".join(generator.iter_chunks(chunk_size=256)))
+        
+        assert len(root.findall("./shop/categories/category")) == 7
+        assert len(root.findall("./shop/offers/offer")) == 25
+        assert len(root.findall("./shop/offers/offer/picture")) == 50
+    
+    def test_category_tree_and_offer_categories(self):
+        """Товари прив'язані до категорій останнього рівня дерева"""
+        generator = YmlFeedGenerator(categories=6, offers=12, category_depth=2)
+        root = ET.fromstring(b"".join(generator.iter_chunks()))
+        
+        parents = {category.get("id"): category.get("parentId") for category in root.iter("category")}
+        leaf_ids = {category_id for category_id in parents if category_id not in parents.values()}
+        assert parents[str(CATEGORY_ID_BASE)] is None
+        assert parents[str(CATEGORY_ID_BASE + 3)] == str(CATEGORY_ID_BASE)
+        assert {offer.findtext("categoryId") for offer in root.iter("offer")} <= leaf_ids
+        assert [name for _, name in generator.get_categories()] == [category.text for category in root.iter("category")]
+    
+    def test_same_seed_gives_same_feed(self):
+        """Однаковий seed - однаковий документ"""
+        first = b"".join(YmlFeedGenerator(offers=10, seed=7).iter_chunks())
+        second = b"".join(YmlFeedGenerator(offers=10, seed=7).iter_chunks())
+        
+        assert first == second
+    
+    @pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "utf-16", "windows-1251"])
+    def test_supported_encodings(self, encoding):
+        """Фід у підтримуваному кодуванні розбирається з кирилицею"""
+        generator = YmlFeedGenerator(categories=2, offers=3, encoding=encoding)
+        
+        root = ET.fromstring(b"".join(generator.iter_chunks()))
+        
+        assert root.find("./shop/categories/category").text.startswith("Парфуми")
+    
+    @pytest.mark.parametrize("encoding", ["utf-32", "utf-32-le", "no-such-encoding"])
+    def test_unsupported_encodings(self, encoding):
+        """Кодування, яке expat не читає (або невідоме), відхиляється до стрімінгу"""
+        with pytest.raises(ValueError):
+            YmlFeedGenerator(encoding=encoding)
+    
+    @pytest.mark.parametrize("kwargs", [{"categories": 0}, {"offers": -1}, {"category_depth": 0}])
+    def test_invalid_sizes(self, kwargs):
+        """Некоректні розміри - ValueError"""
+        with pytest.raises(ValueError):
+            YmlFeedGenerator(**kwargs)
+    
+    def test_write_to(self, tmp_path):
+        """write_to пише той самий документ, що й iter_chunks, і повертає його розмір"""
+        generator = YmlFeedGenerator(offers=5)
+        path = tmp_path / "feeds" / "feed.xml"
+        
+        size = generator.write_to(str(path))
+        
+        assert size == path.stat().st_size
+        assert path.read_bytes() == b"".join(generator.iter_chunks())
+
+
+class TestFeedServer:
+    """Тест сьют: FeedServer - локальний сервер фідів"""
+    
+    def test_generated_feed_from_query(self, feed_server):
+        """/feed.xml генерує фід за query-параметрами і пише запит у журнал"""
+        status, body = _fetch(feed_server.url("/feed.xml?offers=4&categories=3"))
+        
+        root = ET.fromstring(body)
+        assert status == 200
+        assert len(root.findall("./shop/offers/offer")) == 4
+        assert len(root.findall("./shop/categories/category")) == 3
+        record = feed_server.wait_for_request("/feed.xml", timeout=5)
+        assert record["query"]["offers"] == "4"
+        assert record["status"] == 200
+    
+    def test_bad_query_returns_400(self, feed_server):
+        """Непідтримуване кодування або нечислові параметри - 400 замість фіду"""
+        assert _fetch(feed_server.url("/feed.xml?encoding=utf-32"))[0] == 400
+        assert _fetch(feed_server.url("/feed.xml?offers=abc"))[0] == 400
+    
+    def test_custom_route_and_404(self, feed_server):
+        """Маршрут з фіксованим тілом і статусом; невідомий шлях - 404"""
+        url = feed_server.add_route("/broken.xml", "<yml_catalog><shop>", status=200)
+        
+        assert _fetch(url) == (200, b"<yml_catalog><shop>")
+        assert _fetch(feed_server.url("/missing.xml"))[0] == 404
+    
+    def test_public_base_url(self):
+        """Публічний URL використовується в URL маршрутів замість локальної адреси"""
+        server = FeedServer(public_base_url="http://host.docker.internal:9878/")
+        
+        assert server.url("/feed.xml") == "http://host.docker.internal:9878/feed.xml"
+
+
+class TestFeedListModel:
+    """Тест сьют: FeedListModel - модель списку фідів з JSON API"""
+    
+    PAYLOAD = {
+        "items": [
+            {"feed_id": "R3DV", "origin_url": "https://example.com/feed.xml#ufeedR3DV", "is_active": 1,
+             "last_upload": "2025-01-02T03:04:05Z"},
+            {"feedId": "AB12", "originUrl": " https://example.com/other.xml/ ", "isActive": False,
+             "lastUpload": 1735787045000},
+            {"id": "DUP1", "url": "https://example.com/feed.xml"},
+            {"id": "NOURL"},
+        ]
+    }
+    
+    def test_from_payload_indexes_by_id_and_url(self):
+        """Записи без URL пропускаються, пошук за URL ігнорує #ufeed, пробіли і кінцевий '/'"""
+        model = FeedListModel.from_payload(self.PAYLOAD)
+        
+        assert len(model) == 3
+        assert "NOURL" not in model
+        assert model.get(" AB12 ").origin_url == "https://example.com/other.xml/"
+        assert model.feed_id_for_url("https://example.com/other.xml") == "AB12"
+        # Для однакових URL перемагає перший запис
+        assert model.feed_id_for_url("https://example.com/feed.xml") == "R3DV"
+        assert model.feed_id_for_url("https://example.com/none.xml") == ""
+    
+    def test_record_fields(self):
+        """is_active приводиться до bool, час завантаження - з ISO-рядка або unix-часу в мс"""
+        model = FeedListModel.from_payload(self.PAYLOAD)
+        
+        assert model.get("R3DV").is_active is True
+        assert model.get("R3DV").last_upload.year == 2025
+        assert model.get("AB12").is_active is False
+        assert model.get("AB12").last_upload.year == 2025
+        assert model.get("DUP1").is_active is None
+        assert model.get("DUP1").last_upload is None
+    
+    @pytest.mark.parametrize("payload", [
+        {"items": []},
+        {"items": [{"id": 1, "name": "Парфюмс"}]},
+        {"message": "ok"},
+        "not a list",
+    ])
+    def test_not_a_feed_list(self, payload):
+        """Відповіді, не схожі на список фідів, ігноруються"""
+        assert FeedListModel.from_payload(payload) is None
+    
+    def test_list_payload_and_normalize_url(self):
+        """Список без обгортки теж приймається"""
+        model = FeedListModel.from_payload([{"feed_id": 5, "origin_url": "https://example.com/a.xml"}])
+        
+        assert list(model)[0].feed_id == "5"
+        assert FeedRecord.from_json({"feed_id": "", "origin_url": "https://example.com"}) is None
+        assert normalize_feed_url(" https://example.com/a.xml/#ufeed5") == "https://example.com/a.xml"
+
+
+class TestSupplierIndex:
+    """Тест сьют: SupplierIndex.find - пошук supplier_id за назвою"""
+    
+    @pytest.fixture
+    def index(self):
+        """Індекс у пам'яті (без файлу кешу)"""
+        index = SupplierIndex()
+        index.add("Парфюмс", "101")
+        index.add("v4Косметика", "202")
+        index.add("Kasta Shoes", "303")
+        index.add("Kasta Bags", "304")
+        index.add("Без ID", "")
+        return index
+    
+    @pytest.mark.parametrize("name, expected", [
+        ("Парфюмс", "101"),
+        ("парфюмс", "101"),
+        (" kasta shoes ", "303"),
+        ("Косметика", "202"),
+        ("Kasta", None),
+        ("Немає", None),
+        ("Без ID", None),
+    ])
+    def test_find(self, index, name, expected):
+        """Точний збіг, без урахування регістру, потім єдиний частковий збіг; неоднозначність - None"""
+        assert index.find(name) == expected
+    
+    def test_cache_round_trip(self, tmp_path):
+        """Збережений індекс читається іншим екземпляром для того самого HUB і не видний іншому"""
+        cache = tmp_path / "suppliers.json"
+        index = SupplierIndex(str(cache), base_url="https://hub.example/")
+        index.add("Парфюмс", "101")
+        index.save()
+        
+        assert SupplierIndex(str(cache), base_url="https://hub.example").find("Парфюмс") == "101"
+        assert SupplierIndex(str(cache), base_url="https://other.example").find("Парфюмс") is None
@@ -0,0 +1,184 @@
+"""
+Юніт-тести для інфраструктури запуску: профіль маршрутизації, ключі HAR-відтворення,
+слоти воркерів і міжпроцесні локи ресурсів. Не потребують браузера і HUB.
+"""
+import json
+import threading
+import pytest
+from utils.har_replay import normalize_body, request_key
+from utils.route_profile import RouteProfile
+from utils.worker_resources import (
+    ResourceLock, ResourceLockTimeout, WorkerSlot, parse_worker_slots, slot_for_worker
+)
+
+
+class _FakeRequest:
+    """Мінімальна заміна playwright Request для RouteProfile.handle"""
+    
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class _FakeRoute:
+    """Мінімальна заміна playwright Route: запам'ятовує, що з запитом зробив обробник"""
+    
+    def __init__(self, url: str, resource_type: str = "document"):
+        self.request = _FakeRequest(url, resource_type)
+        self.outcome = None
+    
+    def abort(self, error_code: str = "failed"):
+        self.outcome = f"abort:{error_code}"
+    
+    def fallback(self):
+        self.outcome = "fallback"
+
+
+class TestRouteProfile:
+    """Тест сьют: RouteProfile - блокування ресурсів і хостів"""
+    
+    def test_empty_profile_is_disabled(self):
+        """Порожній профіль (значення за замовчуванням) нічого не блокує і не встановлюється"""
+        assert not RouteProfile().enabled
+        assert not RouteProfile([" ", ""], [""]).enabled
+    
+    def test_blocks_types_and_hosts(self):
+        """Типи ресурсів і хости з піддоменами блокуються, решта йде далі через fallback"""
+        profile = RouteProfile(["Image", " font "], [".google-analytics.com"])
+        routes = [
+            _FakeRoute("https://hub.example/logo.png", "image"),
+            _FakeRoute("https://hub.example/font.woff2", "font"),
+            _FakeRoute("https://www.google-analytics.com/collect", "xhr"),
+            _FakeRoute("https://google-analytics.com/collect", "script"),
+            _FakeRoute("https://notgoogle-analytics.com/collect", "script"),
+            _FakeRoute("https://hub.example/api/feeds", "fetch"),
+        ]
+        
+        for route in routes:
+            profile.handle(route)
+        
+        assert [route.outcome for route in routes] == [
+            "abort:blockedbyclient", "abort:blockedbyclient", "abort:blockedbyclient",
+            "abort:blockedbyclient", "fallback", "fallback",
+        ]
+        assert profile.snapshot() == {
+            "заблоковано image": 1, "заблоковано font": 1, "заблоковано google-analytics.com": 2, "пропущено": 2
+        }
+        assert profile.summary().startswith("заблоковано 4 запитів")
+
+
+class TestHarRequestKey:
+    """Тест сьют: har_replay - ключі запитів для пошуку в HAR"""
+    
+    def test_json_body_ignores_volatile_fields_and_key_order(self):
+        """JSON порівнюється без змінних полів (csrf, timestamp, ...) і незалежно від порядку ключів"""
+        first = json.dumps({"email": "a@b.c", "csrf": "1", "nested": {"ts": 1, "x": [1, 2]}})
+        second = json.dumps({"nested": {"x": [1, 2], "ts": 2}, "email": "a@b.c", "csrf": "2"})
+        
+        assert normalize_body(first) == normalize_body(second)
+        assert normalize_body(first) != normalize_body(json.dumps({"email": "other@b.c"}))
+    
+    def test_form_body(self):
+        """form-urlencoded сортується і втрачає змінні поля"""
+        assert normalize_body("b=2&a=1&_csrf=xyz") == "a=1&b=2"
+        assert normalize_body("a=") == "a="
+    
+    def test_other_bodies(self):
+        """Порожнє тіло - порожній рядок, multipart і бінарне - лише довжина"""
+        multipart = "--boundary\r\nContent-Disposition: form-data; name=\"file\"\r\n\r\nxx\r\n--boundary--"
+        
+        assert normalize_body(None) == ""
+        assert normalize_body("") == ""
+        assert normalize_body(multipart) == f"<{len(multipart)} bytes>"
+    
+    def test_request_key(self):
+        """Ключ: метод у верхньому регістрі, шлях, query без змінних полів у відсортованому порядку, тіло"""
+        key = request_key("post", "https://hub.example/api/feeds?b=2&_=123&a=1", '{"a": 1, "nonce": "x"}')
+        
+        assert key == ("POST", "/api/feeds", "a=1&b=2", '{"a": 1}')
+        assert request_key("GET", "https://hub.example", None) == ("GET", "/", "", "")
+        assert request_key("GET", "https://hub.example/?t=1", None) == \
+            request_key("GET", "https://hub.example/?t=2", None)
+
+
+class TestWorkerSlot:
+    """Тест сьют: WorkerSlot - ресурси воркера з TEST_WORKER_SLOTS"""
+    
+    def test_from_string_full(self):
+        """Усі частини слоту розбираються, пробіли і порожні feed_id відкидаються"""
+        slot = WorkerSlot.from_string(" Парфюмс | 101 | R3DV | A1, B2 ,,C3 ")
+        
+        assert slot.supplier_name == "Парфюмс"
+        assert slot.supplier_id == "101"
+        assert slot.existing_feed_id == "R3DV"
+        assert slot.feed_ids_for_limit == ["A1", "B2", "C3"]
+    
+    def test_from_string_partial(self):
+        """Відсутні частини лишаються порожніми і не підміняють значення конфігурації"""
+        slot = WorkerSlot.from_string("Косметика||R4")
+        
+        class Config:
+            TEST_SUPPLIER_NAME = "Парфюмс"
+            TEST_SUPPLIER_ID = "101"
+            TEST_EXISTING_FEED_ID = "R3DV"
+            TEST_FEED_IDS_FOR_LIMIT = ["X"]
+        
+        original = slot.apply_to(Config)
+        
+        assert slot.supplier_id == "" and slot.feed_ids_for_limit == []
+        assert original == {"TEST_SUPPLIER_NAME": "Парфюмс", "TEST_EXISTING_FEED_ID": "R3DV"}
+        assert (Config.TEST_SUPPLIER_NAME, Config.TEST_SUPPLIER_ID) == ("Косметика", "101")
+        assert Config.TEST_FEED_IDS_FOR_LIMIT == ["X"]
+    
+    def test_parse_and_assign_slots(self):
+        """Слоти розділені ";", воркер i отримує слот i % кількість"""
+        slots = parse_worker_slots("A|1;; B|2 ;")
+        
+        assert [slot.supplier_name for slot in slots] == ["A", "B"]
+        assert slot_for_worker(slots, 3).supplier_name == "B"
+        assert slot_for_worker([], 0) is None
+
+
+class TestResourceLock:
+    """Тест сьют: ResourceLock - файлові локи ресурсів між воркерами"""
+    
+    def test_exclusive_lock_blocks_until_timeout(self, tmp_path):
+        """Другий ексклюзивний лок того самого ресурсу не захоплюється до дедлайну"""
+        with ResourceLock(str(tmp_path), "Парфюмс:url:https://example.com/feed.xml"):
+            other = ResourceLock(str(tmp_path), "Парфюмс:url:https://example.com/feed.xml",
+                                 timeout=0.3, poll_interval=0.05)
+            with pytest.raises(ResourceLockTimeout):
+                other.acquire()
+    
+    def test_different_resources_do_not_block(self, tmp_path):
+        """Локи різних ресурсів незалежні"""
+        with ResourceLock(str(tmp_path), "supplier:A"):
+            with ResourceLock(str(tmp_path), "supplier:B", timeout=0.3) as other:
+                assert other.waited_s < 0.3
+    
+    def test_shared_locks_coexist_and_block_exclusive(self, tmp_path):
+        """Спільні локи не блокують один одного, але блокують ексклюзивний"""
+        first = ResourceLock(str(tmp_path), "supplier:A", shared=True)
+        second = ResourceLock(str(tmp_path), "supplier:A", shared=True, timeout=0.3)
+        exclusive = ResourceLock(str(tmp_path), "supplier:A", timeout=0.3, poll_interval=0.05)
+        first.acquire()
+        try:
+            second.acquire()
+            second.release()
+            with pytest.raises(ResourceLockTimeout):
+                exclusive.acquire()
+        finally:
+            first.release()
+    
+    def test_waiting_lock_acquires_after_release(self, tmp_path):
+        """Лок, що чекає, захоплюється після звільнення; повторний release безпечний"""
+        holder = ResourceLock(str(tmp_path), "supplier:A")
+        holder.acquire()
+        timer = threading.Timer(0.3, holder.release)
+        timer.start()
+        try:
+            with ResourceLock(str(tmp_path), "supplier:A", timeout=5, poll_interval=0.05) as waiter:
+                assert waiter.waited_s >= 0.2
+        finally:
+            timer.join()
+        holder.release()
@@ -2,18 +2,21 @@
 Тести для функціоналу XML-фідів.
 Містить тест-кейси для додавання та валідації XML-фідів.
 """
+import time
 import pytest
 from playwright.sync_api import Page, expect
 from config.settings import TestConfig
 from pages.xml_feed_page import XMLFeedPage
-from pages.login_page import LoginPage
 from utils.db_helper import DBHelper
+from utils.feed_api import FeedApiError
+from utils.local_feeds import HUB_CONN_TIMEOUT_S, HUB_SOCKET_TIMEOUT_S
 
 
 class TestXMLFeed:
     """Тест сьют: XML-фіди - Додавання та валідація"""
     
-    def test_validate_url_save_valid_url_without_spaces(self, page: Page, test_config: TestConfig):
+    @pytest.mark.exclusive("TEST_XML_FEED_URL")
+    def test_validate_url_save_valid_url_without_spaces(self, page: Page, test_config: TestConfig, auth_session):
         """
         Тест кейс: Валідація url. Збереження валідного URL (без пробілів)
         
@@ -21,14 +24,8 @@ class TestXMLFeed:
         Очікується:
         - Фід успішно збережено та користувач отримав про це сповіщення "Дані збережено!"
         """
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника "Braggart"
         xml_feed_page = XMLFeedPage(page)
@@ -86,7 +83,8 @@ class TestXMLFeed:
         # Фінальна перевірка що cleanup виконано успішно
         assert cleanup_success, f"Cleanup не виконано для feed_id '{feed_id}'. Тест провалено!"
     
-    def test_validate_url_save_normalized_url_with_spaces(self, page: Page, test_config: TestConfig):
+    @pytest.mark.exclusive("TEST_XML_FEED_URL")
+    def test_validate_url_save_normalized_url_with_spaces(self, page: Page, test_config: TestConfig, auth_session):
         """
         Тест кейс: Валідація url. Збереження нормалізованого URL (пробіли)
         
@@ -96,14 +94,8 @@ class TestXMLFeed:
         - В БД записано URL без пробілів (нормалізований)
         - При відкритті фіду в таблиці, посилання в полі буде без пробілів
         """
-        # Крок 1: Авторизація в хаб як постачальник
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб як постачальник (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника "Braggart"
         xml_feed_page = XMLFeedPage(page)
@@ -241,7 +233,7 @@ class TestXMLFeed:
         # Фінальна перевірка що cleanup виконано успішно
         assert cleanup_success, f"Cleanup не виконано для feed_id '{feed_id}'. Тест провалено!"
     
-    def test_validate_url_save_invalid_xml_structure_json_inside(self, page: Page, test_config: TestConfig):
+    def test_validate_url_save_invalid_xml_structure_json_inside(self, page: Page, test_config: TestConfig, auth_session):
         """
         Тест кейс: Валідація url. Збереження url розширення xml невалідної структури фід (всередині json)
         
@@ -255,14 +247,8 @@ class TestXMLFeed:
         """
         invalid_feed_url = test_config.TEST_INVALID_XML_FEED_URL
         
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника
         xml_feed_page = XMLFeedPage(page)
@@ -301,7 +287,7 @@ class TestXMLFeed:
         else:
             print("Попередження: налаштування БД не вказані, перевірка відсутності запису пропущена")
     
-    def test_validate_url_save_unavailable_url_404(self, page: Page, test_config: TestConfig):
+    def test_validate_url_save_unavailable_url_404(self, page: Page, test_config: TestConfig, auth_session):
         """
         Тест кейс: Валідація url. Збереження недоступного URL (404 Not Found)
         
@@ -315,14 +301,8 @@ class TestXMLFeed:
         """
         url_404 = test_config.TEST_404_FEED_URL
         
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника
         xml_feed_page = XMLFeedPage(page)
@@ -361,7 +341,7 @@ class TestXMLFeed:
         else:
             print("Попередження: налаштування БД не вказані, перевірка відсутності запису пропущена")
     
-    def test_tc_xml_003_empty_url_validation(self, page: Page, test_config: TestConfig):
+    def test_tc_xml_003_empty_url_validation(self, page: Page, test_config: TestConfig, auth_session):
         """
         TC-XML-003: Порожнє поле URL
         
@@ -380,14 +360,8 @@ class TestXMLFeed:
         - Помилка валідації (не дозволено зберегти без URL)
         - Запис у таблиці feed не створюється
         """
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника
         xml_feed_page = XMLFeedPage(page)
@@ -437,7 +411,8 @@ class TestXMLFeed:
         )
         print("Підтверджено: запис у таблиці feed не створено")
     
-    def test_save_feed_without_checkbox(self, page: Page, test_config: TestConfig):
+    @pytest.mark.exclusive("TEST_XML_FEED_URL")
+    def test_save_feed_without_checkbox(self, page: Page, test_config: TestConfig, auth_session):
         """
         Збереження фіду без чекбокса "Завантажити товари з xml"
 
@@ -459,14 +434,8 @@ class TestXMLFeed:
 
         Cleanup: Видалення фіду з БД після тесту.
         """
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
 
         # Крок 2: Вибір постачальника
         xml_feed_page = XMLFeedPage(page)
@@ -552,7 +521,8 @@ class TestXMLFeed:
 
         assert cleanup_success, f"Cleanup не виконано для feed_id '{feed_id}'. Тест провалено!"
 
-    def test_add_same_url_twice_no_duplicate(self, page: Page, test_config: TestConfig):
+    @pytest.mark.exclusive("TEST_DUPLICATE_FEED_URL")
+    def test_add_same_url_twice_no_duplicate(self, page: Page, test_config: TestConfig, auth_session, feed_factory):
         """
         Тест кейс: Додавання одного URL двічі
 
@@ -574,14 +544,16 @@ class TestXMLFeed:
         """
         feed_url = test_config.TEST_DUPLICATE_FEED_URL
 
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
+
+        # Arrange: фід з цим URL має вже бути в кабінеті - гарантуємо через API, без UI
+        existing_feed_id = ""
+        try:
+            existing_feed_id = feed_factory.ensure(feed_url)
+            print(f"Фід з URL '{feed_url}' є в кабінеті: feed_id={existing_feed_id}")
+        except FeedApiError as e:
+            print(f"Попередження: API фідів недоступне ({e}), покладаємось на наявний фід")
 
         # Крок 2: Вибір постачальника Парфюмс
         xml_feed_page = XMLFeedPage(page)
@@ -614,6 +586,10 @@ class TestXMLFeed:
             f"Очікувалось знайти фід з URL '{feed_url}' в таблиці після повторного додавання"
         )
         print(f"Фід знайдено в таблиці по посиланню: feed_id={feed_id}, URL={feed_url}")
+        if existing_feed_id:
+            assert feed_id == existing_feed_id, (
+                f"Очікувалось що повторне додавання оновить фід {existing_feed_id}, але знайдено {feed_id}"
+            )
 
         # Після фільтра по URL очікуємо щонайменше один рядок; якщо один — дубль не створено
         rows_count = xml_feed_page.get_feeds_table_row_count()
@@ -646,7 +622,7 @@ class TestXMLFeed:
             f"Cleanup не виконано для feed_id '{feed_id}'. Тест провалено!"
         )
 
-    def test_invalid_url_format_validation(self, page: Page, test_config: TestConfig):
+    def test_invalid_url_format_validation(self, page: Page, test_config: TestConfig, auth_session):
         """
         Тест кейс: Невірний формат URL (не URL)
         
@@ -667,14 +643,8 @@ class TestXMLFeed:
         """
         invalid_url = test_config.TEST_INVALID_URL_FEED
         
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника
         xml_feed_page = XMLFeedPage(page)
@@ -730,7 +700,7 @@ class TestXMLFeed:
             )
             print("Підтверджено: запис у таблиці feed не створено")
     
-    def test_tc_xml_008_invalid_xml_structure(self, page: Page, test_config: TestConfig):
+    def test_tc_xml_008_invalid_xml_structure(self, page: Page, test_config: TestConfig, auth_session):
         """
         TC-XML-008: XML з некоректною структурою (неповний/зламаний XML)
         
@@ -751,14 +721,8 @@ class TestXMLFeed:
         """
         invalid_structure_url = test_config.TEST_INVALID_XML_STRUCTURE_URL
         
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника
         xml_feed_page = XMLFeedPage(page)
@@ -812,7 +776,7 @@ class TestXMLFeed:
             )
             print("Підтверджено: запис у таблиці feed не створено")
     
-    def test_tc_xml_007_connection_timeout_1min(self, page: Page, test_config: TestConfig):
+    def test_tc_xml_007_connection_timeout_1min(self, page: Page, test_config: TestConfig, auth_session):
         """
         TC-XML-007: Таймаут при збереженні фіду (conn-timeout 1 хв)
         
@@ -837,14 +801,8 @@ class TestXMLFeed:
         """
         timeout_url = test_config.TEST_TIMEOUT_FEED_URL
         
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника
         xml_feed_page = XMLFeedPage(page)
@@ -866,9 +824,13 @@ class TestXMLFeed:
         xml_feed_page.enable_upload_items_checkbox()
         
         # Крок 7: Натиснути "Зберегти"
+        save_clicked_at = time.perf_counter()
         xml_feed_page.click_save_button()
-        # Чекаємо на відповідь: conn-timeout 1 хв + буфер
-        page.wait_for_timeout(90000)
+        # Чекаємо на помилку (не довше conn-timeout 1 хв + буфер) замість фіксованої паузи 90 с
+        xml_feed_page.wait_for_validation_error_message(
+            "Connect timed out", timeout=(HUB_CONN_TIMEOUT_S + 30) * 1000
+        )
+        print(f"HUB повернув conn-timeout через {time.perf_counter() - save_clicked_at:.1f} с після 'Зберегти'")
         
         # Очікуваний результат 1: Помилка "Connect timed out" (conn-timeout 1 хв)
         xml_feed_page.verify_validation_error_message("Помилка валідації xml структури фіду")
@@ -900,7 +862,80 @@ class TestXMLFeed:
             )
             print("Підтверджено: запис у таблиці feed не створено")
     
-    def test_limit_3_active_feeds(self, page: Page, test_config: TestConfig):
+    def test_tc_xml_007_socket_timeout_5min(self, page: Page, test_config: TestConfig, auth_session, local_feed_server):
+        """
+        TC-XML-007: Таймаут при збереженні фіду (socket-timeout 5 хв)
+        
+        Локальний сервер фідів приймає з'єднання, віддає заголовки та початок документа
+        і далі мовчить (сценарій stall_mid_body). Після socket-timeout 5 хв HUB має
+        обірвати завантаження. Сервер фіксує момент, коли HUB закрив з'єднання.
+        
+        Кроки:
+        - Авторизуватися, обрати постачальника
+        - Товари → Імпорт новинок → XML
+        - Натиснути "Додати новий фід", ввести URL завислого фіду
+        - Увімкнути чекбокс "Завантажити товари з xml", натиснути "Зберегти"
+        
+        Очікуваний результат:
+        - Помилка "Помилка валідації xml структури фіду ... timed out"
+        - HUB закриває з'єднання не раніше socket-timeout
+        - Запис у feed не створюється
+        
+        Потребує TEST_LOCAL_FEEDS=1 (HUB має бачити локальний сервер фідів).
+        """
+        if local_feed_server is None or not test_config.TEST_STALLED_FEED_URL:
+            pytest.skip("Потрібен локальний сервер фідів (TEST_LOCAL_FEEDS=1)")
+        
+        stalled_url = test_config.TEST_STALLED_FEED_URL
+        stalled_path = stalled_url[len(local_feed_server.base_url):]
+        
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
+        
+        # Крок 2: Вибір постачальника та перехід в Товари - Імпорт новинок - XML
+        xml_feed_page = XMLFeedPage(page)
+        xml_feed_page.select_supplier(test_config.TEST_SUPPLIER_NAME)
+        xml_feed_page.navigate_to_xml_feeds_via_menu()
+        
+        # Крок 3: Додати фід з URL завислого фіду та зберегти
+        xml_feed_page.click_add_new_feed_button()
+        xml_feed_page.fill_feed_url(stalled_url)
+        xml_feed_page.enable_upload_items_checkbox()
+        xml_feed_page.click_save_button()
+        
+        # Очікуваний результат 1: HUB звернувся до фіду та отримав помилку таймауту
+        assert local_feed_server.wait_for_request(stalled_path, timeout=60), \
+            f"HUB не звернувся до локального фіду {stalled_url}"
+        xml_feed_page.wait_for_validation_error_message(
+            "timed out", timeout=(HUB_SOCKET_TIMEOUT_S + 60) * 1000
+        )
+        xml_feed_page.verify_validation_error_message("Помилка валідації xml структури фіду")
+        
+        # Очікуваний результат 2: HUB закрив з'єднання після socket-timeout (фіксує сервер фідів)
+        gave_up_after = local_feed_server.client_gave_up_after(stalled_path)
+        assert gave_up_after is not None, "HUB не закрив з'єднання з завислим фідом"
+        print(f"HUB закрив з'єднання через {gave_up_after:.1f} с (socket-timeout {HUB_SOCKET_TIMEOUT_S} с)")
+        assert gave_up_after >= HUB_SOCKET_TIMEOUT_S * 0.9, (
+            f"HUB закрив з'єднання раніше socket-timeout: {gave_up_after:.1f} с < {HUB_SOCKET_TIMEOUT_S} с"
+        )
+        
+        # Очікуваний результат 3: Запис у feed не створюється
+        if test_config.DB_HOST and test_config.DB_NAME:
+            with DBHelper(
+                host=test_config.DB_HOST,
+                port=test_config.DB_PORT,
+                database=test_config.DB_NAME,
+                user=test_config.DB_USER,
+                password=test_config.DB_PASSWORD
+            ) as db:
+                assert not db.feed_exists_by_origin_url(stalled_url), (
+                    f"Запис у таблиці feed не повинен був створитися, але існує! URL: {stalled_url}"
+                )
+            print("Підтверджено: запис у таблиці feed не створено")
+    
+    @pytest.mark.exclusive("TEST_SUPPLIER_NAME")
+    def test_limit_3_active_feeds(self, page: Page, test_config: TestConfig, auth_session, feed_factory,
+                                  pooled_feeds):
         """
         Тест кейс: Обмеження "3 активні фіди"
         
@@ -909,16 +944,13 @@ class TestXMLFeed:
         
         У таблиці можуть вже бути включені фіди — помилка може з’явитись на 1-й, 2-й або 3-й спробі.
         Проходимо по списку фідів, вмикаємо по черзі, до появи помилки.
-        Cleanup: вимкнення увімкнених фідів через БД.
+        Перші 3 фіди вмикаються через API (arrange), через UI - лише наступна спроба.
+        Фіди беруться з пулу (вимкнені, відомий стан); якщо пул недоступний - 4 найсвіжіші з таблиці.
+        Cleanup: вимкнення увімкнених фідів через БД (увімкнені через API - фікстурою feed_factory).
+        Фіди, що вже були увімкнені до тесту (можливо при виборі з таблиці), cleanup не вимикає.
         """
-        # Крок 1: Авторизація в хаб
-        login_page = LoginPage(page)
-        login_page.navigate_to_login(f"{test_config.LOGIN_URL}?next=/supplier-content/xml")
-        login_page.login(
-            email=test_config.USER_EMAIL,
-            password=test_config.USER_PASSWORD
-        )
-        login_page.verify_successful_login()
+        # Крок 1: Авторизація в хаб (збережена сесія)
+        auth_session.open(page, test_config.XML_FEEDS_URL)
         
         # Крок 2: Вибір постачальника
         xml_feed_page = XMLFeedPage(page)
@@ -927,18 +959,40 @@ class TestXMLFeed:
         # Крок 3: Перехід в Товари - Імпорт новинок - XML
         xml_feed_page.navigate_to_xml_feeds_via_menu()
         
-        # Крок 4: Сортування по "Останнє завантаження" та отримання 4 найсвіжіших фідів
-        xml_feed_page.sort_table_by_last_upload_desc()
-        feed_ids = xml_feed_page.get_first_n_feed_ids(n=4)
-        if len(feed_ids) < 4:
-            pytest.skip(f"У таблиці менше 4 фідів (знайдено {len(feed_ids)})")
-        print(f"Обрано 4 найсвіжіших фіди: {feed_ids}")
+        # Крок 4: 4 фіди з пулу або (якщо пул недоступний) 4 найсвіжіші фіди з таблиці
+        feed_ids = [feed.feed_id for feed in pooled_feeds(4)]
+        from_pool = bool(feed_ids)
+        if from_pool:
+            print(f"Обрано 4 фіди з пулу: {feed_ids}")
+        else:
+            xml_feed_page.sort_table_by_last_upload_desc()
+            feed_ids = xml_feed_page.get_first_n_feed_ids(n=4)
+            if len(feed_ids) < 4:
+                pytest.skip(f"У таблиці менше 4 фідів (знайдено {len(feed_ids)})")
+            print(f"Обрано 4 найсвіжіших фіди: {feed_ids}")
+        
+        # Arrange через API: вмикаємо перші 3 фіди без UI.
+        # Якщо API недоступне або ліміт вже досягнуто - решта спроб іде через UI
+        api_handled = 0
+        try:
+            for feed_id in feed_ids[:3]:
+                if feed_factory.activate(feed_id):
+                    print(f"Фід {feed_id} вмикнено через API")
+                else:
+                    print(f"Фід {feed_id} вже був увімкнений - cleanup його не вимикає")
+                api_handled += 1
+        except FeedApiError as e:
+            print(f"API: не вдалося вмикнути фід ({e}), продовжуємо через UI")
+        if api_handled or from_pool:
+            # Таблиця відображає стан до змін через API (і може ще не містити щойно створених фідів пулу)
+            xml_feed_page.goto(test_config.XML_FEEDS_URL)
+            xml_feed_page.wait_for_load_state("networkidle")
         
         # Вмикаємо фіди по черзі — помилка може з’явитись на будь-якій спробі
         enabled_feed_ids = []
         error_received = False
         
-        for i, feed_id in enumerate(feed_ids):
+        for i, feed_id in enumerate(feed_ids[api_handled:], start=api_handled):
             print(f"Спроба вмикнути фід {i + 1}/4: {feed_id}")
             try:
                 xml_feed_page.open_feed_from_table_by_id(feed_id)
@@ -951,6 +1005,12 @@ class TestXMLFeed:
             # Клік "Редагувати" для переходу в режим редагування
             xml_feed_page.click_edit_button()
             page.wait_for_timeout(1500)
+            if xml_feed_page.is_upload_items_checkbox_checked():
+                # Фід вже увімкнений до тесту: він займає місце в ліміті, але cleanup його не вимикає
+                print(f"Фід {feed_id} вже увімкнений, переходимо до наступного")
+                xml_feed_page.goto(test_config.XML_FEEDS_URL)
+                xml_feed_page.wait_for_load_state("networkidle")
+                continue
             xml_feed_page.enable_upload_items_checkbox()
             page.wait_for_timeout(500)
             xml_feed_page.click_save_button()
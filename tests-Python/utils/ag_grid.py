@@ -0,0 +1,259 @@
+"""
+Читання таблиць AG Grid однією оцінкою в браузері.
+Замість text_content() по кожній комірці (один IPC-запит на комірку) весь відрендерений
+грід забирається одним page.evaluate і розбирається на рядки вже в Python.
+AG Grid рендерить лише рядки у видимій області, тому для повного списку є collect_grid,
+що прокручує viewport кроками і збирає рядки з кожного кроку.
+"""
+from typing import Dict, List, Optional
+from playwright.sync_api import Page
+
+
+# Збирає заголовки і відрендерені рядки гріда. Рядок з закріпленими колонками AG Grid
+# рендерить у кількох контейнерах (left/center/right) - вони об'єднуються за row-index.
+READ_GRID_JS = """
+(rootSelector) => {
+    const root = rootSelector ? document.querySelector(rootSelector) : document;
+    if (!root) return { columns: [], rows: [] };
+    const text = (el) => (el.textContent || '').trim();
+    const colIndex = (el) => Number(el.getAttribute('aria-colindex')) || 0;
+
+    const columns = [...root.querySelectorAll('.ag-header-cell[col-id]')]
+        .sort((a, b) => colIndex(a) - colIndex(b))
+        .map((el) => [el.getAttribute('col-id'), text(el)]);
+
+    const rows = new Map();
+    for (const rowEl of root.querySelectorAll('.ag-row')) {
+        const rowIndex = rowEl.getAttribute('row-index');
+        const key = rowIndex !== null ? rowIndex : rowEl.getAttribute('row-id');
+        let row = rows.get(key);
+        if (!row) {
+            const position = Number(rowIndex);
+            row = {
+                row_id: rowEl.getAttribute('row-id') || '',
+                row_index: Number.isFinite(position) ? position : -1,
+                cells: [],
+                hrefs: [],
+            };
+            rows.set(key, row);
+        }
+        for (const cell of rowEl.querySelectorAll('.ag-cell')) {
+            row.cells.push([cell.getAttribute('col-id') || '', colIndex(cell), text(cell)]);
+        }
+        for (const link of rowEl.querySelectorAll('a[href]')) {
+            row.hrefs.push(link.getAttribute('href'));
+        }
+    }
+    for (const row of rows.values()) {
+        row.cells.sort((a, b) => a[1] - b[1]);
+        row.cells = row.cells.map(([colId, , value]) => [colId, value]);
+    }
+    return { columns, rows: [...rows.values()].sort((a, b) => a.row_index - b.row_index) };
+}
+"""
+
+# Прокрутити вертикальний viewport гріда (scrollTo = null - лише прочитати позицію)
+SCROLL_GRID_JS = """
+([rootSelector, scrollTo]) => {
+    const root = rootSelector ? document.querySelector(rootSelector) : document;
+    const viewport = root && root.querySelector('.ag-body-viewport');
+    if (!viewport) return null;
+    if (scrollTo !== null) viewport.scrollTop = scrollTo;
+    return {
+        scroll_top: viewport.scrollTop,
+        client_height: viewport.clientHeight,
+        scroll_height: viewport.scrollHeight,
+    };
+}
+"""
+
+# Прокрутити viewport так, щоб рядок з row-index опинився у видимій області
+SCROLL_TO_ROW_JS = """
+([rootSelector, rowIndex]) => {
+    const root = rootSelector ? document.querySelector(rootSelector) : document;
+    const viewport = root && root.querySelector('.ag-body-viewport');
+    const anyRow = root && root.querySelector('.ag-center-cols-container .ag-row, .ag-row');
+    if (!viewport || !anyRow) return false;
+    const rowHeight = anyRow.offsetHeight || 1;
+    viewport.scrollTop = Math.max(0, rowIndex * rowHeight - viewport.clientHeight / 2);
+    return true;
+}
+"""
+
+
+class GridRow:
+    """Рядок таблиці AG Grid: col-id -> текст комірки (у порядку колонок) і посилання рядка"""
+
+    __slots__ = ("row_id", "row_index", "cells", "hrefs")
+
+    def __init__(self, row_id: str, row_index: int, cells: Dict[str, str], hrefs: List[str]):
+        """
+        Ініціалізація рядка
+
+        Args:
+            row_id: Атрибут row-id рядка (ID вузла AG Grid)
+            row_index: Позиція рядка в гріді (атрибут row-index)
+            cells: Словник col-id -> текст комірки
+            hrefs: Значення href усіх посилань у рядку
+        """
+        self.row_id = row_id
+        self.row_index = row_index
+        self.cells = cells
+        self.hrefs = hrefs
+
+    @classmethod
+    def from_js(cls, data: dict) -> "GridRow":
+        """Створити рядок з результату READ_GRID_JS"""
+        cells = {}
+        for position, (col_id, value) in enumerate(data["cells"]):
+            cells[col_id or str(position)] = value
+        return cls(data["row_id"], data["row_index"], cells, list(data["hrefs"]))
+
+    @property
+    def values(self) -> List[str]:
+        """Тексти комірок у порядку колонок"""
+        return list(self.cells.values())
+
+    @property
+    def text(self) -> str:
+        """Текст усього рядка (як row.text_content(), але з пробілами між комірками)"""
+        return " ".join(self.cells.values())
+
+    def get(self, col_id: str, default: str = "") -> str:
+        """Текст комірки за col-id"""
+        return self.cells.get(col_id, default)
+
+    def __repr__(self) -> str:
+        return f"GridRow(row_index={self.row_index}, row_id={self.row_id!r}, cells={self.cells!r})"
+
+
+class GridSnapshot:
+    """Знімок відрендереного гріда: заголовки колонок і рядки"""
+
+    __slots__ = ("columns", "rows")
+
+    def __init__(self, columns: Dict[str, str], rows: List[GridRow]):
+        """
+        Ініціалізація знімка
+
+        Args:
+            columns: Словник col-id -> текст заголовка (у порядку колонок)
+            rows: Рядки у порядку row-index
+        """
+        self.columns = columns
+        self.rows = rows
+
+    def column_id(self, header_text: str) -> Optional[str]:
+        """
+        Знайти col-id колонки за частиною тексту заголовка
+
+        Args:
+            header_text: Текст (або його частина) заголовка, без урахування регістру
+
+        Returns:
+            col-id або None якщо колонку не знайдено
+        """
+        needle = header_text.lower()
+        for col_id, title in self.columns.items():
+            if needle in title.lower():
+                return col_id
+        return None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+def read_grid(page: Page, root_selector: Optional[str] = None) -> GridSnapshot:
+    """
+    Прочитати відрендерений AG Grid однією оцінкою в браузері
+
+    Args:
+        page: Екземпляр Playwright Page
+        root_selector: CSS-селектор контейнера гріда (None - вся сторінка)
+
+    Returns:
+        GridSnapshot із заголовками та рядками
+    """
+    data = page.evaluate(READ_GRID_JS, root_selector)
+    columns = {col_id: title for col_id, title in data["columns"]}
+    return GridSnapshot(columns, [GridRow.from_js(row) for row in data["rows"]])
+
+
+def collect_grid(page: Page, root_selector: Optional[str] = None, step_ratio: float = 0.8,
+                 settle_ms: int = 120, stable_rounds: int = 2, max_steps: int = 1000) -> GridSnapshot:
+    """
+    Зібрати всі рядки віртуалізованого AG Grid, прокручуючи viewport кроками
+
+    Рядки дедуплікуються за row-id. Збір завершується, коли viewport дійшов до низу і кількість
+    рядків не змінюється stable_rounds кроків поспіль (підвантаження наприкінці списку теж
+    враховується). Після збору позиція прокрутки відновлюється.
+
+    Args:
+        page: Екземпляр Playwright Page
+        root_selector: CSS-селектор контейнера гріда (None - вся сторінка)
+        step_ratio: Крок прокрутки як частка висоти viewport (< 1, щоб кроки перекривались)
+        settle_ms: Пауза після прокрутки, за яку AG Grid встигає відрендерити нові рядки
+        stable_rounds: Скільки кроків поспіль без нових рядків означає кінець списку
+        max_steps: Запобіжник від нескінченної прокрутки
+
+    Returns:
+        GridSnapshot з усіма рядками у порядку row-index
+    """
+    collected: Dict[str, GridRow] = {}
+
+    def merge(snapshot: GridSnapshot):
+        for row in snapshot:
+            collected[row.row_id or f"index:{row.row_index}"] = row
+
+    first = read_grid(page, root_selector)
+    merge(first)
+    state = page.evaluate(SCROLL_GRID_JS, [root_selector, None])
+    # Немає прокрутки - усі рядки вже відрендерені
+    if state is None or state["scroll_height"] <= state["client_height"]:
+        return first
+
+    original_top = state["scroll_top"]
+    step = max(int(state["client_height"] * step_ratio), 1)
+    position = 0
+    stable = 0
+    try:
+        state = page.evaluate(SCROLL_GRID_JS, [root_selector, position])
+        for _ in range(max_steps):
+            page.wait_for_timeout(settle_ms)
+            before = len(collected)
+            merge(read_grid(page, root_selector))
+            stable = stable + 1 if len(collected) == before else 0
+
+            at_bottom = state["scroll_top"] + state["client_height"] >= state["scroll_height"] - 1
+            if at_bottom and stable >= stable_rounds:
+                break
+            position = state["scroll_top"] + step
+            state = page.evaluate(SCROLL_GRID_JS, [root_selector, position])
+    finally:
+        page.evaluate(SCROLL_GRID_JS, [root_selector, original_top])
+
+    rows = sorted(collected.values(), key=lambda row: row.row_index)
+    return GridSnapshot(first.columns, rows)
+
+
+def scroll_grid_to_row(page: Page, row_index: int, root_selector: Optional[str] = None,
+                       settle_ms: int = 120) -> bool:
+    """
+    Прокрутити грід до рядка, щоб його можна було знайти локатором (.ag-row[row-index=N])
+
+    Args:
+        page: Екземпляр Playwright Page
+        row_index: Позиція рядка (GridRow.row_index)
+        root_selector: CSS-селектор контейнера гріда (None - вся сторінка)
+        settle_ms: Пауза на рендер після прокрутки
+
+    Returns:
+        True якщо прокрутка виконана, False якщо грід не знайдено
+    """
+    scrolled = page.evaluate(SCROLL_TO_ROW_JS, [root_selector, row_index])
+    if scrolled:
+        page.wait_for_timeout(settle_ms)
+    return bool(scrolled)
@@ -0,0 +1,166 @@
+"""
+Локальний дисковий кеш статики HUB (JS/CSS-бандли SPA), спільний для всіх контекстів браузера.
+Контексти Playwright не мають спільного HTTP-кешу, тому кожен новий контекст завантажує бандли заново.
+Обробник route віддає кешовані незмінні ресурси з диска, а при першому промаху бере їх з мережі.
+
+Структура кешу (content-addressed):
+    objects/<sha256 тіла>   - тіло ресурсу
+    index/<sha1 URL>.json   - URL -> sha256, статус, заголовки, до коли запис дійсний
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+from playwright.sync_api import BrowserContext, Route
+from playwright.sync_api import Error as PlaywrightError
+
+
+# Хеш у назві файлу (app.3f9a1c2b.js, chunk-5d41402abc4b.css) - ознака незмінного ресурсу
+HASHED_ASSET_RE = re.compile(r"[.\-_][0-9a-f]{8,}\.(js|mjs|css|woff2?|ttf|svg|png|webp)$", re.I)
+# Незмінні ресурси без явного max-age тримаємо рік (як Cache-Control: immutable)
+IMMUTABLE_TTL_S = 365 * 24 * 3600
+# Заголовки, які не можна повертати разом з уже розпакованим тілом
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def _max_age(cache_control: str) -> Optional[int]:
+    """max-age з Cache-Control (None якщо його немає)"""
+    match = re.search(r"max-age=(\d+)", cache_control)
+    return int(match.group(1)) if match else None
+
+
+class AssetCache:
+    """Обробник context.route, що кешує незмінну статику HUB на диску"""
+
+    def __init__(self, cache_dir: str, hosts: Iterable[str],
+                 resource_types: Iterable[str] = ("script", "stylesheet"), min_ttl_s: int = 3600):
+        """
+        Ініціалізація кешу
+
+        Args:
+            cache_dir: Каталог кешу (спільний для воркерів і запусків)
+            hosts: Хости, статику яких кешуємо (хост HUB)
+            resource_types: Типи ресурсів Playwright, які кешуємо
+            min_ttl_s: Мінімальний max-age, з яким ресурс без хешу в назві вважається придатним для кешу
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hosts = {host.lower() for host in hosts if host}
+        self.resource_types = set(resource_types)
+        self.min_ttl_s = min_ttl_s
+        self.hits = 0
+        self.misses = 0
+        self.stored = 0
+        self.bytes_served = 0
+
+    def _index_path(self, url: str) -> Path:
+        return self.cache_dir / "index" / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.cache_dir / "objects" / digest
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Записати файл атомарно (воркери xdist можуть писати той самий запис одночасно)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent))
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+
+    def is_cacheable_request(self, url: str, method: str, resource_type: str) -> bool:
+        """Чи може запит обслуговуватись кешем (GET статики з хоста HUB)"""
+        return (method == "GET" and resource_type in self.resource_types
+                and (urlparse(url).hostname or "").lower() in self.hosts)
+
+    def ttl_for(self, url: str, headers: Dict[str, str]) -> Optional[int]:
+        """
+        Скільки секунд можна зберігати відповідь згідно з її заголовками
+
+        Returns:
+            TTL у секундах або None якщо ресурс не можна кешувати
+        """
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control or "no-cache" in cache_control:
+            return None
+        max_age = _max_age(cache_control)
+        if "immutable" in cache_control or HASHED_ASSET_RE.search(urlparse(url).path):
+            return max(max_age or 0, IMMUTABLE_TTL_S) if max_age != 0 else None
+        if max_age is not None and max_age >= self.min_ttl_s:
+            return max_age
+        return None
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Дійсний запис кешу для URL (з тілом) або None"""
+        try:
+            entry = json.loads(self._index_path(url).read_text(encoding="utf-8"))
+            if entry["expires"] < time.time():
+                return None
+            entry["body"] = self._object_path(entry["sha256"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry
+
+    def store(self, url: str, status: int, headers: Dict[str, str], body: bytes, ttl: int):
+        """Зберегти відповідь у кеш"""
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            self._write_atomic(object_path, body)
+        entry = {
+            "url": url,
+            "status": status,
+            "headers": {key: value for key, value in headers.items() if key.lower() not in _DROP_HEADERS},
+            "sha256": digest,
+            "expires": time.time() + ttl,
+        }
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode("utf-8"))
+        self.stored += 1
+
+    def handle(self, route: Route):
+        """Обробник context.route: віддати з кешу або завантажити і закешувати"""
+        request = route.request
+        if not self.is_cacheable_request(request.url, request.method, request.resource_type):
+            route.fallback()
+            return
+        entry = self.lookup(request.url)
+        if entry is not None:
+            self.hits += 1
+            self.bytes_served += len(entry["body"])
+            route.fulfill(status=entry["status"], headers=entry["headers"], body=entry["body"])
+            return
+        self.misses += 1
+        try:
+            response = route.fetch()
+        except PlaywrightError:
+            route.fallback()
+            return
+        body = response.body()
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        ttl = self.ttl_for(request.url, headers) if response.status == 200 else None
+        if ttl:
+            self.store(request.url, response.status, headers, body, ttl)
+        route.fulfill(response=response, body=body,
+                      headers={key: value for key, value in headers.items() if key not in _DROP_HEADERS})
+
+    def install(self, context: BrowserContext):
+        """Встановити кеш на контекст"""
+        context.route("**/*", self.handle)
+
+    def hit_rate(self) -> float:
+        """Частка запитів, обслужених з кешу"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> Dict[str, int]:
+        """Поточні лічильники (для різниці до/після тесту)"""
+        return {"кеш hit": self.hits, "кеш miss": self.misses, "з кешу, байт": self.bytes_served}
+
+    def summary(self) -> str:
+        """Підсумок за сесію"""
+        return (f"hit {self.hits}, miss {self.misses} (hit rate {self.hit_rate():.0%}), "
+                f"збережено {self.stored}, віддано з диска {self.bytes_served / 1024 / 1024:.1f} МБ")
@@ -0,0 +1,144 @@
+"""
+Збережена сесія авторизації (Playwright storage state) для тестів, яким потрібен залогінений користувач.
+Логін через форму виконується один раз на процес (воркер), далі кожен контекст стартує з cookies з файлу.
+Якщо сесія протухла (HUB перекинув на сторінку логіну) - логін повторюється і файл оновлюється.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from playwright.sync_api import Browser, BrowserContext, Page
+
+from pages.login_page import LoginPage
+
+
+# Ознака сторінки логіну в URL
+LOGIN_PATH = "/user/login"
+
+
+class AuthSession:
+    """Файл storage state з авторизованою сесією та повторний логін при її завершенні"""
+
+    def __init__(self, browser: Browser, login_url: str, email: str, password: str,
+                 state_path: str, context_args: Optional[Dict] = None, offline: bool = False):
+        """
+        Ініціалізація сесії
+
+        Args:
+            browser: Браузер, у якому виконується перший логін
+            login_url: URL сторінки логіну
+            email: Email користувача
+            password: Пароль користувача
+            state_path: Шлях до JSON-файлу storage state (свій для кожного воркера)
+            context_args: Аргументи контексту для першого логіну (viewport, ...)
+            offline: Відтворення HAR без живого HUB - логін неможливий, використовується порожня сесія
+        """
+        self.browser = browser
+        self.login_url = login_url
+        self.email = email
+        self.password = password
+        self.state_path = Path(state_path)
+        self.context_args = dict(context_args or {})
+        self.offline = offline
+        self.logins = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_login_page(url: str) -> bool:
+        """Чи це сторінка логіну (сесії немає або вона протухла)"""
+        return LOGIN_PATH in url
+
+    def is_state_fresh(self, min_ttl_s: int = 60) -> bool:
+        """
+        Чи є файл storage state з cookies, що діють ще щонайменше min_ttl_s секунд
+
+        Args:
+            min_ttl_s: Мінімальний залишок часу життя cookies
+
+        Returns:
+            True якщо файл можна використовувати без логіну
+        """
+        if not self.state_path.exists():
+            return False
+        try:
+            cookies = json.loads(self.state_path.read_text(encoding="utf-8")).get("cookies", [])
+        except (OSError, ValueError):
+            return False
+        if not cookies:
+            return False
+        deadline = time.time() + min_ttl_s
+        # expires = -1 - сесійна cookie, строк життя визначає сервер (перевіряється у open())
+        return all(cookie.get("expires", -1) < 0 or cookie["expires"] > deadline for cookie in cookies)
+
+    def _login_on_page(self, page: Page):
+        """Залогінитись на поточній сторінці логіну і зберегти storage state"""
+        login_page = LoginPage(page)
+        if not self.is_login_page(page.url):
+            login_page.navigate_to_login(self.login_url)
+        login_page.login(email=self.email, password=self.password)
+        login_page.verify_successful_login()
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        page.context.storage_state(path=str(self.state_path))
+        self.logins += 1
+        print(f">>> Логін через форму виконано, сесію збережено: {self.state_path}")
+
+    def ensure_state(self) -> str:
+        """
+        Гарантувати наявність актуального файлу storage state (логін - лише якщо файлу немає
+        або cookies протухли)
+
+        Returns:
+            Шлях до файлу storage state
+        """
+        with self._lock:
+            if self.offline and not self.state_path.exists():
+                # Відповіді HUB беруться з HAR, записаного вже залогіненим - cookies не потрібні
+                self.state_path.parent.mkdir(parents=True, exist_ok=True)
+                self.state_path.write_text(json.dumps({"cookies": [], "origins": []}), encoding="utf-8")
+            elif not self.offline and not self.is_state_fresh():
+                context = self.browser.new_context(**self.context_args)
+                try:
+                    self._login_on_page(context.new_page())
+                finally:
+                    context.close()
+        return str(self.state_path)
+
+    def apply_to(self, context: BrowserContext):
+        """
+        Перенести збережену сесію в уже створений контекст (cookies і localStorage)
+
+        Args:
+            context: Контекст браузера тесту
+        """
+        state = json.loads(Path(self.ensure_state()).read_text(encoding="utf-8"))
+        if state.get("cookies"):
+            context.add_cookies(state["cookies"])
+        for origin in state.get("origins", []):
+            items = {item["name"]: item["value"] for item in origin.get("localStorage", [])}
+            if items:
+                context.add_init_script(
+                    "(([origin, items]) => { if (location.origin === origin) "
+                    "for (const [k, v] of Object.entries(items)) localStorage.setItem(k, v); })"
+                    f"({json.dumps([origin['origin'], items])})"
+                )
+
+    def open(self, page: Page, url: str):
+        """
+        Відкрити сторінку під збереженою сесією; якщо сесія протухла - залогінитись повторно
+
+        Args:
+            page: Сторінка тесту
+            url: Сторінка, яку потрібно відкрити
+        """
+        self.apply_to(page.context)
+        page.goto(url)
+        if not self.is_login_page(page.url):
+            page.wait_for_load_state("networkidle")
+            return
+        print(">>> Збережена сесія недійсна - повторний логін")
+        with self._lock:
+            self._login_on_page(page)
+        if page.url.split("?")[0].rstrip("/") != url.split("?")[0].rstrip("/"):
+            page.goto(url)
+        page.wait_for_load_state("networkidle")
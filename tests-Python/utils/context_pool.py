@@ -0,0 +1,135 @@
+"""
+Пул заздалегідь підготовлених контекстів браузера.
+Контекст зі сторінкою створюється до тесту (viewport, storage state авторизації, init scripts, routes),
+тест отримує готову сторінку, а поповнення пулу виконується між тестами (maintain), а не в setup тесту.
+Використані контексти закриваються у фоні: закриття запускається задачею в event loop Playwright і
+йде паралельно з поповненням пулу і наступним тестом.
+"""
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from playwright.sync_api import Browser, BrowserContext, Page
+
+
+# Підготовка контексту перед видачею тесту (init script, route, ...)
+ContextPreparer = Callable[[BrowserContext], None]
+
+
+class ContextPool:
+    """K готових контекстів на кожен вид (з авторизацією / без), видача тестам і утилізація після них"""
+
+    def __init__(self, browser: Browser, context_args: Dict, size: int = 2,
+                 storage_state: Optional[Callable[[], str]] = None):
+        """
+        Ініціалізація пулу
+
+        Args:
+            browser: Браузер сесії
+            context_args: Аргументи нового контексту (browser_context_args)
+            size: Скільки готових контекстів тримати для кожного виду
+            storage_state: Функція, що повертає шлях до storage state (AuthSession.ensure_state)
+        """
+        self.browser = browser
+        self.context_args = dict(context_args)
+        self.size = size
+        self.storage_state = storage_state
+        self.preparers: List[ContextPreparer] = []
+        self._ready: Dict[bool, List[Tuple[BrowserContext, Page]]] = {}
+        self._retired: List[BrowserContext] = []
+        self._closing: List[asyncio.Task] = []
+        self._created_at: Dict[int, float] = {}
+        self.stats = {"hits": 0, "misses": 0, "created": 0}
+
+    def add_preparer(self, preparer: ContextPreparer):
+        """Додати крок підготовки, що виконується для кожного нового контексту"""
+        self.preparers.append(preparer)
+
+    def _create(self, authenticated: bool) -> Tuple[BrowserContext, Page]:
+        """Створити і підготувати контекст з відкритою сторінкою"""
+        args = dict(self.context_args)
+        if authenticated and self.storage_state is not None:
+            args["storage_state"] = self.storage_state()
+        context = self.browser.new_context(**args)
+        for preparer in self.preparers:
+            preparer(context)
+        page = context.new_page()
+        self._created_at[id(page)] = time.perf_counter()
+        self.stats["created"] += 1
+        return context, page
+
+    def acquire(self, authenticated: bool = False) -> Tuple[BrowserContext, Page]:
+        """
+        Отримати готовий контекст і сторінку
+
+        Args:
+            authenticated: Контекст зі storage state авторизованої сесії
+
+        Returns:
+            (context, page); якщо готових немає - створюються одразу
+        """
+        ready = self._ready.setdefault(authenticated, [])
+        if ready:
+            self.stats["hits"] += 1
+            return ready.pop(0)
+        self.stats["misses"] += 1
+        return self._create(authenticated)
+
+    def release(self, context: BrowserContext):
+        """Повернути використаний контекст: він буде закритий у maintain() між тестами"""
+        self._retired.append(context)
+
+    def _close_in_background(self, context: BrowserContext):
+        """
+        Запустити закриття контексту без очікування.
+        Sync API Playwright виконує запити в event loop, який крутиться під час будь-якого наступного виклику
+        Playwright, тому задача закриття завершується паралельно з поповненням пулу і наступним тестом
+        """
+        try:
+            task = context._loop.create_task(context._impl_obj.close())
+        except Exception:
+            # Реалізація sync API без event loop - закриваємо синхронно
+            try:
+                context.close()
+            except Exception:
+                pass
+            return
+        # Помилку закриття (напр. браузер вже закрито) забираємо, щоб asyncio не писав її в лог
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._closing.append(task)
+
+    def maintain(self):
+        """
+        Запустити закриття використаних контекстів у фоні і поповнити пул до size для кожного виду,
+        який вже запитували
+        """
+        retired, self._retired = self._retired, []
+        self._closing = [task for task in self._closing if not task.done()]
+        for context in retired:
+            for page in context.pages:
+                self._created_at.pop(id(page), None)
+            self._close_in_background(context)
+        for authenticated, ready in self._ready.items():
+            while len(ready) < self.size:
+                ready.append(self._create(authenticated))
+
+    def page_age_ms(self, page: Page) -> Optional[float]:
+        """Скільки мс тому сторінка створена пулом (None - сторінка не з пулу)"""
+        created = self._created_at.get(id(page))
+        return None if created is None else (time.perf_counter() - created) * 1000
+
+    def close(self):
+        """Закрити всі контексти пулу"""
+        for ready in self._ready.values():
+            self._retired.extend(context for context, _ in ready)
+            ready.clear()
+        self._ready.clear()
+        self.maintain()
+        pending = [task for task in self._closing if not task.done()]
+        if pending:
+            # Дочекатись фонового закриття до зупинки браузера
+            try:
+                self.browser._sync(asyncio.wait(pending))
+            except Exception:
+                pass
+        self._closing.clear()
+        print(f"\n>>> Пул контекстів: {self.stats}")
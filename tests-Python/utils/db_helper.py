@@ -2,10 +2,22 @@
 Утиліта для роботи з базою даних.
 Використовується для очищення тестових даних після виконання тестів.
 """
+import hashlib
+import threading
+import time
 import psycopg2
-from psycopg2 import sql
+from psycopg2 import errors, sql
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
-from typing import Optional
+from typing import List, Optional, Tuple
+
+
+# Перший ключ pg_advisory_lock(int, int): простір імен для лізингу ресурсів.
+# Другий ключ - lease_key(назва ресурсу); tests-ts має використовувати ту саму схему ключів.
+LEASE_NAMESPACE = 48151
+
+
+class LeaseTimeout(Exception):
+    """Ресурс не звільнився до дедлайну"""
 
 
 class DBHelper:
@@ -255,6 +267,214 @@ class DBHelper:
         except Exception as e:
             print(f"Помилка при перевірці існування фіду по URL: {e}")
             return False
+
+    def get_feeds_by_origin_url(self, url: str, exact: bool = True) -> List[Tuple[str, str, bool]]:
+        """
+        Отримати фіди за origin_url.
+        HUB зберігає origin_url з фрагментом #ufeed<feed_id>, тому URL без фрагмента теж знаходить фід.
+
+        Args:
+            url: origin_url з фрагментом #ufeed або без нього
+            exact: False - знайти всі фіди, origin_url яких містить url (напр. параметр фідів пулу)
+
+        Returns:
+            Список (feed_id, origin_url, is_active), найстаріші фіди першими
+        """
+        base_url = url.split("#ufeed")[0].strip()
+        if exact:
+            query = ("SELECT feed_id, origin_url, is_active FROM feed "
+                     "WHERE origin_url = %s OR origin_url = %s OR origin_url LIKE %s ORDER BY feed_id")
+            params = (url.strip(), base_url, f"{base_url}#ufeed%")
+        else:
+            query = "SELECT feed_id, origin_url, is_active FROM feed WHERE origin_url LIKE %s ORDER BY feed_id"
+            params = (f"%{base_url}%",)
+        self._ensure_connection()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query, params)
+            return [(str(feed_id).strip(), origin_url, is_active is True)
+                    for feed_id, origin_url, is_active in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    def get_feed_by_id(self, feed_id: str) -> Optional[Tuple[str, str, bool]]:
+        """
+        Отримати фід за feed_id
+
+        Returns:
+            (feed_id, origin_url, is_active) або None якщо фід не знайдено
+        """
+        self._ensure_connection()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SELECT feed_id, origin_url, is_active FROM feed WHERE feed_id = %s", (feed_id,))
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+        return (str(row[0]).strip(), row[1], row[2] is True) if row else None
+
+    @staticmethod
+    def lease_key(name: str) -> int:
+        """Другий ключ advisory lock для назви ресурсу: перші 4 байти sha1(name), невід'ємний int4"""
+        return int.from_bytes(hashlib.sha1(name.encode("utf-8")).digest()[:4], "big") & 0x7FFFFFFF
+    
+    def _ensure_connection(self):
+        """Підключитися до БД, якщо підключення ще немає"""
+        if not self.connection:
+            if not self.connect():
+                raise Exception("Не вдалося підключитися до БД")
+    
+    def _fetch_one(self, query: str, params: tuple):
+        """Виконати запит і повернути перше значення першого рядка"""
+        self._ensure_connection()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            cursor.close()
+    
+    def set_lease_owner(self, owner: str):
+        """
+        Підписати підключення (application_name), щоб інші бачили, хто тримає ресурс
+        
+        Args:
+            owner: Опис власника, напр. "tests-Python gw0 test_limit_3_active_feeds"
+        """
+        self._fetch_one("SELECT set_config('application_name', %s, false)", (owner[:63],))
+    
+    def try_acquire_lease(self, name: str, shared: bool = False) -> bool:
+        """
+        Одна неблокуюча спроба взяти advisory lock ресурсу (діє до release_lease або закриття підключення)
+        
+        Args:
+            name: Назва ресурсу (напр. "supplier:Парфюмс")
+            shared: Спільний лок (кілька читачів) замість ексклюзивного
+        
+        Returns:
+            True якщо лок отримано
+        """
+        function = "pg_try_advisory_lock_shared" if shared else "pg_try_advisory_lock"
+        return bool(self._fetch_one(f"SELECT {function}(%s, %s)", (LEASE_NAMESPACE, self.lease_key(name))))
+    
+    def release_lease(self, name: str, shared: bool = False) -> bool:
+        """Звільнити advisory lock ресурсу; False якщо це підключення його не тримало"""
+        function = "pg_advisory_unlock_shared" if shared else "pg_advisory_unlock"
+        return bool(self._fetch_one(f"SELECT {function}(%s, %s)", (LEASE_NAMESPACE, self.lease_key(name))))
+    
+    def get_lease_holders(self, name: str) -> List[str]:
+        """
+        Хто зараз тримає ресурс (application_name або pid підключень)
+        
+        Args:
+            name: Назва ресурсу
+        
+        Returns:
+            Список власників (порожній якщо ресурс вільний)
+        """
+        self._ensure_connection()
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT COALESCE(NULLIF(a.application_name, ''), 'pid ' || l.pid::text) "
+                "FROM pg_locks l JOIN pg_stat_activity a ON a.pid = l.pid "
+                "WHERE l.locktype = 'advisory' AND l.granted AND l.classid = %s AND l.objid = %s "
+                "AND l.objsubid = 2 AND l.pid <> pg_backend_pid()",
+                (LEASE_NAMESPACE, self.lease_key(name))
+            )
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    
+    def get_lease_queue_position(self, name: str, pid: Optional[int] = None) -> int:
+        """
+        Позиція підключення в черзі на ресурс (1 - наступний)
+        
+        Черга - очікувані (granted = false) advisory locks ресурсу в pg_locks; Postgres видає лок
+        у порядку черги, тому позиція - кількість підключень, що почали чекати раніше, плюс один.
+        
+        Args:
+            name: Назва ресурсу
+            pid: pid підключення, що чекає (за замовчуванням - це підключення)
+        """
+        ahead = self._fetch_one(
+            "SELECT count(*) FROM pg_locks l JOIN pg_stat_activity a ON a.pid = l.pid "
+            "WHERE l.locktype = 'advisory' AND NOT l.granted AND l.classid = %s AND l.objid = %s "
+            "AND l.objsubid = 2 AND l.pid <> COALESCE(%s, pg_backend_pid()) "
+            "AND a.query_start < (SELECT query_start FROM pg_stat_activity "
+            "WHERE pid = COALESCE(%s, pg_backend_pid()))",
+            (LEASE_NAMESPACE, self.lease_key(name), pid, pid)
+        )
+        return int(ahead or 0) + 1
+    
+    def _report_lease_wait(self, name: str, pid: int, stop: threading.Event, report_interval: float):
+        """
+        Періодично писати позицію в черзі та власників ресурсу, поки підключення pid чекає лок.
+        Працює в окремому потоці з окремим підключенням - основне заблоковане викликом pg_advisory_lock.
+        """
+        reporter = DBHelper(self.host, self.port, self.database, self.user, self.password)
+        try:
+            while not stop.wait(report_interval):
+                try:
+                    print(
+                        f"Очікування ресурсу '{name}': позиція в черзі {reporter.get_lease_queue_position(name, pid)}, "
+                        f"тримає: {', '.join(reporter.get_lease_holders(name)) or 'невідомо'}"
+                    )
+                except Exception as e:
+                    print(f"Не вдалося отримати чергу ресурсу '{name}': {e}")
+                    return
+        finally:
+            reporter.disconnect()
+    
+    def acquire_lease(self, name: str, shared: bool = False, timeout: float = 900,
+                      report_interval: float = 30) -> float:
+        """
+        Взяти advisory lock ресурсу, чекаючи в черзі не довше timeout
+        
+        Підключення блокується в pg_advisory_lock(_shared) під SET lock_timeout: Postgres ставить
+        його в чергу ресурсу, і ексклюзивний лок не відкладається безкінечно спільними, що
+        перекриваються. Поки ресурс зайнятий, у лог періодично пишеться позиція в черзі та власники.
+        
+        Args:
+            name: Назва ресурсу
+            shared: Спільний лок замість ексклюзивного
+            timeout: Максимальний час очікування в секундах
+            report_interval: Як часто писати позицію в черзі, секунди
+        
+        Returns:
+            Час очікування в секундах
+        
+        Raises:
+            LeaseTimeout: Якщо ресурс не звільнився до дедлайну
+        """
+        started = time.perf_counter()
+        if self.try_acquire_lease(name, shared):
+            return 0.0
+        
+        function = "pg_advisory_lock_shared" if shared else "pg_advisory_lock"
+        pid = self._fetch_one("SELECT pg_backend_pid()", ())
+        previous_timeout = self._fetch_one("SELECT current_setting('lock_timeout')", ())
+        stop = threading.Event()
+        reporter = threading.Thread(target=self._report_lease_wait, args=(name, pid, stop, report_interval),
+                                    daemon=True)
+        reporter.start()
+        try:
+            self._fetch_one("SELECT set_config('lock_timeout', %s, false)", (f"{max(int(timeout * 1000), 1)}ms",))
+            self._fetch_one(f"SELECT {function}(%s, %s)", (LEASE_NAMESPACE, self.lease_key(name)))
+        except errors.LockNotAvailable:
+            raise LeaseTimeout(
+                f"Ресурс '{name}' зайнятий довше {timeout} с (тримає: "
+                f"{', '.join(self.get_lease_holders(name)) or 'невідомо'})"
+            ) from None
+        finally:
+            stop.set()
+            reporter.join()
+            self._fetch_one("SELECT set_config('lock_timeout', %s, false)", (previous_timeout,))
+        
+        waited = round(time.perf_counter() - started, 3)
+        print(f"Ресурс '{name}' отримано через {waited} с")
+        return waited
     
     def __enter__(self):
         """Контекстний менеджер: вхід"""
@@ -3,34 +3,152 @@
 Містить методи для перевірки структури та даних в Excel файлах.
 """
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import openpyxl
 from openpyxl import load_workbook
 import requests
 import xml.etree.ElementTree as ET
 
 
+class SheetColumns:
+    """Заголовки вкладки, розв'язані в індекси колонок (один екземпляр на вкладку)"""
+    
+    __slots__ = ("headers", "index", "_wide_names")
+    
+    def __init__(self, headers: Tuple[str, ...]):
+        """
+        Args:
+            headers: Назви колонок у порядку вкладки
+        """
+        self.headers = headers
+        # Для дублікатів заголовків береться остання колонка (як у словнику рядка)
+        self.index = {name: i for i, name in enumerate(headers)}
+        self._wide_names: Dict[int, Tuple[str, ...]] = {}
+    
+    def names_for(self, width: int) -> Tuple[str, ...]:
+        """
+        Назви колонок для рядка заданої ширини.
+        Комірки за межами заголовків отримують назви Column_N (N - номер колонки), як порожні заголовки.
+        
+        Args:
+            width: Кількість значень у рядку
+        
+        Returns:
+            Кортеж назв (спільний для всіх рядків однакової ширини)
+        """
+        if width <= len(self.headers):
+            return self.headers
+        names = self._wide_names.get(width)
+        if names is None:
+            names = self.headers + tuple(f"Column_{i+1}" for i in range(len(self.headers), width))
+            self._wide_names[width] = names
+        return names
+    
+    def projector(self, columns: Optional[Sequence[str]] = None) -> Callable[[tuple], tuple]:
+        """
+        Побудувати функцію проєкції сирого рядка на задані колонки.
+        
+        Args:
+            columns: Назви колонок (None - всі колонки, включно з комірками за межами заголовків)
+        
+        Returns:
+            Функція, що повертає кортеж значень у порядку columns
+        """
+        if columns is None:
+            return tuple
+        
+        missing = [name for name in columns if name not in self.index]
+        if missing:
+            raise ValueError(f"Колонки не знайдено у вкладці: {', '.join(missing)}")
+        
+        indexes = [self.index[name] for name in columns]
+        if len(indexes) == 1:
+            only = indexes[0]
+            return lambda row: (row[only],)
+        return itemgetter(*indexes)
+
+
+class SheetRow:
+    """
+    Рядок вкладки з даними лише спроєктованих колонок.
+    Значення зберігаються кортежем, назви колонок спільні для всіх рядків вкладки.
+    """
+    
+    __slots__ = ("_names", "_positions", "values")
+    
+    def __init__(self, names: Tuple[str, ...], positions: Dict[str, int], values: tuple):
+        """
+        Args:
+            names: Назви колонок (спільний кортеж для всіх рядків)
+            positions: Індекс назва колонки -> позиція у values (спільний словник)
+            values: Значення рядка у порядку names
+        """
+        self._names = names
+        self._positions = positions
+        self.values = values
+    
+    @staticmethod
+    def positions_for(names: Sequence[str]) -> Dict[str, int]:
+        """Побудувати спільний індекс назва колонки -> позиція для рядків вкладки"""
+        return {name: i for i, name in enumerate(names)}
+    
+    def __getitem__(self, key: Union[str, int]) -> Any:
+        if isinstance(key, int):
+            return self.values[key]
+        return self.values[self._positions[key]]
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._positions
+    
+    def __iter__(self):
+        return iter(self.values)
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __repr__(self) -> str:
+        return f"SheetRow({self.as_dict()!r})"
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Отримати значення колонки за назвою (як dict.get)"""
+        position = self._positions.get(key)
+        return default if position is None else self.values[position]
+    
+    def keys(self) -> Tuple[str, ...]:
+        """Назви колонок рядка"""
+        return self._names
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Представлення рядка у вигляді словника {назва колонки: значення}"""
+        return dict(zip(self._names, self.values))
+
+
 class ExcelValidator:
     """Клас для валідації Excel файлів мапінгу"""
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, read_only: bool = True):
         """
         Ініціалізація валідатора Excel файлу
         
         Args:
             file_path: Шлях до Excel файлу
+            read_only: Потокове читання рядків без завантаження всієї вкладки в пам'ять (усі методи валідатора
+                читають рядки послідовно); False - для довільного доступу до клітинок (sheet.cell, merged_cells)
         """
         self.file_path = Path(file_path)
         if not self.file_path.exists():
             raise FileNotFoundError(f"Excel файл не знайдено: {file_path}")
         
+        self.read_only = read_only
         self.workbook = None
+        self._columns_cache: Dict[Tuple[str, int], SheetColumns] = {}
         self._load_workbook()
     
     def _load_workbook(self):
         """Завантажити Excel файл"""
         try:
-            self.workbook = load_workbook(self.file_path, data_only=True)
+            self.workbook = load_workbook(self.file_path, read_only=self.read_only, data_only=True)
         except Exception as e:
             raise Exception(f"Помилка при завантаженні Excel файлу: {e}")
     
@@ -80,48 +198,105 @@ class ExcelValidator:
         
         return all_found, missing_sheets
     
-    def read_sheet_data(self, sheet_name: str, header_row: int = 1) -> List[Dict[str, any]]:
+    def get_sheet_columns(self, sheet_name: str, header_row: int = 1) -> "SheetColumns":
         """
-        Прочитати дані з вкладки Excel файлу
+        Отримати заголовки вкладки, розв'язані в індекси колонок.
+        Заголовки читаються один раз на (вкладка, рядок заголовків) і кешуються.
         
         Args:
             sheet_name: Назва вкладки
             header_row: Номер рядка з заголовками (за замовчуванням 1)
         
         Returns:
-            Список словників, де кожен словник - це рядок з даними
-            Ключі словника - назви колонок з заголовків
+            SheetColumns з назвами колонок та їх індексами
         """
         if not self.sheet_exists(sheet_name):
             raise ValueError(f"Вкладка '{sheet_name}' не знайдена в Excel файлі")
         
-        sheet = self.workbook[sheet_name]
-        data = []
+        cache_key = (sheet_name, header_row)
+        columns = self._columns_cache.get(cache_key)
+        if columns is None:
+            sheet = self.workbook[sheet_name]
+            header_cells = next(
+                sheet.iter_rows(min_row=header_row, max_row=header_row, values_only=True),
+                ()
+            )
+            columns = SheetColumns(tuple(
+                str(cell).strip() if cell else f"Column_{i+1}"
+                for i, cell in enumerate(header_cells)
+            ))
+            self._columns_cache[cache_key] = columns
+        return columns
+    
+    def iter_sheet_rows(self, sheet_name: str, header_row: int = 1,
+                        columns: Optional[Sequence[str]] = None) -> Iterator[tuple]:
+        """
+        Ітерувати рядки даних вкладки як кортежі значень спроєктованих колонок.
+        Порожні рядки пропускаються.
+        
+        Args:
+            sheet_name: Назва вкладки
+            header_row: Номер рядка з заголовками (за замовчуванням 1)
+            columns: Назви колонок для проєкції (за замовчуванням - всі колонки)
         
-        # Читаємо заголовки
-        headers = []
-        header_row_data = list(sheet.iter_rows(min_row=header_row, max_row=header_row, values_only=True))
-        if header_row_data:
-            headers = [str(cell).strip() if cell else f"Column_{i+1}" 
-                      for i, cell in enumerate(header_row_data[0])]
+        Yields:
+            Кортеж значень у порядку columns. Без columns рядок, ширший за заголовки, повертається
+            повністю (назви зайвих колонок - SheetColumns.names_for)
+        """
+        sheet_columns = self.get_sheet_columns(sheet_name, header_row)
+        project = sheet_columns.projector(columns)
+        sheet = self.workbook[sheet_name]
+        width = len(sheet_columns.headers)
         
-        # Читаємо дані
-        for row_idx, row in enumerate(sheet.iter_rows(min_row=header_row + 1, values_only=True), start=header_row + 1):
+        for row in sheet.iter_rows(min_row=header_row + 1, values_only=True):
             # Пропускаємо порожні рядки
-            if not any(cell for cell in row):
+            if not any(row):
                 continue
-            
-            row_data = {}
-            for col_idx, cell_value in enumerate(row):
-                header_name = headers[col_idx] if col_idx < len(headers) else f"Column_{col_idx+1}"
-                row_data[header_name] = cell_value
-            
-            if row_data:
-                data.append(row_data)
+            # У read-only режимі рядок без значень у кінцевих колонках коротший за заголовки
+            if len(row) < width:
+                row = row + (None,) * (width - len(row))
+            yield project(row)
+    
+    def read_sheet_data(self, sheet_name: str, header_row: int = 1,
+                        columns: Optional[Sequence[str]] = None,
+                        as_dict: bool = False) -> List[Union["SheetRow", Dict[str, Any]]]:
+        """
+        Прочитати дані з вкладки Excel файлу
+        
+        Args:
+            sheet_name: Назва вкладки
+            header_row: Номер рядка з заголовками (за замовчуванням 1)
+            columns: Назви колонок для проєкції (за замовчуванням - всі колонки)
+            as_dict: Повернути рядки як словники (повільніше, більше пам'яті)
         
+        Returns:
+            Список рядків SheetRow (доступ за назвою колонки: row["Назва"], row.get(...)).
+            При as_dict=True - список словників, ключі - назви колонок з заголовків
+        """
+        sheet_columns = self.get_sheet_columns(sheet_name, header_row)
+        rows = self.iter_sheet_rows(sheet_name, header_row, columns)
+        if columns is not None:
+            names = tuple(columns)
+            if as_dict:
+                return [dict(zip(names, values)) for values in rows]
+            positions = SheetRow.positions_for(names)
+            return [SheetRow(names, positions, values) for values in rows]
+        
+        # Рядки, ширші за заголовки, зберігають зайві комірки під назвами Column_N
+        if as_dict:
+            return [dict(zip(sheet_columns.names_for(len(values)), values)) for values in rows]
+        
+        positions_by_names: Dict[Tuple[str, ...], Dict[str, int]] = {}
+        data = []
+        for values in rows:
+            names = sheet_columns.names_for(len(values))
+            positions = positions_by_names.get(names)
+            if positions is None:
+                positions = positions_by_names[names] = SheetRow.positions_for(names)
+            data.append(SheetRow(names, positions, values))
         return data
     
-    def get_categories_data(self, sheet_name: str = "Категорія+") -> List[Dict[str, any]]:
+    def get_categories_data(self, sheet_name: str = "Категорія+") -> List["SheetRow"]:
         """
         Отримати дані категорій з вкладки "Категорія+"
         
@@ -129,7 +304,7 @@ class ExcelValidator:
             sheet_name: Назва вкладки з категоріями (за замовчуванням "Категорія+")
         
         Returns:
-            Список словників з даними категорій
+            Список рядків SheetRow з даними категорій
             Очікувані колонки: ID категорії з фід, Назва категорії з фід, тощо
         """
         if not self.sheet_exists(sheet_name):
@@ -137,63 +312,72 @@ class ExcelValidator:
         
         return self.read_sheet_data(sheet_name)
     
-    def get_category_id_and_name_from_feed(self, sheet_name: str = "Категорія+") -> List[Tuple[str, str]]:
+    @staticmethod
+    def _resolve_category_columns(headers: Sequence[str]) -> Tuple[Optional[str], Optional[str]]:
         """
-        Отримати список пар (ID категорії з фід, Назва категорії з фід) з вкладки.
-        Підтримує різні варіанти назв колонок та заголовок у рядках 1 або 2.
+        Визначити колонки ID та назви категорії з фіду за заголовками вкладки.
         
         Returns:
-            Список кортежів (category_id_from_feed, category_name_from_feed)
+            Tuple (назва_колонки_id, назва_колонки_назви), None якщо не визначено
         """
-        for header_row in (1, 2):
-            categories_data = self.read_sheet_data(sheet_name, header_row=header_row)
-            result = []
-            id_key = None
-            name_key = None
-            
-            if not categories_data:
+        unique_headers = list(dict.fromkeys(headers))
+        keys_lower = {k.lower(): k for k in unique_headers}
+        id_key = None
+        name_key = None
+        
+        # Визначаємо колонку ID: містить "id" та (опційно) "фід"/"feed"/"категор"
+        for k in keys_lower:
+            if 'id' not in k:
                 continue
-            
-            first_row = categories_data[0]
-            keys_lower = {k.lower(): k for k in first_row.keys()}
-            
-            # Визначаємо колонку ID: містить "id" та (опційно) "фід"/"feed"/"категор"
+            if any(x in k for x in ('фід', 'feed', 'категор', 'category')):
+                id_key = keys_lower[k]
+                break
+        if not id_key:
             for k in keys_lower:
-                if 'id' not in k:
-                    continue
-                if any(x in k for x in ('фід', 'feed', 'категор', 'category')):
+                if k in ('id', 'id категорії', 'category id', 'id з фід'):
                     id_key = keys_lower[k]
                     break
-            if not id_key:
-                for k in keys_lower:
-                    if k in ('id', 'id категорії', 'category id', 'id з фід'):
-                        id_key = keys_lower[k]
-                        break
-            if not id_key and len(keys_lower) >= 1:
-                id_key = list(first_row.keys())[0]
-            
-            # Визначаємо колонку назви: "Назва категорії з фід" або "Категорії фіду" (друга колонка у файлі)
+        if not id_key and len(keys_lower) >= 1:
+            id_key = unique_headers[0]
+        
+        # Визначаємо колонку назви: "Назва категорії з фід" або "Категорії фіду" (друга колонка у файлі)
+        for k in keys_lower:
+            if ('назва' in k or 'name' in k) and any(x in k for x in ('фід', 'feed', 'категор', 'category')):
+                name_key = keys_lower[k]
+                break
+        if not name_key:
             for k in keys_lower:
-                if ('назва' in k or 'name' in k) and any(x in k for x in ('фід', 'feed', 'категор', 'category')):
+                if k in ('назва', 'name', 'назва категорії', 'category name', 'категорії фіду', 'категорії фід'):
                     name_key = keys_lower[k]
                     break
-            if not name_key:
-                for k in keys_lower:
-                    if k in ('назва', 'name', 'назва категорії', 'category name', 'категорії фіду', 'категорії фід'):
-                        name_key = keys_lower[k]
-                        break
-            if not name_key:
-                # "Категорії фіду" — друга колонка (назви категорій з фіду)
-                for k in keys_lower:
-                    if 'категор' in k and 'фід' in k and 'id' not in k:
-                        name_key = keys_lower[k]
-                        break
-            if not name_key and len(keys_lower) >= 2:
-                name_key = list(first_row.keys())[1]
+        if not name_key:
+            # "Категорії фіду" — друга колонка (назви категорій з фіду)
+            for k in keys_lower:
+                if 'категор' in k and 'фід' in k and 'id' not in k:
+                    name_key = keys_lower[k]
+                    break
+        if not name_key and len(keys_lower) >= 2:
+            name_key = unique_headers[1]
+        
+        return id_key, name_key
+    
+    def get_category_id_and_name_from_feed(self, sheet_name: str = "Категорія+") -> List[Tuple[str, str]]:
+        """
+        Отримати список пар (ID категорії з фід, Назва категорії з фід) з вкладки.
+        Підтримує різні варіанти назв колонок та заголовок у рядках 1 або 2.
+        Колонки визначаються один раз за заголовками, рядки читаються як кортежі з двох значень.
+        
+        Returns:
+            Список кортежів (category_id_from_feed, category_name_from_feed)
+        """
+        for header_row in (1, 2):
+            headers = self.get_sheet_columns(sheet_name, header_row).headers
+            id_key, name_key = self._resolve_category_columns(headers)
+            if not id_key or not name_key:
+                continue
             
-            for row in categories_data:
-                vid = row.get(id_key) if id_key else None
-                vname = row.get(name_key) if name_key else None
+            result = []
+            for vid, vname in self.iter_sheet_rows(sheet_name, header_row, columns=(id_key, name_key)):
                 if vid is not None and vname is not None:
                     sid = str(vid).strip()
                     sname = str(vname).strip()
@@ -208,7 +392,7 @@ class ExcelValidator:
             return []
         sheet = self.workbook[sheet_name]
         result = []
-        for row in sheet.iter_rows(min_row=1, values_only=True):
+        for row in sheet.iter_rows(min_row=1, max_col=2, values_only=True):
             if not row or len(row) < 2:
                 continue
             c0, c1 = row[0], row[1]
@@ -376,6 +560,7 @@ class ExcelValidator:
         if self.workbook:
             self.workbook.close()
             self.workbook = None
+        self._columns_cache.clear()
     
     def __enter__(self):
         """Контекстний менеджер - входження"""
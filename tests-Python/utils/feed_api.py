@@ -0,0 +1,356 @@
+"""
+Клієнт API XML-фідів HUB для підготовки даних у тестах (arrange/cleanup без UI).
+Фіди зберігаються handler-ом set-feeds (src/hub/api/handlers/supplier.clj, схема SupplierFeeds): upsert за
+origin_url, тобто той самий запит створює фід або змінює налаштування існуючого. API списку і видалення фідів
+HUB не має, тому feed_id і поточний стан фіду читаються з БД (FeedStore), там же фід і видаляється.
+Запити йдуть через page.request - з cookies авторизованого контексту Playwright, тому викликати клієнт можна
+лише після логіну. Для паралельних запитів з потоків (sync API Playwright цього не дозволяє)
+є RequestsApiContext на requests з cookies зі storage state.
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+from playwright.sync_api import APIRequestContext, APIResponse
+from playwright.sync_api import Error as PlaywrightError
+
+from utils.db_helper import DBHelper
+from utils.feed_list_model import FeedRecord
+
+
+class FeedApiError(Exception):
+    """Помилка виклику API фідів (неуспішний статус або неочікувана відповідь)"""
+
+    def __init__(self, message: str, status: int = 0, body: str = ""):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class _RequestsResponse:
+    """Відповідь requests з тим самим інтерфейсом, що й APIResponse Playwright (ok, status, headers, text, json)"""
+
+    def __init__(self, response: requests.Response):
+        self._response = response
+        self.ok = response.ok
+        self.status = response.status_code
+        self.headers = {key.lower(): value for key, value in response.headers.items()}
+
+    def text(self) -> str:
+        return self._response.text
+
+    def json(self) -> Any:
+        return self._response.json()
+
+
+class RequestsApiContext:
+    """
+    Заміна APIRequestContext для FeedApiClient на requests: cookies зі storage state авторизованої
+    сесії, окрема requests.Session на кожен потік. Дозволяє викликати API з ThreadPoolExecutor.
+    """
+
+    def __init__(self, storage_state_path: str):
+        """
+        Ініціалізація контексту
+
+        Args:
+            storage_state_path: Файл storage state (AuthSession.ensure_state())
+        """
+        state = json.loads(Path(storage_state_path).read_text(encoding="utf-8"))
+        self._cookies = state.get("cookies", [])
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """requests.Session поточного потоку з cookies сесії"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            for cookie in self._cookies:
+                session.cookies.set(cookie["name"], cookie["value"],
+                                    domain=cookie.get("domain", ""), path=cookie.get("path", "/"))
+            self._local.session = session
+        return session
+
+    def storage_state(self) -> Dict[str, Any]:
+        """Cookies сесії у форматі storage state (для CSRF-заголовка)"""
+        return {"cookies": self._cookies}
+
+    def fetch(self, url: str, method: str = "GET", data: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, str]] = None, timeout: float = 15000) -> _RequestsResponse:
+        """Виконати запит (аргументи як у APIRequestContext.fetch, timeout у мс)"""
+        response = self._session().request(method, url, json=data, headers=headers, timeout=timeout / 1000)
+        return _RequestsResponse(response)
+
+
+class FeedStore:
+    """
+    Стан фідів з таблиці feed у БД HUB: feed_id за origin_url, is_active, видалення.
+    Одне підключення на всіх, запити з кількох потоків (FeedPool) виконуються по черзі.
+    """
+
+    def __init__(self, db: Optional[DBHelper]):
+        """
+        Ініціалізація сховища
+
+        Args:
+            db: Підключення до БД HUB (None - БД не налаштована, будь-який запит дасть FeedApiError)
+        """
+        self.db = db
+        self._lock = threading.Lock()
+
+    def _query(self, action: str, function, *args):
+        """Виконати запит DBHelper під локом; помилки БД -> FeedApiError"""
+        if self.db is None:
+            raise FeedApiError(f"{action}: БД не налаштована (TEST_DB_HOST, TEST_DB_NAME)")
+        with self._lock:
+            try:
+                return function(*args)
+            except Exception as e:
+                raise FeedApiError(f"{action}: {e}") from e
+
+    @staticmethod
+    def _record(row: Tuple[str, str, bool]) -> FeedRecord:
+        feed_id, origin_url, is_active = row
+        return FeedRecord(feed_id=feed_id, origin_url=origin_url, is_active=is_active, last_upload=None,
+                          raw={"feed_id": feed_id, "origin_url": origin_url, "is_active": is_active})
+
+    def find(self, origin_url: str) -> Optional[FeedRecord]:
+        """Фід з таким origin_url (з фрагментом #ufeed або без нього) або None"""
+        rows = self._query(f"Пошук фіду '{origin_url}'", self.db.get_feeds_by_origin_url, origin_url)
+        return self._record(rows[0]) if rows else None
+
+    def find_all(self, url_part: str) -> List[FeedRecord]:
+        """Фіди, origin_url яких містить url_part"""
+        rows = self._query(f"Пошук фідів '{url_part}'", self.db.get_feeds_by_origin_url, url_part, False)
+        return [self._record(row) for row in rows]
+
+    def get(self, feed_id: str) -> Optional[FeedRecord]:
+        """Фід за feed_id або None"""
+        row = self._query(f"Фід {feed_id}", self.db.get_feed_by_id, feed_id.strip())
+        return self._record(row) if row else None
+
+    def delete(self, feed_id: str):
+        """Видалити фід"""
+        self._query(f"Видалення фіду {feed_id}", self.db.delete_feed_by_id, feed_id.strip())
+
+    def close(self):
+        """Закрити підключення до БД"""
+        if self.db is not None:
+            self.db.disconnect()
+
+
+class FeedApiClient:
+    """Створення, увімкнення та вимкнення фідів напряму через set-feeds"""
+
+    def __init__(self, request: APIRequestContext, set_feeds_url: str, store: FeedStore, timeout: int = 15000):
+        """
+        Ініціалізація клієнта
+
+        Args:
+            request: APIRequestContext авторизованого контексту (page.request) або RequestsApiContext
+            set_feeds_url: URL handler-а set-feeds (TestConfig.SET_FEEDS_API_URL)
+            store: Стан фідів (FeedStore з БД HUB або сховище локальної заміни HUB)
+            timeout: Таймаут одного запиту в мс
+        """
+        self.request = request
+        self.set_feeds_url = set_feeds_url
+        self.store = store
+        self.timeout = timeout
+
+    def _headers(self) -> Dict[str, str]:
+        """Заголовки запиту: JSON і CSRF-токен з cookies контексту (якщо він є)"""
+        headers = {"Accept": "application/json"}
+        try:
+            cookies = self.request.storage_state().get("cookies", [])
+        except Exception:
+            cookies = []
+        for cookie in cookies:
+            if cookie.get("name") in ("csrftoken", "XSRF-TOKEN"):
+                headers["X-CSRFToken"] = cookie["value"]
+                headers["X-XSRF-TOKEN"] = cookie["value"]
+                break
+        return headers
+
+    def set_feed(self, origin_url: str, **settings: Any) -> Any:
+        """
+        Зберегти фід через set-feeds: створити новий або оновити налаштування фіду з таким origin_url
+
+        Args:
+            origin_url: URL фіду (для існуючого - origin_url з БД, з фрагментом #ufeed)
+            **settings: Поля SupplierFeeds (is_active, update_stock, update_price, price_type, ...)
+
+        Returns:
+            Розібрана JSON-відповідь (None якщо тіло порожнє)
+
+        Raises:
+            FeedApiError: Якщо запит не виконався, статус не 2xx, відповідь не JSON або HUB повернув status=fail
+        """
+        url = self.set_feeds_url
+        data = {"origin_url": origin_url, **settings}
+        try:
+            response: APIResponse = self.request.fetch(
+                url, method="POST", data=data, headers=self._headers(), timeout=self.timeout
+            )
+        except (PlaywrightError, requests.RequestException) as e:
+            raise FeedApiError(f"POST {url}: {e}") from e
+        body = response.text()
+        if not response.ok:
+            raise FeedApiError(f"POST {url} -> {response.status}: {body[:500]}", response.status, body[:500])
+        if not body.strip():
+            return None
+        # HTML з 200 (сторінка SPA на невідомий шлях) - TEST_SET_FEEDS_API_URL не вказує на handler
+        if "json" not in response.headers.get("content-type", ""):
+            raise FeedApiError(f"POST {url} -> {response.status}: відповідь не JSON (перевірте TEST_SET_FEEDS_API_URL)",
+                               response.status, body[:500])
+        payload = response.json()
+        if isinstance(payload, dict) and payload.get("status") == "fail":
+            raise FeedApiError(f"POST {url}: {payload.get('message') or payload.get('code')}",
+                               response.status, body[:500])
+        return payload
+
+    def get_feed(self, feed_id: str) -> FeedRecord:
+        """
+        Поточний стан фіду
+
+        Raises:
+            FeedApiError: Якщо фіду немає
+        """
+        record = self.store.get(feed_id)
+        if record is None:
+            raise FeedApiError(f"Фід {feed_id} не знайдено")
+        return record
+
+    def create_feed(self, origin_url: str, is_active: bool = False) -> FeedRecord:
+        """
+        Створити фід (якщо фід з таким URL вже є - set-feeds оновить його)
+
+        Args:
+            origin_url: URL XML-фіду
+            is_active: Увімкнути "Завантажити товари з xml"
+
+        Returns:
+            Запис збереженого фіду (feed_id і origin_url з #ufeed з БД)
+        """
+        self.set_feed(origin_url, is_active=is_active)
+        record = self.store.find(origin_url)
+        if record is None:
+            raise FeedApiError(f"Фід з URL '{origin_url}' не знайдено після збереження")
+        return record
+
+    def ensure_feed(self, origin_url: str, is_active: Optional[bool] = None) -> Tuple[str, Optional[FeedRecord]]:
+        """
+        Повернути feed_id фіду з таким URL, створивши його якщо немає
+
+        Args:
+            origin_url: URL XML-фіду
+            is_active: Бажаний стан фіду (None - не змінювати стан існуючого)
+
+        Returns:
+            (feed_id, запис фіду до виклику - None якщо фід щойно створено)
+        """
+        record = self.store.find(origin_url)
+        if record is None:
+            return self.create_feed(origin_url, is_active=bool(is_active)).feed_id, None
+        if is_active is not None and record.is_active != is_active:
+            self.set_feed(record.origin_url, is_active=is_active)
+        return record.feed_id, record
+
+    def set_active(self, feed_id: str, is_active: bool) -> FeedRecord:
+        """
+        Увімкнути або вимкнути фід ("Завантажити товари з xml"), якщо він ще не в цьому стані.
+        Ліміт "3 активні фіди" діє і тут - буде FeedApiError
+
+        Returns:
+            Запис фіду до виклику (previous.is_active == is_active - стан не змінювався)
+        """
+        record = self.get_feed(feed_id)
+        if record.is_active != is_active:
+            self.set_feed(record.origin_url, is_active=is_active)
+        return record
+
+    def activate_feed(self, feed_id: str) -> FeedRecord:
+        """Увімкнути фід (див. set_active)"""
+        return self.set_active(feed_id, True)
+
+    def deactivate_feed(self, feed_id: str) -> FeedRecord:
+        """Вимкнути фід (див. set_active)"""
+        return self.set_active(feed_id, False)
+
+    def delete_feed(self, feed_id: str):
+        """Видалити фід (API видалення в HUB немає - через БД)"""
+        self.store.delete(feed_id)
+
+
+class FeedFactory:
+    """
+    Фабрика фідів для arrange-кроків тесту: запам'ятовує фіди, стан яких вона справді змінила
+    (створені - видаляються, увімкнені нею - вимикаються), тому cleanup не чіпає фіди, що вже були увімкнені
+    """
+
+    def __init__(self, api: FeedApiClient):
+        """
+        Ініціалізація фабрики
+
+        Args:
+            api: Клієнт API фідів
+        """
+        self.api = api
+        self.created: List[str] = []
+        self.activated: List[str] = []
+
+    def create(self, origin_url: str, is_active: bool = False) -> str:
+        """
+        Створити фід (буде видалений у cleanup). set-feeds - upsert за URL, тому фід, що вже був з таким URL,
+        не видаляється, а лише повертається до попереднього стану (див. ensure)
+        """
+        return self.ensure(origin_url, is_active=is_active)
+
+    def ensure(self, origin_url: str, is_active: Optional[bool] = None) -> str:
+        """
+        Гарантувати наявність фіду з URL. Створений тут фід буде видалений у cleanup,
+        існуючий фід, увімкнений тут, - вимкнений; фід, що вже був увімкнений, cleanup не чіпає.
+        """
+        feed_id, previous = self.api.ensure_feed(origin_url, is_active=is_active)
+        if previous is None:
+            self.created.append(feed_id)
+        elif is_active and previous.is_active is not True:
+            self.activated.append(feed_id)
+        return feed_id
+
+    def activate(self, feed_id: str) -> bool:
+        """
+        Увімкнути існуючий фід
+
+        Returns:
+            True якщо фід увімкнено тут (буде вимкнений у cleanup), False якщо він вже був увімкнений
+        """
+        previous = self.api.activate_feed(feed_id)
+        if previous.is_active:
+            return False
+        self.activated.append(feed_id)
+        return True
+
+    def cleanup(self) -> List[str]:
+        """
+        Вимкнути увімкнені і видалити створені фіди
+
+        Returns:
+            Список помилок cleanup (порожній якщо все успішно)
+        """
+        errors = []
+        for feed_id in self.activated:
+            if feed_id in self.created:
+                continue
+            try:
+                self.api.deactivate_feed(feed_id)
+            except FeedApiError as e:
+                errors.append(f"{feed_id}: {e}")
+        for feed_id in self.created:
+            try:
+                self.api.delete_feed(feed_id)
+            except FeedApiError as e:
+                errors.append(f"{feed_id}: {e}")
+        self.created.clear()
+        self.activated.clear()
+        return errors
@@ -0,0 +1,206 @@
+"""
+Генератор синтетичних XML-фідів (YML) довільного розміру.
+Фід віддається частинами (bytes), тому повний документ ніколи не будується в пам'яті.
+"""
+import codecs
+import random
+from pathlib import Path
+from typing import Iterator, List, Tuple
+from xml.parsers import expat
+from xml.sax.saxutils import escape, quoteattr
+
+
+_CATEGORY_WORDS = [
+    "Парфуми", "Догляд", "Косметика", "Аксесуари", "Текстиль", "Взуття",
+    "Одяг", "Дім", "Сад", "Іграшки", "Спорт", "Посуд", "Прикраси", "Сумки",
+]
+_VENDORS = ["Kasta", "Acme", "Nordic", "Verde", "Lumen", "Orion", "Tessa"]
+_COLORS = ["чорний", "білий", "червоний", "синій", "зелений", "бежевий"]
+
+# Базовий ID категорій (як у реальних фідах: <category id="1000">)
+CATEGORY_ID_BASE = 1000
+
+
+def _declared_encoding(encoding: str) -> str:
+    """Назва кодування для XML-декларації (utf-8-sig - це UTF-8 з BOM, такої назви в XML немає)"""
+    return "UTF-8" if codecs.lookup(encoding).name == "utf-8-sig" else encoding.upper()
+
+
+def _check_encoding(encoding: str):
+    """
+    Перевірити, що фід у цьому кодуванні можна розібрати XML-парсером (expat)
+
+    Python вміє кодувати utf-32, але expat такий документ не читає - фід був би невалідним для HUB.
+
+    Raises:
+        ValueError: Якщо кодування невідоме або expat його не підтримує
+    """
+    try:
+        declared = _declared_encoding(encoding)
+    except LookupError as e:
+        raise ValueError(f"Невідоме кодування: {encoding}") from e
+    probe = f'<?xml version="1.0" encoding="{declared}"?>\n<shop>Каста</shop>'
+    try:
+        expat.ParserCreate().Parse(probe.encode(encoding), True)
+    except (expat.ExpatError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Кодування {encoding} не підтримується XML-парсером: {e}") from e
+
+
+class YmlFeedGenerator:
+    """Потоковий генератор YML-фіду з налаштовуваними розмірами"""
+
+    def __init__(self, categories: int = 10, offers: int = 100, images_per_offer: int = 1,
+                 category_depth: int = 1, encoding: str = "utf-8", seed: int = 0,
+                 shop_name: str = "Synthetic feed"):
+        """
+        Ініціалізація генератора фіду
+
+        Args:
+            categories: Кількість категорій
+            offers: Кількість товарів (offer)
+            images_per_offer: Кількість <picture> на товар
+            category_depth: Глибина дерева категорій (1 - плоский список)
+            encoding: Кодування документа (utf-8, utf-16, windows-1251, ...; utf-32 expat не підтримує)
+            seed: Зерно генератора випадкових чисел (однаковий seed - однаковий фід)
+            shop_name: Назва магазину в <shop><name>
+        """
+        if categories < 1:
+            raise ValueError(f"Кількість категорій має бути >= 1, отримано: {categories}")
+        if offers < 0 or images_per_offer < 0:
+            raise ValueError("Кількість товарів і зображень не може бути від'ємною")
+        if category_depth < 1:
+            raise ValueError(f"Глибина категорій має бути >= 1, отримано: {category_depth}")
+        # Перевіряємо кодування до початку стрімінгу
+        _check_encoding(encoding)
+
+        self.categories = categories
+        self.offers = offers
+        self.images_per_offer = images_per_offer
+        self.category_depth = min(category_depth, categories)
+        self.encoding = encoding
+        self.seed = seed
+        self.shop_name = shop_name
+
+    @property
+    def _level_size(self) -> int:
+        """Кількість категорій на одному рівні дерева"""
+        return -(-self.categories // self.category_depth)
+
+    def iter_categories(self) -> Iterator[Tuple[str, str, str]]:
+        """
+        Категорії фіду
+
+        Yields:
+            Tuple (category_id, parent_id або "", назва)
+        """
+        level_size = self._level_size
+        for i in range(self.categories):
+            category_id = str(CATEGORY_ID_BASE + i)
+            parent_id = str(CATEGORY_ID_BASE + i - level_size) if i >= level_size else ""
+            name = f"{_CATEGORY_WORDS[i % len(_CATEGORY_WORDS)]} {category_id}"
+            yield category_id, parent_id, name
+
+    def get_categories(self) -> List[Tuple[str, str]]:
+        """
+        Список пар (category_id, назва) - у форматі ExcelValidator._extract_categories_from_xml
+
+        Returns:
+            Список кортежів (category_id, category_name)
+        """
+        return [(category_id, name) for category_id, _, name in self.iter_categories()]
+
+    def _leaf_category_ids(self) -> range:
+        """Діапазон ID категорій останнього рівня (до них прив'язуються товари)"""
+        level_size = self._level_size
+        first_leaf = ((self.categories - 1) // level_size) * level_size
+        return range(CATEGORY_ID_BASE + first_leaf, CATEGORY_ID_BASE + self.categories)
+
+    def iter_text(self) -> Iterator[str]:
+        """
+        Фрагменти XML-документа у вигляді рядків
+
+        Yields:
+            Частина документа (шапка, категорія, товар, ...)
+        """
+        yield f'<?xml version="1.0" encoding="{_declared_encoding(self.encoding)}"?>\n'
+        yield '<yml_catalog date="2024-01-01 00:00">\n<shop>\n'
+        yield f"<name>{escape(self.shop_name)}</name>\n"
+        yield '<currencies>\n<currency id="UAH" rate="1"/>\n</currencies>\n'
+
+        yield "<categories>\n"
+        for category_id, parent_id, name in self.iter_categories():
+            parent_attr = f" parentId={quoteattr(parent_id)}" if parent_id else ""
+            yield f"<category id={quoteattr(category_id)}{parent_attr}>{escape(name)}</category>\n"
+        yield "</categories>\n"
+
+        rnd = random.Random(self.seed)
+        leaf_ids = self._leaf_category_ids()
+        yield "<offers>\n"
+        for i in range(self.offers):
+            offer_id = f"offer-{i}"
+            category_id = leaf_ids[rnd.randrange(len(leaf_ids))]
+            color = rnd.choice(_COLORS)
+            pictures = "".join(
+                f"<picture>https://example.com/img/{offer_id}/{n}.jpg</picture>"
+                for n in range(self.images_per_offer)
+            )
+            yield (
+                f'<offer id="{offer_id}" available="{"true" if rnd.random() < 0.9 else "false"}">'
+                f"<url>https://example.com/p/{offer_id}</url>"
+                f"<price>{rnd.randint(50, 5000)}</price>"
+                f"<currencyId>UAH</currencyId>"
+                f"<categoryId>{category_id}</categoryId>"
+                f"{pictures}"
+                f"<vendor>{rnd.choice(_VENDORS)}</vendor>"
+                f"<name>{escape(f'Товар {i} {color}')}</name>"
+                f"<param name=\"Колір\">{color}</param>"
+                f"<description>{escape(f'Опис товару {i} & деталі')}</description>"
+                f"</offer>\n"
+            )
+        yield "</offers>\n</shop>\n</yml_catalog>\n"
+
+    def iter_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """
+        Документ у вигляді закодованих частин приблизно chunk_size байт
+
+        Args:
+            chunk_size: Бажаний розмір частини в байтах
+
+        Yields:
+            Частина документа в кодуванні self.encoding
+        """
+        # Один кодувальник на документ: BOM (utf-16, utf-8-sig) пишеться лише на початку.
+        # Символи, відсутні в кодуванні (напр. в windows-1251), замінюються на &#NNN;
+        encoder = codecs.getincrementalencoder(self.encoding)(errors="xmlcharrefreplace")
+        buffer: List[bytes] = []
+        buffered = 0
+        for text in self.iter_text():
+            data = encoder.encode(text)
+            buffer.append(data)
+            buffered += len(data)
+            if buffered >= chunk_size:
+                yield b"".join(buffer)
+                buffer.clear()
+                buffered = 0
+        buffer.append(encoder.encode("", final=True))
+        if any(buffer):
+            yield b"".join(buffer)
+
+    def write_to(self, file_path: str) -> int:
+        """
+        Записати фід у файл потоково
+
+        Args:
+            file_path: Шлях до файлу
+
+        Returns:
+            Розмір записаного файлу в байтах
+        """
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = 0
+        with open(path, "wb") as f:
+            for chunk in self.iter_chunks():
+                f.write(chunk)
+                written += len(chunk)
+        return written
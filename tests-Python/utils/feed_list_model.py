@@ -0,0 +1,156 @@
+"""
+Модель списку XML-фідів, побудована з JSON-відповіді HUB API (таблиця на /supplier-content/xml).
+Пошук фіду за ID або URL - через словники, без DOM-скрапінгу і регулярних евристик.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+
+# Можливі назви полів у відповіді API (перша - як колонка в таблиці feed у БД)
+FEED_ID_KEYS = ("feed_id", "feedId", "id")
+ORIGIN_URL_KEYS = ("origin_url", "originUrl", "feed_url", "url", "link")
+IS_ACTIVE_KEYS = ("is_active", "isActive", "active", "enabled")
+LAST_UPLOAD_KEYS = ("last_upload", "lastUpload", "last_upload_at", "last_load_at", "loaded_at", "updated_at")
+# Ключі-обгортки, під якими API може повертати список
+LIST_KEYS = ("feeds", "items", "data", "results", "rows")
+
+
+def _first_present(item: Dict[str, Any], keys) -> Any:
+    """Значення першого присутнього ключа (або None)"""
+    for key in keys:
+        if key in item and item[key] is not None:
+            return item[key]
+    return None
+
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """ISO-рядок або unix-час (с/мс) -> datetime; інше -> None"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value / 1000 if value > 10 ** 11 else value)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return None
+
+
+def normalize_feed_url(url: str) -> str:
+    """
+    Ключ для індексу за URL: без фрагмента #ufeed<feed_id>, який HUB додає до origin_url,
+    пробілів по краях і кінцевого '/'
+    """
+    return (url or "").split("#ufeed")[0].strip().rstrip("/")
+
+
+class FeedRecord:
+    """Один фід зі списку: feed_id, origin_url, is_active, час останнього завантаження"""
+
+    __slots__ = ("feed_id", "origin_url", "is_active", "last_upload", "raw")
+
+    def __init__(self, feed_id: str, origin_url: str, is_active: Optional[bool],
+                 last_upload: Optional[datetime], raw: Dict[str, Any]):
+        """
+        Ініціалізація запису
+
+        Args:
+            feed_id: ID фіду (наприклад R3DV)
+            origin_url: URL фіду
+            is_active: Чи підключено фід (None якщо поля немає у відповіді)
+            last_upload: Час останнього завантаження (None якщо невідомо)
+            raw: Вихідний об'єкт з відповіді API
+        """
+        self.feed_id = feed_id
+        self.origin_url = origin_url
+        self.is_active = is_active
+        self.last_upload = last_upload
+        self.raw = raw
+
+    @classmethod
+    def from_json(cls, item: Dict[str, Any]) -> Optional["FeedRecord"]:
+        """
+        Створити запис з об'єкта відповіді API
+
+        Returns:
+            FeedRecord або None якщо в об'єкті немає ID або URL фіду
+        """
+        feed_id = _first_present(item, FEED_ID_KEYS)
+        origin_url = _first_present(item, ORIGIN_URL_KEYS)
+        # Без URL це не фід (напр. список постачальників теж має "id")
+        if feed_id is None or str(feed_id).strip() == "" or not origin_url:
+            return None
+        is_active = _first_present(item, IS_ACTIVE_KEYS)
+        return cls(
+            feed_id=str(feed_id).strip(),
+            origin_url=str(origin_url).strip(),
+            is_active=None if is_active is None else bool(is_active),
+            last_upload=_parse_datetime(_first_present(item, LAST_UPLOAD_KEYS)),
+            raw=item,
+        )
+
+    def __repr__(self) -> str:
+        return (f"FeedRecord(feed_id={self.feed_id!r}, origin_url={self.origin_url!r}, "
+                f"is_active={self.is_active!r}, last_upload={self.last_upload!r})")
+
+
+class FeedListModel:
+    """Список фідів з індексами за feed_id і за URL"""
+
+    def __init__(self, records: List[FeedRecord]):
+        """
+        Ініціалізація моделі
+
+        Args:
+            records: Записи у порядку відповіді API
+        """
+        self.records = records
+        self.by_id: Dict[str, FeedRecord] = {record.feed_id: record for record in records}
+        # Для однакових URL перемагає перший запис (як перший збіг у таблиці)
+        self.by_url: Dict[str, FeedRecord] = {}
+        for record in records:
+            self.by_url.setdefault(normalize_feed_url(record.origin_url), record)
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> Optional["FeedListModel"]:
+        """
+        Побудувати модель з JSON-відповіді API списку фідів
+
+        Args:
+            payload: Розібраний JSON (список об'єктів або об'єкт з ключем feeds/items/data/...)
+
+        Returns:
+            FeedListModel або None якщо відповідь не схожа на список фідів (або він порожній)
+        """
+        items = payload
+        if isinstance(payload, dict):
+            items = next((payload[key] for key in LIST_KEYS if isinstance(payload.get(key), list)), None)
+        if not isinstance(items, list):
+            return None
+        records = [record for record in (FeedRecord.from_json(item) for item in items if isinstance(item, dict))
+                   if record is not None]
+        # Порожній список не відрізнити від іншого API з порожнім списком - такі відповіді ігноруємо
+        if not records:
+            return None
+        return cls(records)
+
+    def get(self, feed_id: str) -> Optional[FeedRecord]:
+        """Фід за feed_id"""
+        return self.by_id.get(feed_id.strip())
+
+    def find_by_url(self, url: str) -> Optional[FeedRecord]:
+        """Фід за URL (порівняння після normalize_feed_url)"""
+        return self.by_url.get(normalize_feed_url(url))
+
+    def feed_id_for_url(self, url: str) -> str:
+        """feed_id фіду з таким URL або порожній рядок"""
+        record = self.find_by_url(url)
+        return record.feed_id if record else ""
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[FeedRecord]:
+        return iter(self.records)
+
+    def __contains__(self, feed_id: str) -> bool:
+        return feed_id in self.by_id
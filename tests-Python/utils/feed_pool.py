@@ -0,0 +1,180 @@
+"""
+Пул заздалегідь створених XML-фідів для тестів, яким потрібен фід у відомому стані.
+Фіди створюються один раз (паралельно, через set-feeds), видаються тестам в оренду і після тесту
+повертаються до базового стану (вимкнений) замість видалення. set-feeds - upsert за origin_url, тому URL фіду
+пулу не змінюється; тести, яким потрібен інший URL, беруть не фід з пулу, а створюють свій.
+Фіди пулу позначені параметром hub_login_pool у URL, тому наступний запуск знаходить їх у БД і перевикористовує.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from utils.feed_api import FeedApiClient, FeedApiError
+from utils.feed_list_model import FeedRecord, normalize_feed_url
+
+
+# Параметр URL, яким позначені фіди пулу
+POOL_URL_PARAM = "hub_login_pool"
+
+
+class PooledFeed:
+    """Фід пулу: feed_id, URL пулу і origin_url, під яким HUB його зберіг (ключ set-feeds)"""
+
+    __slots__ = ("feed_id", "baseline_url", "origin_url")
+
+    def __init__(self, feed_id: str, baseline_url: str, origin_url: str):
+        """
+        Ініціалізація фіду пулу
+
+        Args:
+            feed_id: ID фіду
+            baseline_url: URL фіду пулу (з параметром hub_login_pool)
+            origin_url: origin_url фіду в HUB (baseline_url з фрагментом #ufeed<feed_id>)
+        """
+        self.feed_id = feed_id
+        self.baseline_url = baseline_url
+        self.origin_url = origin_url
+
+    @classmethod
+    def from_record(cls, record: FeedRecord, baseline_url: str) -> "PooledFeed":
+        return cls(record.feed_id, baseline_url, record.origin_url)
+
+    def __repr__(self) -> str:
+        return f"PooledFeed(feed_id={self.feed_id!r}, origin_url={self.origin_url!r})"
+
+
+class FeedPool:
+    """Оренда фідів пулу тестам і повернення їх до базового стану"""
+
+    def __init__(self, api: FeedApiClient, base_url: str, size: int, tag: str = "main",
+                 max_workers: int = 4):
+        """
+        Ініціалізація пулу
+
+        Args:
+            api: Клієнт API фідів (на RequestsApiContext - запити йдуть з кількох потоків)
+            base_url: URL XML-фіду, на основі якого будуються URL фідів пулу
+            size: Кількість фідів у пулі
+            tag: Мітка пулу (ID воркера xdist), щоб пули воркерів не перетинались
+            max_workers: Кількість паралельних запитів до API
+        """
+        self.api = api
+        self.base_url = base_url
+        self.size = size
+        self.tag = tag
+        self.max_workers = max_workers
+        self.errors: List[str] = []
+        self._available: List[PooledFeed] = []
+        self._leased: List[PooledFeed] = []
+        self._lock = threading.Lock()
+
+    def baseline_url(self, index: int) -> str:
+        """URL фіду пулу з номером index"""
+        separator = "&" if "?" in self.base_url else "?"
+        return f"{self.base_url}{separator}{POOL_URL_PARAM}={self.tag}-{index}"
+
+    def _run_parallel(self, function, items) -> list:
+        """Виконати function для кожного елемента в ThreadPoolExecutor; помилки API - у self.errors"""
+        def call(item):
+            try:
+                return function(item)
+            except FeedApiError as e:
+                with self._lock:
+                    self.errors.append(str(e))
+                return None
+
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(call, items))
+
+    def _reset(self, feed: PooledFeed) -> Optional[PooledFeed]:
+        """Повернути фід до базового стану (вимкнений)"""
+        self.api.set_feed(feed.origin_url, is_active=False)
+        return feed
+
+    def provision(self) -> "FeedPool":
+        """
+        Підготувати пул: перевикористати фіди пулу з попередніх запусків, решту створити паралельно
+
+        Помилки не переривають сесію: пул буде меншим, а тести підуть звичайним шляхом.
+
+        Returns:
+            Цей пул (для використання у фікстурі)
+        """
+        try:
+            existing = self.api.store.find_all(f"{POOL_URL_PARAM}={self.tag}-")
+        except FeedApiError as e:
+            self.errors.append(f"Фіди пулу: {e}")
+            print(f">>> Пул фідів недоступний: {e}")
+            return self
+
+        by_url = {normalize_feed_url(record.origin_url): record for record in reversed(existing)}
+        adopted, missing = [], []
+        for index in range(self.size):
+            url = self.baseline_url(index)
+            record: Optional[FeedRecord] = by_url.get(normalize_feed_url(url))
+            if record is None:
+                missing.append(url)
+            else:
+                adopted.append(PooledFeed.from_record(record, url))
+
+        # Фіди з попереднього запуску могли лишитись увімкненими - скидаємо їх
+        adopted = [feed for feed in self._run_parallel(self._reset, adopted) if feed is not None]
+        created = self._run_parallel(
+            lambda url: PooledFeed.from_record(self.api.create_feed(url, is_active=False), url), missing
+        )
+        self._available = adopted + [feed for feed in created if feed is not None]
+        print(
+            f">>> Пул фідів [{self.tag}]: {len(self._available)}/{self.size} "
+            f"(перевикористано {len(adopted)}, створено {len(self._available) - len(adopted)})"
+        )
+        return self
+
+    def lease(self, count: int = 1) -> List[PooledFeed]:
+        """
+        Взяти фіди з пулу в оренду
+
+        Args:
+            count: Кількість фідів
+
+        Returns:
+            count фідів або порожній список, якщо вільних фідів недостатньо
+        """
+        with self._lock:
+            if len(self._available) < count:
+                return []
+            feeds, self._available = self._available[:count], self._available[count:]
+            self._leased.extend(feeds)
+        return feeds
+
+    def release(self, feeds: List[PooledFeed]):
+        """
+        Повернути фіди в пул, скинувши їх до базового стану
+
+        Фід, який не вдалося скинути, з пулу виключається (його стан невідомий).
+        """
+        reset = [feed for feed in self._run_parallel(self._reset, feeds) if feed is not None]
+        with self._lock:
+            for feed in feeds:
+                if feed in self._leased:
+                    self._leased.remove(feed)
+            self._available.extend(reset)
+        if len(reset) < len(feeds):
+            print(f">>> Пул фідів: {len(feeds) - len(reset)} фід(ів) не скинуто і виключено з пулу")
+
+    def close(self, delete: bool = False):
+        """
+        Завершити роботу пулу
+
+        Args:
+            delete: Видалити фіди пулу (за замовчуванням лишаються вимкненими для наступного запуску)
+        """
+        if not delete:
+            return
+        feeds = self._available + self._leased
+        self._run_parallel(lambda feed: self.api.delete_feed(feed.feed_id), feeds)
+        self._available, self._leased = [], []
+
+    def __len__(self) -> int:
+        return len(self._available)
@@ -0,0 +1,466 @@
+"""
+Локальний HTTP-сервер XML-фідів для тестів.
+Тіло відповіді формується на льоту і віддається частинами (chunked, опційно gzip),
+тому фіди продакшн-розміру не будуються в пам'яті.
+"""
+import select
+import socket
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Union
+from urllib.parse import parse_qs, urlparse
+
+from utils.feed_generator import YmlFeedGenerator
+
+
+# Тіло маршруту: готові байти або фабрика, що отримує query-параметри запиту і повертає частини тіла
+RouteBody = Union[bytes, str, Callable[[Dict[str, str]], Iterable[bytes]]]
+
+
+class FeedBehavior:
+    """
+    Сценарій затримок і обривів відповіді для маршруту (для тестів таймаутів HUB).
+    Всі очікування перериваються, якщо клієнт закрив з'єднання, - момент фіксується в журналі запитів.
+    """
+
+    def __init__(self, first_byte_delay: float = 0.0, header_interval: float = 0.0,
+                 drip_bytes_per_s: Optional[float] = None,
+                 stall_after_bytes: Optional[int] = None, stall_seconds: float = 0.0,
+                 close_after_bytes: Optional[int] = None):
+        """
+        Args:
+            first_byte_delay: Пауза після прийому з'єднання до першого байта відповіді
+            header_interval: Пауза між рядками заголовків відповіді
+            drip_bytes_per_s: Швидкість віддачі тіла (байт/с), None - без обмеження
+            stall_after_bytes: Після скількох байтів тіла зависнути (None - не зависати)
+            stall_seconds: Тривалість зависання
+            close_after_bytes: Після скількох байтів тіла закрити з'єднання (None - не закривати)
+        """
+        if drip_bytes_per_s is not None and drip_bytes_per_s <= 0:
+            raise ValueError(f"drip_bytes_per_s має бути > 0, отримано: {drip_bytes_per_s}")
+        self.first_byte_delay = first_byte_delay
+        self.header_interval = header_interval
+        self.drip_bytes_per_s = drip_bytes_per_s
+        self.stall_after_bytes = stall_after_bytes
+        self.stall_seconds = stall_seconds
+        self.close_after_bytes = close_after_bytes
+
+    @classmethod
+    def accept_then_stall(cls, seconds: float) -> "FeedBehavior":
+        """З'єднання приймається, але жоден байт не надсилається seconds секунд"""
+        return cls(first_byte_delay=seconds)
+
+    @classmethod
+    def slow_headers(cls, interval: float) -> "FeedBehavior":
+        """Заголовки надсилаються по одному рядку з паузою interval"""
+        return cls(header_interval=interval)
+
+    @classmethod
+    def drip(cls, bytes_per_s: float) -> "FeedBehavior":
+        """Тіло віддається зі швидкістю bytes_per_s байт/с"""
+        return cls(drip_bytes_per_s=bytes_per_s)
+
+    @classmethod
+    def stall_mid_body(cls, after_bytes: int, seconds: float) -> "FeedBehavior":
+        """Після after_bytes байтів тіла сервер мовчить seconds секунд"""
+        return cls(stall_after_bytes=after_bytes, stall_seconds=seconds)
+
+    @classmethod
+    def close_mid_body(cls, after_bytes: int) -> "FeedBehavior":
+        """Після after_bytes байтів тіла з'єднання закривається без завершення відповіді"""
+        return cls(close_after_bytes=after_bytes)
+
+
+class FeedRoute:
+    """Опис відповіді сервера для одного шляху"""
+
+    def __init__(self, body: RouteBody, status: int = 200,
+                 content_type: str = "application/xml; charset=utf-8",
+                 gzip: bool = False, headers: Optional[Dict[str, str]] = None,
+                 behavior: Optional[FeedBehavior] = None):
+        """
+        Args:
+            body: Тіло відповіді (bytes/str) або фабрика частин тіла
+            status: HTTP статус
+            content_type: Значення заголовка Content-Type
+            gzip: Стискати тіло (Content-Encoding: gzip)
+            headers: Додаткові заголовки відповіді
+            behavior: Сценарій затримок/обривів (None - відповідь без затримок)
+        """
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.status = status
+        self.content_type = content_type
+        self.gzip = gzip
+        self.headers = headers or {}
+        self.behavior = behavior or FeedBehavior()
+
+    def iter_body(self, query: Dict[str, str]) -> Iterable[bytes]:
+        """Частини тіла відповіді для запиту з query-параметрами"""
+        if callable(self.body):
+            return self.body(query)
+        return [self.body]
+
+
+def generated_feed_from_query(query: Dict[str, str]) -> YmlFeedGenerator:
+    """
+    Побудувати генератор фіду з query-параметрів запиту.
+    Приклад: /feed.xml?offers=100000&categories=500&images=3&depth=3&encoding=windows-1251
+
+    Args:
+        query: Query-параметри (offers, categories, images, depth, encoding, seed)
+
+    Returns:
+        Налаштований YmlFeedGenerator
+    """
+    return YmlFeedGenerator(
+        categories=int(query.get("categories", 10)),
+        offers=int(query.get("offers", 100)),
+        images_per_offer=int(query.get("images", 1)),
+        category_depth=int(query.get("depth", 1)),
+        encoding=query.get("encoding", "utf-8"),
+        seed=int(query.get("seed", 0)),
+    )
+
+
+class _ClientGone(Exception):
+    """Клієнт закрив з'єднання (або сервер зупиняється) під час паузи у відповіді"""
+
+
+class _FeedRequestHandler(BaseHTTPRequestHandler):
+    """Обробник запитів FeedServer (маршрути беруться з self.server.feed_server)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        """Не засмічуємо вивід pytest логами кожного запиту"""
+        pass
+
+    def do_HEAD(self):
+        self._handle(send_body=False)
+
+    def do_GET(self):
+        self._handle(send_body=True)
+
+    def _handle(self, send_body: bool):
+        feed_server: "FeedServer" = self.server.feed_server
+        parsed = urlparse(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+        record = feed_server._start_record(parsed.path, query)
+
+        route = feed_server.routes.get(parsed.path)
+        if route is None:
+            route = FeedRoute(b"Not found", status=404, content_type="text/plain; charset=utf-8")
+        try:
+            body = route.iter_body(query)
+        except (ValueError, LookupError) as e:
+            # Некоректні query-параметри генератора (напр. offers=abc, encoding=unknown)
+            route = FeedRoute(f"Bad request: {e}", status=400, content_type="text/plain; charset=utf-8")
+            body = route.iter_body(query)
+
+        self._behavior = route.behavior
+        self._record = record
+        try:
+            self._pause(self._behavior.first_byte_delay)
+
+            use_gzip = route.gzip or query.get("gzip") == "1"
+            headers = [
+                ("Content-Type", route.content_type),
+                ("Access-Control-Allow-Origin", "*"),
+                ("Transfer-Encoding", "chunked"),
+            ]
+            if use_gzip:
+                headers.append(("Content-Encoding", "gzip"))
+            headers.extend(route.headers.items())
+
+            self.send_response(route.status)
+            for name, value in headers:
+                self.send_header(name, value)
+                if self._behavior.header_interval:
+                    self.flush_headers()
+                    self._pause(self._behavior.header_interval)
+            self.end_headers()
+            record["status"] = route.status
+            record["headers_sent_at"] = time.time()
+
+            if send_body:
+                compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if use_gzip else None
+                for chunk in body:
+                    if compressor:
+                        chunk = compressor.compress(chunk)
+                    if not self._send_body_bytes(chunk):
+                        return
+                if compressor and not self._send_body_bytes(compressor.flush()):
+                    return
+                self._maybe_stall()
+                self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, _ClientGone):
+            # Клієнт (HUB) закрив з'єднання до кінця відповіді
+            self._mark_disconnected()
+            self.close_connection = True
+        finally:
+            record["finished_at"] = time.time()
+
+    def _send_body_bytes(self, data: bytes) -> bool:
+        """
+        Надіслати байти тіла з урахуванням сценарію (drip, зависання, обрив).
+
+        Returns:
+            False якщо з'єднання закрито сценарієм close_mid_body
+        """
+        behavior = self._behavior
+        record = self._record
+        position = 0
+        while position < len(data):
+            self._maybe_stall()
+            piece = data[position:]
+            sent = record["bytes_sent"]
+            if behavior.close_after_bytes is not None:
+                piece = piece[:max(behavior.close_after_bytes - sent, 0)]
+            if behavior.stall_after_bytes is not None and not record["stalled"] and sent < behavior.stall_after_bytes:
+                piece = piece[:behavior.stall_after_bytes - sent]
+            if behavior.drip_bytes_per_s:
+                # Порції по ~0.1 с, щоб швидкість була рівномірною
+                piece = piece[:max(int(behavior.drip_bytes_per_s / 10), 1)]
+
+            if piece:
+                self._write_chunk(piece, record)
+                position += len(piece)
+                if behavior.drip_bytes_per_s:
+                    self.wfile.flush()
+                    self._pause(len(piece) / behavior.drip_bytes_per_s)
+
+            if behavior.close_after_bytes is not None and record["bytes_sent"] >= behavior.close_after_bytes:
+                # Обрив посеред тіла: без завершального chunk, з'єднання закривається
+                self.wfile.flush()
+                record["closed_by_server"] = True
+                self.close_connection = True
+                return False
+        return True
+
+    def _maybe_stall(self):
+        """Зависнути один раз, якщо надіслано stall_after_bytes байтів тіла"""
+        behavior = self._behavior
+        record = self._record
+        if (behavior.stall_after_bytes is not None and not record["stalled"]
+                and record["bytes_sent"] >= behavior.stall_after_bytes):
+            record["stalled"] = True
+            self.wfile.flush()
+            self._pause(behavior.stall_seconds)
+
+    def _pause(self, seconds: float):
+        """
+        Пауза у відповіді, що стежить за з'єднанням.
+        Якщо клієнт закрив з'єднання або сервер зупиняється - піднімає _ClientGone.
+        """
+        if seconds <= 0:
+            return
+        feed_server: "FeedServer" = self.server.feed_server
+        deadline = time.monotonic() + seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if feed_server._stopping.is_set():
+                raise _ClientGone()
+            readable, _, _ = select.select([self.connection], [], [], min(remaining, 0.2))
+            if not readable:
+                continue
+            try:
+                data = self.connection.recv(1, socket.MSG_PEEK)
+            except OSError:
+                data = b""
+            if not data:
+                raise _ClientGone()
+            # Клієнт надіслав дані (напр. наступний запит) - з'єднання живе, чекаємо далі
+            time.sleep(min(remaining, 0.2))
+
+    def _mark_disconnected(self):
+        """Зафіксувати момент, коли клієнт закрив з'єднання"""
+        if not self._record["client_disconnected"]:
+            self._record["client_disconnected"] = True
+            self._record["disconnected_at"] = time.time()
+
+    def _write_chunk(self, data: bytes, record: Dict):
+        """Записати одну частину chunked-відповіді"""
+        if not data:
+            return
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        record["bytes_sent"] += len(data)
+
+
+class FeedServer:
+    """
+    Локальний сервер фідів з маршрутами path -> FeedRoute.
+    За замовчуванням /feed.xml генерує YML-фід за query-параметрами (див. generated_feed_from_query).
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 0, public_base_url: Optional[str] = None):
+        """
+        Args:
+            host: Інтерфейс для прослуховування ("0.0.0.0" - доступний ззовні, напр. для HUB у Docker)
+            port: Порт (0 - вільний порт обирається автоматично)
+            public_base_url: Базовий URL, за яким сервер бачить HUB
+                (напр. http://host.docker.internal:9876); за замовчуванням http://127.0.0.1:<port>
+        """
+        self.host = host
+        self.port = port
+        self.public_base_url = public_base_url.rstrip("/") if public_base_url else None
+        self.routes: Dict[str, FeedRoute] = {}
+        self.request_log: List[Dict] = []
+        self._log_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self.add_generated_feed("/feed.xml")
+
+    def add_route(self, path: str, body: RouteBody, status: int = 200,
+                  content_type: str = "application/xml; charset=utf-8",
+                  gzip: bool = False, headers: Optional[Dict[str, str]] = None,
+                  behavior: Optional[FeedBehavior] = None) -> str:
+        """
+        Додати (або замінити) маршрут
+
+        Returns:
+            Публічний URL маршруту
+        """
+        self.routes[path] = FeedRoute(
+            body, status=status, content_type=content_type, gzip=gzip, headers=headers, behavior=behavior
+        )
+        return self.url(path)
+
+    def add_generated_feed(self, path: str, generator: Optional[YmlFeedGenerator] = None,
+                           gzip: bool = False, chunk_size: int = 64 * 1024,
+                           behavior: Optional[FeedBehavior] = None) -> str:
+        """
+        Додати маршрут, що стрімить згенерований YML-фід.
+
+        Args:
+            path: Шлях маршруту
+            generator: Налаштований генератор; None - параметри беруться з query запиту
+            gzip: Стискати тіло
+            chunk_size: Розмір частини відповіді в байтах
+            behavior: Сценарій затримок/обривів
+
+        Returns:
+            Публічний URL маршруту
+        """
+        def body(query: Dict[str, str]) -> Iterable[bytes]:
+            feed = generator or generated_feed_from_query(query)
+            return feed.iter_chunks(chunk_size)
+
+        # Для query-фідів кодування задається лише в XML-декларації
+        content_type = f"application/xml; charset={generator.encoding}" if generator else "application/xml"
+        return self.add_route(path, body, content_type=content_type, gzip=gzip, behavior=behavior)
+
+    @property
+    def base_url(self) -> str:
+        """Базовий URL сервера для URL фідів"""
+        if self.public_base_url:
+            return self.public_base_url
+        return f"http://127.0.0.1:{self.port}"
+
+    def url(self, path: str) -> str:
+        """Повний URL для шляху"""
+        return f"{self.base_url}{path}"
+
+    def requests_for(self, path: str) -> List[Dict]:
+        """Записи журналу запитів для шляху"""
+        with self._log_lock:
+            return [r for r in self.request_log if r["path"] == path]
+
+    def client_gave_up_after(self, path: str) -> Optional[float]:
+        """
+        Через скільки секунд після з'єднання клієнт закрив останній запит до шляху
+
+        Returns:
+            Секунди від початку запиту до закриття з'єднання клієнтом, None якщо не закривав
+        """
+        records = self.requests_for(path)
+        if not records or not records[-1]["disconnected_at"]:
+            return None
+        return records[-1]["disconnected_at"] - records[-1]["started_at"]
+
+    def wait_for_request(self, path: str, timeout: float = 30.0) -> Optional[Dict]:
+        """
+        Дочекатися хоча б одного запиту до шляху
+
+        Returns:
+            Запис журналу першого запиту або None, якщо запиту не було за timeout
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            records = self.requests_for(path)
+            if records:
+                return records[0]
+            time.sleep(0.1)
+        return None
+
+    def _start_record(self, path: str, query: Dict[str, str]) -> Dict:
+        """Створити запис журналу для нового запиту"""
+        record = {
+            "path": path,
+            "query": query,
+            "started_at": time.time(),
+            "headers_sent_at": None,
+            "finished_at": None,
+            "status": None,
+            "bytes_sent": 0,
+            "stalled": False,
+            "closed_by_server": False,
+            "client_disconnected": False,
+            "disconnected_at": None,
+        }
+        with self._log_lock:
+            self.request_log.append(record)
+        return record
+
+    def start(self) -> "FeedServer":
+        """Запустити сервер у фоновому потоці"""
+        self._stopping.clear()
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _FeedRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.feed_server = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="feed-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Зупинити сервер"""
+        self._stopping.set()
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self):
+        """Контекстний менеджер: запуск"""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Контекстний менеджер: зупинка"""
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Локальний сервер синтетичних XML-фідів")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9876)
+    args = parser.parse_args()
+
+    server = FeedServer(host=args.host, port=args.port).start()
+    print(f"Feed server: {server.url('/feed.xml')}?offers=100000&categories=500&images=3&depth=3&gzip=1")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,155 @@
+"""
+Запис і відтворення трафіку HUB у HAR-файли для офлайн-запуску UI-тестів.
+
+record - під час живого запуску Playwright пише трафік до хоста HUB у HAR-файл тесту (route_from_har, update=True).
+replay - запити до хоста HUB обслуговуються з HAR-файлу: збіг за методом, шляхом, нормалізованими
+         query і тілом (без CSRF-токенів, міток часу та інших змінних полів). Запит без збігу скасовується.
+"""
+import base64
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse
+from playwright.sync_api import BrowserContext, Route
+
+
+# Поля тіла і query, що змінюються між запусками і не впливають на відповідь
+VOLATILE_KEYS = {"csrf", "csrftoken", "csrfmiddlewaretoken", "_csrf", "xsrf", "token", "nonce",
+                 "timestamp", "ts", "_t", "_", "t", "rnd", "random", "cachebuster"}
+# Заголовки відповіді, які не можна повертати разом з уже розпакованим тілом
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+# id параметра browser_name pytest-playwright у nodeid (не потрапляє в назву HAR-файлу)
+BROWSER_PARAM_IDS = {"chromium", "firefox", "webkit"}
+
+# Ключ запиту: (метод, шлях, нормалізований query, нормалізоване тіло)
+RequestKey = Tuple[str, str, str, str]
+
+
+def _drop_volatile(pairs) -> List[Tuple[str, str]]:
+    """Прибрати змінні поля і відсортувати пари ключ-значення"""
+    return sorted((key, value) for key, value in pairs if key.lower() not in VOLATILE_KEYS)
+
+
+def _strip_json(value):
+    """Рекурсивно прибрати змінні поля з JSON"""
+    if isinstance(value, dict):
+        return {key: _strip_json(item) for key, item in value.items() if key.lower() not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_strip_json(item) for item in value]
+    return value
+
+
+def normalize_body(body: Optional[str]) -> str:
+    """
+    Нормалізоване тіло запиту для порівняння
+
+    JSON - без змінних полів і з відсортованими ключами; form-urlencoded - без змінних полів
+    і відсортований; інше (multipart, бінарне) - лише довжина, бо містить boundary.
+    """
+    if not body:
+        return ""
+    try:
+        return json.dumps(_strip_json(json.loads(body)), sort_keys=True, ensure_ascii=False)
+    except ValueError:
+        pass
+    if re.fullmatch(r"[^=&\s]+=[^&\s]*(&[^=&\s]+=[^&\s]*)*", body):
+        return urlencode(_drop_volatile(parse_qsl(body, keep_blank_values=True)))
+    return f"<{len(body)} bytes>"
+
+
+def request_key(method: str, url: str, body: Optional[str]) -> RequestKey:
+    """Ключ для пошуку запиту в HAR"""
+    parsed = urlparse(url)
+    query = urlencode(_drop_volatile(parse_qsl(parsed.query, keep_blank_values=True)))
+    return method.upper(), parsed.path or "/", query, normalize_body(body)
+
+
+def host_pattern(base_url: str) -> "re.Pattern":
+    """Регулярний вираз URL для трафіку хоста HUB"""
+    return re.compile(rf"^https?://{re.escape(urlparse(base_url).netloc)}(/|$)")
+
+
+def har_path_for(har_dir: str, nodeid: str) -> Path:
+    """
+    HAR-файл тесту: tests/test_x.py::TestX::test_y[chromium] -> test_x__TestX__test_y.har,
+    параметризований - tests/test_x.py::TestX::test_y[chromium-case 1] -> test_x__TestX__test_y__case_1.har
+    (id параметрів лишається в назві, щоб варіанти тесту не перезаписували один одного; браузер - ні)
+    """
+    node, _, params = nodeid.partition("[")
+    safe_name = re.sub(r"[^\w.-]+", "__", node.split("/")[-1].replace(".py", ""))
+    param_ids = [part for part in params[:-1].split("-") if part and part not in BROWSER_PARAM_IDS]
+    if param_ids:
+        safe_name += "__" + re.sub(r"[^\w.-]+", "_", "-".join(param_ids))
+    return Path(har_dir) / f"{safe_name}.har"
+
+
+def record_har(context: BrowserContext, har_path: Path, base_url: str):
+    """
+    Записувати трафік хоста HUB у HAR-файл (файл пишеться при закритті контексту)
+
+    Args:
+        context: Контекст браузера тесту
+        har_path: HAR-файл тесту
+        base_url: URL HUB (TestConfig.BASE_URL)
+    """
+    har_path.parent.mkdir(parents=True, exist_ok=True)
+    context.route_from_har(str(har_path), url=host_pattern(base_url), update=True,
+                           update_content="embed", update_mode="minimal")
+
+
+class HarReplayer:
+    """Відтворення відповідей HUB з HAR-файлу"""
+
+    def __init__(self, har_path: str):
+        """
+        Ініціалізація з HAR-файлу
+
+        Args:
+            har_path: HAR-файл, записаний у режимі record
+        """
+        self.har_path = Path(har_path)
+        har = json.loads(self.har_path.read_text(encoding="utf-8"))
+        self._entries: Dict[RequestKey, List[dict]] = {}
+        for entry in har["log"]["entries"]:
+            request = entry["request"]
+            body = (request.get("postData") or {}).get("text")
+            key = request_key(request["method"], request["url"], body)
+            self._entries.setdefault(key, []).append(entry["response"])
+        self._served: Dict[RequestKey, int] = {}
+        self.replayed = 0
+        self.missing: List[str] = []
+
+    def _next_response(self, key: RequestKey) -> Optional[dict]:
+        """Відповіді на однакові запити віддаються в порядку запису, остання - повторно"""
+        responses = self._entries.get(key)
+        if not responses:
+            return None
+        index = self._served.get(key, 0)
+        self._served[key] = index + 1
+        return responses[min(index, len(responses) - 1)]
+
+    def handle(self, route: Route):
+        """Обробник context.route: відповідь з HAR або abort, якщо збігу немає"""
+        request = route.request
+        response = self._next_response(request_key(request.method, request.url, request.post_data))
+        if response is None:
+            self.missing.append(f"{request.method} {request.url}")
+            route.abort("internetdisconnected")
+            return
+        content = response.get("content", {})
+        text = content.get("text", "")
+        body = base64.b64decode(text) if content.get("encoding") == "base64" else text.encode("utf-8")
+        headers = {header["name"]: header["value"] for header in response.get("headers", [])
+                   if header["name"].lower() not in _DROP_HEADERS}
+        self.replayed += 1
+        route.fulfill(status=response["status"], headers=headers, body=body)
+
+    def install(self, context: BrowserContext, base_url: str):
+        """Обслуговувати трафік хоста HUB з HAR"""
+        context.route(host_pattern(base_url), self.handle)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Лічильники для звіту тесту"""
+        return {"відтворено з HAR": self.replayed, "немає в HAR": len(self.missing)}
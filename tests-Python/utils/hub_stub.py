@@ -0,0 +1,1000 @@
+"""
+Локальна заміна HUB (stand-in) для прогону page objects і очікувань без живого стенду.
+Моделює лише те, чого торкаються тести, для одного постачальника:
+- /user/login і помилки логіну (invalid-ldap-password, no-user, no-supplier);
+- таблицю XML-фідів /supplier-content/xml і форму фіду (?feed_id=...&tab=feed);
+- збереження фіду через set-feeds (upsert за origin_url) з валідацією URL і лімітом активних фідів;
+- скачування Excel мапінгу фіду (gen-mapping-file) і його завантаження через set-feeds з file;
+- список постачальників /api/suppliers і вибір постачальника параметром ?supplier_id=.
+Затримки і збої відповідей задаються HubFaults з seed, тому нестабільні за таймінгом падіння відтворюються.
+"""
+import http.client
+import io
+import json
+import random
+import secrets
+import socket
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from email.parser import BytesParser
+from email.policy import HTTP
+from html import escape
+from http.cookies import CookieError, SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+from openpyxl import load_workbook
+
+from utils.feed_list_model import FeedRecord
+from utils.local_feeds import HUB_CONN_TIMEOUT_S, HUB_SOCKET_TIMEOUT_S
+from utils.mapping_workbook_generator import generate_mapping_workbook
+
+
+# Шляхи HUB, які відтворює заміна
+LOGIN_PATH = "/user/login"
+FEEDS_PAGE_PATH = "/supplier-content/xml"
+FEEDS_API_PATH = "/api/supplier-content/xml/feeds"
+SET_FEEDS_PATH = "/api/supplier/set-feeds"
+GEN_MAPPING_FILE_PATH = "/api/supplier/gen-mapping-file"
+SUPPLIERS_API_PATH = "/api/suppliers"
+
+SESSION_COOKIE = "hub_session"
+CSRF_COOKIE = "csrftoken"
+
+# Тексти HUB (src/hub/api/feed/feed.clj, src/hub/api/handlers/supplier.clj)
+VALIDATION_ERROR = "Помилка валідації xml структури фіду"
+ACTIVE_LIMIT_ERROR = "Неможливо підключити більше 3х фідів. Вимкніть спочатку один з фідів"
+MAPPING_SHEET = "Категорія+"
+LOGIN_MESSAGES = {
+    "invalid-ldap-password": "Невірний логін або пароль. Зверніться до адмінів",
+    "no-user": "Такого користувача не існує. Зареєструйте, заповнивши форму нижче",
+    "no-supplier": "Вітаємо! Ви вже зареєстровані на kasta.ua, для завершення реєстрації в hub, заповніть поля нижче",
+}
+
+# Скільки байтів фіду читати при валідації (для перевірки структури достатньо початку документа)
+VALIDATION_READ_LIMIT = 5 * 1024 * 1024
+
+# Перевірка URL фіду: повертає текст помилки або None якщо фід валідний
+FeedValidator = Callable[[str], Optional[str]]
+
+
+class HubFaults:
+    """Затримка і частка збоїв відповідей для групи шляхів"""
+
+    def __init__(self, latency_s: float = 0.0, jitter_s: float = 0.0, failure_rate: float = 0.0,
+                 failure_status: int = 503):
+        """
+        Args:
+            latency_s: Затримка перед кожною відповіддю
+            jitter_s: Випадкова добавка до затримки (0..jitter_s)
+            failure_rate: Частка запитів (0..1), на які відповідається failure_status
+            failure_status: HTTP статус збою
+        """
+        if not 0.0 <= failure_rate <= 1.0:
+            raise ValueError(f"failure_rate має бути в межах 0..1, отримано: {failure_rate}")
+        self.latency_s = latency_s
+        self.jitter_s = jitter_s
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+
+    def __repr__(self) -> str:
+        return (f"HubFaults(latency_s={self.latency_s}, jitter_s={self.jitter_s}, "
+                f"failure_rate={self.failure_rate}, failure_status={self.failure_status})")
+
+
+class StubUser:
+    """Користувач заміни HUB"""
+
+    __slots__ = ("email", "password", "code")
+
+    def __init__(self, email: str, password: str, code: Optional[str] = None):
+        """
+        Args:
+            email: Email (логін)
+            password: Пароль
+            code: Код помилки при логіні (напр. "no-supplier"), None - логін успішний
+        """
+        self.email = email
+        self.password = password
+        self.code = code
+
+
+class StubFeed:
+    """XML-фід постачальника в пам'яті заміни HUB"""
+
+    __slots__ = ("feed_id", "origin_url", "is_active", "last_upload", "mapping")
+
+    def __init__(self, feed_id: str, origin_url: str, is_active: bool = False):
+        self.feed_id = feed_id
+        self.origin_url = origin_url
+        self.is_active = is_active
+        self.last_upload: Optional[float] = None
+        self.mapping: Optional[bytes] = None
+
+    def to_json(self) -> Dict:
+        """Фід у форматі відповіді API (див. utils/feed_list_model.py)"""
+        return {
+            "feed_id": self.feed_id,
+            "origin_url": self.origin_url,
+            "is_active": self.is_active,
+            "last_upload": int(self.last_upload * 1000) if self.last_upload else None,
+        }
+
+
+def _open_feed(url: str, conn_timeout: float, read_timeout: float,
+               redirects: int = 5) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    GET фіду з окремими таймаутами з'єднання і читання (як feed-download у HUB)
+
+    Returns:
+        (статус, заголовки з ключами в нижньому регістрі, тіло до VALIDATION_READ_LIMIT байтів)
+
+    Raises:
+        TimeoutError: "Connect timed out" або "Read timed out"
+    """
+    parsed = urlparse(url)
+    connection_class = http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+    connection = connection_class(parsed.hostname, parsed.port, timeout=conn_timeout)
+    try:
+        try:
+            connection.connect()
+        except (socket.timeout, TimeoutError):
+            raise TimeoutError("Connect timed out")
+        connection.sock.settimeout(read_timeout)
+        target = parsed.path or "/"
+        if parsed.query:
+            target += f"?{parsed.query}"
+        connection.request("GET", target, headers={"User-Agent": "hub-stub", "Accept-Encoding": "gzip"})
+        try:
+            response = connection.getresponse()
+            headers = {key.lower(): value for key, value in response.getheaders()}
+            if response.status in (301, 302, 303, 307, 308) and headers.get("location") and redirects > 0:
+                return _open_feed(urljoin(url, headers["location"]), conn_timeout, read_timeout, redirects - 1)
+            return response.status, headers, response.read(VALIDATION_READ_LIMIT)
+        except socket.timeout:
+            raise TimeoutError("Read timed out")
+    finally:
+        connection.close()
+
+
+def validate_feed_url(url: str, conn_timeout: float = HUB_CONN_TIMEOUT_S,
+                      read_timeout: float = HUB_SOCKET_TIMEOUT_S) -> Optional[str]:
+    """
+    Перевірка фіду як у HUB: завантажити URL і розібрати XML
+
+    Args:
+        url: URL фіду
+        conn_timeout: Таймаут з'єднання (с)
+        read_timeout: Таймаут читання (с)
+
+    Returns:
+        Текст помилки у форматі HUB або None якщо фід валідний
+    """
+    scheme = urlparse(url).scheme.lower()
+    if scheme not in ("http", "https"):
+        return f"{VALIDATION_ERROR} помилка завантаження фіду: {scheme or url} protocol is not supported"
+    try:
+        status, headers, body = _open_feed(url, conn_timeout, read_timeout)
+        if status >= 400:
+            return f"{VALIDATION_ERROR} помилка завантаження фіду: status {status}"
+        if headers.get("content-encoding", "").lower() == "gzip":
+            body = zlib.decompressobj(47).decompress(body)
+    except TimeoutError as e:
+        return f"{VALIDATION_ERROR} помилка завантаження фіду: {e}"
+    except (OSError, http.client.HTTPException, zlib.error) as e:
+        return f"{VALIDATION_ERROR} помилка завантаження фіду: {e}"
+
+    start = body.lstrip()[:1]
+    if start != b"<":
+        char = start.decode("latin-1") if start else "EOF"
+        return f"{VALIDATION_ERROR}: Unexpected character '{char}' in prolog; expected '<'"
+    try:
+        ET.fromstring(body)
+    except ET.ParseError as e:
+        return f"{VALIDATION_ERROR}: {e}"
+    return None
+
+
+def validate_mapping_workbook(data: bytes) -> Optional[str]:
+    """
+    Перевірка файлу мапінгу: .xlsx з вкладкою "Категорія+"
+
+    Returns:
+        Текст помилки або None якщо файл прийнято
+    """
+    try:
+        workbook = load_workbook(io.BytesIO(data), read_only=True)
+    except Exception as e:
+        return f"Помилка валідації файлу мапінгу: {e}"
+    try:
+        if MAPPING_SHEET not in workbook.sheetnames:
+            return f"Помилка валідації файлу мапінгу: немає вкладки '{MAPPING_SHEET}'"
+    finally:
+        workbook.close()
+    return None
+
+
+def _default_mapping_workbook(category_rows: int = 20) -> bytes:
+    """Файл мапінгу фіду, для якого мапінг ще не завантажували"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "mapping.xlsx"
+        generate_mapping_workbook(str(path), category_rows=category_rows)
+        return path.read_bytes()
+
+
+_PAGE_STYLE = """
+body { font-family: sans-serif; margin: 0; }
+nav { display: flex; gap: 16px; padding: 8px 16px; background: #f0f0f0; }
+#root-content { padding: 16px; }
+.ant-alert-error { color: #a8071a; background: #fff2f0; padding: 8px; margin: 8px 0; }
+.ant-form-item-explain-error { color: #a8071a; font-size: 12px; }
+.ant-message { color: #135200; background: #f6ffed; padding: 8px; margin: 8px 0; }
+.ag-header, .ag-row { display: flex; }
+.ag-header-cell, .ag-cell { width: 220px; padding: 4px; overflow: hidden; white-space: nowrap; }
+.ag-body-viewport { height: 480px; overflow: auto; }
+[hidden] { display: none !important; }
+"""
+
+# Місце назви вибраного постачальника в шапці (заповнюється при відповіді)
+_SUPPLIER_SLOT = "<!--supplier-->"
+
+_NAV_HTML = f"""
+<nav>
+  <span class="hub-supplier">{_SUPPLIER_SLOT}</span>
+  <span>Товари</span>
+  <a href="/supplier-content/xml">Імпорт новинок</a>
+  <a href="/supplier-content/xml">XML</a>
+</nav>
+"""
+
+LOGIN_HTML = f"""<!DOCTYPE html>
+<html lang="uk"><head><meta charset="utf-8"><title>HUB - Вхід</title><style>{_PAGE_STYLE}</style></head>
+<body><div id="root-content"><div></div>
+<form novalidate>
+  <div class="ant-alert ant-alert-error" hidden></div>
+  <div class="ant-form-item"><input id="email" type="email" placeholder="Email"></div>
+  <div class="ant-form-item"><input id="password" type="password" placeholder="Пароль"></div>
+  <button type="submit">Увійти</button>
+</form></div>
+<script>
+const form = document.querySelector('form');
+const alertBox = form.querySelector('.ant-alert-error');
+form.addEventListener('submit', async (event) => {{
+  event.preventDefault();
+  alertBox.hidden = true;
+  form.querySelectorAll('.ant-form-item-explain-error').forEach((el) => el.remove());
+  let missing = false;
+  for (const input of [form.querySelector('#email'), form.querySelector('#password')]) {{
+    if (!input.value) {{
+      const error = document.createElement('div');
+      error.className = 'ant-form-item-explain-error';
+      error.textContent = "Обов'язкове поле";
+      input.parentElement.appendChild(error);
+      missing = true;
+    }}
+  }}
+  if (missing) return;
+  let data = {{}};
+  try {{
+    const response = await fetch('{LOGIN_PATH}', {{
+      method: 'POST',
+      headers: {{ 'Content-Type': 'application/json' }},
+      body: JSON.stringify({{ email: form.email.value, password: form.password.value }}),
+    }});
+    data = await response.json();
+  }} catch (e) {{
+    data = {{ status: 'fail', message: 'Сервер недоступний' }};
+  }}
+  if (data.status === 'ok') {{
+    location.href = '/';
+    return;
+  }}
+  alertBox.textContent = data.message || 'Помилка сервера';
+  alertBox.hidden = false;
+  if (data.code === 'no-user' || data.code === 'no-supplier') {{
+    history.pushState(null, '', '/?supplier-reg=true');
+  }}
+}});
+</script></body></html>
+"""
+
+DASHBOARD_HTML = f"""<!DOCTYPE html>
+<html lang="uk"><head><meta charset="utf-8"><title>HUB</title><style>{_PAGE_STYLE}</style></head>
+<body>{_NAV_HTML}<div id="root-content"><h1>HUB (локальна заміна)</h1></div></body></html>
+"""
+
+FEEDS_HTML = f"""<!DOCTYPE html>
+<html lang="uk"><head><meta charset="utf-8"><title>HUB - XML фіди</title><style>{_PAGE_STYLE}</style></head>
+<body>{_NAV_HTML}<div id="root-content">
+<div class="ant-message" hidden></div>
+<div class="ant-alert ant-alert-error" hidden></div>
+<section id="feeds-list" hidden>
+  <button type="button" id="add-feed">Додати новий фід</button>
+  <div class="ag-root">
+    <div class="ag-header">
+      <div class="ag-header-cell" col-id="feed_id" aria-colindex="1">ID фіду</div>
+      <div class="ag-header-cell" col-id="origin_url" aria-colindex="2">Лінк фіду</div>
+      <div class="ag-header-cell" col-id="is_active" aria-colindex="3">Підключено</div>
+      <div class="ag-header-cell" col-id="last_upload" aria-colindex="4" id="sort-last-upload">Останнє завантаження</div>
+      <div class="ag-header-cell" col-id="actions" aria-colindex="5">Управління</div>
+    </div>
+    <div class="ag-body-viewport"><div class="ag-center-cols-container"></div></div>
+    <div class="ag-overlay-no-rows-wrapper" hidden>Немає фідів</div>
+  </div>
+</section>
+<section id="feed-form" hidden>
+  <div>URL фіду <input id="origin_url" placeholder="https://127.0.0.1:8000/fmt."></div>
+  <div class="ant-checkbox-wrapper">Завантажити товари з xml<label><input type="checkbox" id="is_active"></label></div>
+  <button type="button" id="save-feed">Зберегти</button>
+  <div id="mapping" hidden>
+    <a class="ant-btn" id="download-mapping" download>Отримати файл для ручного мапінгу</a>
+    <label class="ant-btn">Завантажити ручний мапінг категорій<input type="file" id="upload-mapping" hidden></label>
+  </div>
+</section>
+</div>
+<script>
+const api = '{FEEDS_API_PATH}';
+const setFeeds = '{SET_FEEDS_PATH}';
+const genMappingFile = '{GEN_MAPPING_FILE_PATH}';
+const params = new URLSearchParams(location.search);
+const feedId = (params.get('feed_id') || '').trim();
+const message = document.querySelector('.ant-message');
+const alertBox = document.querySelector('.ant-alert-error');
+const csrf = (document.cookie.match(/{CSRF_COOKIE}=([^;]+)/) || [])[1] || '';
+let feeds = [];
+let sortDesc = null;
+
+function notify(ok, text) {{
+  message.hidden = !ok;
+  alertBox.hidden = ok;
+  (ok ? message : alertBox).textContent = text;
+}}
+
+async function call(method, url, body) {{
+  // FormData (файл мапінгу) - Content-Type з boundary ставить браузер
+  const headers = {{ 'X-CSRFToken': csrf }};
+  if (!(body instanceof FormData)) headers['Content-Type'] = 'application/json';
+  const response = await fetch(url, {{ method, body, headers }});
+  const data = await response.json().catch(() => ({{}}));
+  return {{ ok: response.ok, data }};
+}}
+
+function renderList() {{
+  const rows = [...feeds];
+  if (sortDesc !== null) {{
+    rows.sort((a, b) => ((a.last_upload || 0) - (b.last_upload || 0)) * (sortDesc ? -1 : 1));
+  }}
+  const container = document.querySelector('.ag-center-cols-container');
+  container.innerHTML = '';
+  rows.forEach((feed, index) => {{
+    const row = document.createElement('div');
+    row.className = 'ag-row';
+    row.setAttribute('row-index', index);
+    row.setAttribute('row-id', feed.feed_id);
+    const cells = [
+      ['feed_id', feed.feed_id], ['origin_url', feed.origin_url], ['is_active', feed.is_active ? 'Так' : 'Ні'],
+      ['last_upload', feed.last_upload ? new Date(feed.last_upload).toISOString() : ''],
+    ];
+    cells.forEach(([colId, value], position) => {{
+      const cell = document.createElement('div');
+      cell.className = 'ag-cell';
+      cell.setAttribute('col-id', colId);
+      cell.setAttribute('aria-colindex', position + 1);
+      cell.textContent = value;
+      row.appendChild(cell);
+    }});
+    const actions = document.createElement('div');
+    actions.className = 'ag-cell';
+    actions.setAttribute('col-id', 'actions');
+    actions.setAttribute('aria-colindex', 5);
+    const edit = document.createElement('button');
+    edit.type = 'button';
+    edit.textContent = ' Редагувати';
+    edit.onclick = () => {{ location.search = `?feed_id=${{feed.feed_id}}&tab=feed`; }};
+    actions.appendChild(edit);
+    row.appendChild(actions);
+    container.appendChild(row);
+  }});
+  document.querySelector('.ag-overlay-no-rows-wrapper').hidden = rows.length > 0;
+}}
+
+async function showList() {{
+  document.querySelector('#feeds-list').hidden = false;
+  const result = await call('GET', api);
+  feeds = result.ok ? (result.data.feeds || []) : [];
+  if (!result.ok) notify(false, result.data.message || 'Помилка завантаження списку фідів');
+  renderList();
+}}
+
+async function showForm() {{
+  document.querySelector('#feed-form').hidden = false;
+  if (feedId) {{
+    const result = await call('GET', `${{api}}/${{feedId}}`);
+    if (!result.ok) {{
+      notify(false, result.data.message || 'Фід не знайдено');
+      return;
+    }}
+    document.querySelector('#origin_url').value = result.data.origin_url;
+    document.querySelector('#is_active').checked = result.data.is_active;
+    showMapping(feedId);
+  }}
+}}
+
+function showMapping(id) {{
+  document.querySelector('#mapping').hidden = false;
+  document.querySelector('#download-mapping').href = `${{genMappingFile}}?feed_id=${{encodeURIComponent(id)}}`;
+}}
+
+document.querySelector('#add-feed').onclick = () => {{ location.search = '?feed_id=%20%20%20&tab=feed'; }};
+document.querySelector('#sort-last-upload').onclick = (event) => {{
+  sortDesc = !sortDesc;
+  event.currentTarget.setAttribute('aria-sort', sortDesc ? 'descending' : 'ascending');
+  renderList();
+}};
+document.querySelector('#save-feed').onclick = async () => {{
+  const body = JSON.stringify({{
+    origin_url: document.querySelector('#origin_url').value.trim(),
+    is_active: document.querySelector('#is_active').checked,
+  }});
+  const currentId = (new URLSearchParams(location.search).get('feed_id') || '').trim();
+  const result = await call('POST', setFeeds, body);
+  if (!result.ok) {{
+    notify(false, result.data.message || 'Помилка збереження');
+    return;
+  }}
+  notify(true, 'Дані збережено!');
+  if (!currentId && result.data.feed_id) {{
+    history.replaceState(null, '', `?feed_id=${{result.data.feed_id}}&tab=feed`);
+    document.querySelector('#origin_url').value = result.data.origin_url;
+    showMapping(result.data.feed_id);
+  }}
+}};
+document.querySelector('#upload-mapping').onchange = async (event) => {{
+  const file = event.target.files[0];
+  const currentId = (new URLSearchParams(location.search).get('feed_id') || '').trim();
+  if (!file || !currentId) return;
+  const form = new FormData();
+  form.append('origin_url', document.querySelector('#origin_url').value.trim());
+  form.append('file', file);
+  const result = await call('POST', setFeeds, form);
+  notify(result.ok, result.ok ? 'Дані збережено!' : (result.data.message || 'Помилка завантаження мапінгу'));
+  event.target.value = '';
+}};
+
+if (params.get('tab') === 'feed') showForm(); else showList();
+</script></body></html>
+"""
+
+
+class _HubStubHandler(BaseHTTPRequestHandler):
+    """Обробник запитів HubStubServer (стан береться з self.server.hub)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        """Не засмічуємо вивід pytest логами кожного запиту"""
+        pass
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def do_PATCH(self):
+        self._dispatch()
+
+    def do_PUT(self):
+        self._dispatch()
+
+    def do_DELETE(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        hub: "HubStubServer" = self.server.hub
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        record = hub._start_record(self.command, parsed.path)
+
+        delay, fail_status = hub._draw_faults(parsed.path)
+        if delay and hub._stopping.wait(delay):
+            self.close_connection = True
+            return
+        if fail_status:
+            record["injected_failure"] = True
+            response = (fail_status, "application/json", _json({"status": "fail", "code": "stub-injected-failure",
+                                                                "message": f"Збій заміни HUB ({fail_status})"}), {})
+        else:
+            cookie = SimpleCookie()
+            try:
+                cookie.load(self.headers.get("Cookie") or "")
+            except CookieError:
+                pass
+            session = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else ""
+            query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+            content_type = self.headers.get("Content-Type") or ""
+            form = None
+            if content_type.startswith("multipart/form-data"):
+                # Форма з файлом (set-feeds з мапінгом): поля - окремо, тілом лишається сам файл
+                form, body = _form_data(body, content_type)
+            response = hub._route(self.command, parsed.path, query, body, session, form)
+
+        status, content_type, payload, headers = response
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("Cache-Control", "no-store")
+            for name, value in headers.items():
+                for item in value if isinstance(value, list) else [value]:
+                    self.send_header(name, item)
+            self.end_headers()
+            self.wfile.write(payload)
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        finally:
+            record["status"] = status
+            record["duration_s"] = round(time.time() - record["started_at"], 3)
+
+
+def _json(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _form_data(body: bytes, content_type: str) -> Tuple[Dict[str, str], bytes]:
+    """Текстові поля і вміст першого файлу з тіла multipart/form-data (порожньо, якщо файлу немає)"""
+    message = BytesParser(policy=HTTP).parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode("latin-1") + body)
+    fields: Dict[str, str] = {}
+    file = b""
+    for part in message.iter_parts() if message.is_multipart() else []:
+        if part.get_filename() is not None:
+            file = file or part.get_payload(decode=True) or b""
+        elif part.get_param("name", header="content-disposition"):
+            fields[part.get_param("name", header="content-disposition")] = part.get_content().strip()
+    return fields, file
+
+
+def _base_feed_url(url: str) -> str:
+    """URL фіду без фрагмента #ufeed<feed_id>, який HUB додає до origin_url при створенні"""
+    return url.split("#ufeed")[0].strip()
+
+
+# Відповідь маршруту: (статус, Content-Type, тіло, додаткові заголовки)
+StubResponse = Tuple[int, str, bytes, Dict]
+
+
+class HubStubServer:
+    """
+    Локальна заміна HUB: користувачі, фіди постачальника і мапінги в пам'яті.
+    Сторінки - мінімальний HTML з тими ж селекторами, що в locators/, API - JSON як у HUB.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, active_limit: int = 3,
+                 feed_validator: Optional[FeedValidator] = None, seed: int = 0,
+                 ldap_domains: Tuple[str, ...] = ("kasta.ua",)):
+        """
+        Args:
+            host: Інтерфейс для прослуховування
+            port: Порт (0 - вільний порт обирається автоматично)
+            active_limit: Скільки фідів постачальника можна підключити одночасно
+            feed_validator: Перевірка URL фіду при збереженні (за замовчуванням validate_feed_url)
+            seed: Зерно генератора збоїв і затримок (однаковий seed - однакова послідовність)
+            ldap_domains: Домени корпоративних email: невідомий email у них - invalid-ldap-password, а не no-user
+        """
+        self.host = host
+        self.port = port
+        self.active_limit = active_limit
+        self.feed_validator = feed_validator or validate_feed_url
+        self.ldap_domains = tuple(domain.lower() for domain in ldap_domains)
+        self.users: Dict[str, StubUser] = {}
+        self.feeds: Dict[str, StubFeed] = {}
+        self.validation_overrides: Dict[str, Optional[str]] = {}
+        self.faults: Dict[str, HubFaults] = {}
+        self.request_log: List[Dict] = []
+        self.suppliers: Dict[str, str] = {}
+        # Вибраний постачальник кожної сесії (supplier_id)
+        self.session_suppliers: Dict[str, str] = {}
+        self._sessions: Dict[str, str] = {}
+        self._next_feed = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    # --- Налаштування стану ---
+
+    def add_user(self, email: str, password: str, code: Optional[str] = None):
+        """
+        Додати користувача
+
+        Args:
+            email: Email
+            password: Пароль
+            code: Код помилки логіну ("no-supplier" - деактивований/без постачальника), None - успішний логін
+        """
+        self.users[email.lower()] = StubUser(email, password, code)
+
+    def add_feed(self, origin_url: str, is_active: bool = False, feed_id: Optional[str] = None) -> str:
+        """
+        Додати фід постачальника без валідації URL
+
+        Returns:
+            feed_id
+        """
+        with self._lock:
+            return self._create_feed(origin_url, is_active, feed_id).feed_id
+
+    def add_supplier(self, name: str, supplier_id: Optional[str] = None) -> str:
+        """
+        Додати постачальника до списку "Всі"
+
+        Returns:
+            supplier_id
+        """
+        with self._lock:
+            supplier_id = supplier_id or str(1000 + len(self.suppliers))
+            self.suppliers[supplier_id] = name
+        return supplier_id
+
+    def set_feed_validation(self, url: str, error: Optional[str]):
+        """Задати результат валідації URL без завантаження фіду (error=None - фід валідний)"""
+        self.validation_overrides[url] = error
+
+    def set_faults(self, path_prefix: str, faults: Optional[HubFaults]):
+        """
+        Затримки/збої для шляхів з префіксом (найдовший префікс має пріоритет, "" - усі шляхи)
+
+        Args:
+            path_prefix: Префікс шляху (напр. "/api/", "/user/login")
+            faults: Налаштування або None щоб прибрати
+        """
+        with self._lock:
+            if faults is None:
+                self.faults.pop(path_prefix, None)
+            else:
+                self.faults[path_prefix] = faults
+
+    def active_feed_ids(self) -> List[str]:
+        """feed_id підключених фідів"""
+        return [feed.feed_id for feed in self.feeds.values() if feed.is_active]
+
+    # --- Внутрішня логіка ---
+
+    def _create_feed(self, origin_url: str, is_active: bool, feed_id: Optional[str] = None) -> StubFeed:
+        """Створити фід (викликається під self._lock)"""
+        if not feed_id:
+            while True:
+                self._next_feed += 1
+                feed_id = f"S{self._next_feed:03X}"
+                if feed_id not in self.feeds:
+                    break
+        # Як HUB: до origin_url нового фіду додається #ufeed<feed_id>
+        if "#ufeed" not in origin_url:
+            origin_url = f"{origin_url}#ufeed{feed_id}"
+        feed = StubFeed(feed_id, origin_url, is_active)
+        if is_active:
+            feed.last_upload = time.time()
+        self.feeds[feed_id] = feed
+        return feed
+
+    def _find_feed(self, origin_url: str) -> Optional[StubFeed]:
+        """Фід з таким origin_url (з фрагментом #ufeed або без нього), як ключ upsert у set-feeds"""
+        base_url = _base_feed_url(origin_url)
+        exact = next((feed for feed in self.feeds.values() if feed.origin_url == origin_url.strip()), None)
+        return exact or next((feed for feed in self.feeds.values()
+                              if _base_feed_url(feed.origin_url) == base_url), None)
+
+    def _draw_faults(self, path: str) -> Tuple[float, int]:
+        """Затримка і статус збою для запиту (0 - без збою) з генератора з seed"""
+        with self._lock:
+            prefixes = [prefix for prefix in self.faults if path.startswith(prefix)]
+            if not prefixes:
+                return 0.0, 0
+            faults = self.faults[max(prefixes, key=len)]
+            delay = faults.latency_s + (self._random.uniform(0, faults.jitter_s) if faults.jitter_s else 0.0)
+            failed = faults.failure_rate and self._random.random() < faults.failure_rate
+        return delay, faults.failure_status if failed else 0
+
+    def _start_record(self, method: str, path: str) -> Dict:
+        """Створити запис журналу для нового запиту"""
+        record = {"method": method, "path": path, "started_at": time.time(), "status": None,
+                  "duration_s": None, "injected_failure": False}
+        with self._lock:
+            self.request_log.append(record)
+        return record
+
+    def _validate(self, url: str) -> Optional[str]:
+        """Валідація URL фіду при збереженні"""
+        if not url:
+            return "URL фіду обов'язковий - заповніть поле"
+        if url in self.validation_overrides:
+            return self.validation_overrides[url]
+        return self.feed_validator(url)
+
+    def _login(self, body: bytes) -> StubResponse:
+        """POST /user/login"""
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            data = {key: values[-1] for key, values in parse_qs(body.decode("utf-8")).items()}
+        email = str(data.get("email", "")).strip()
+        user = self.users.get(email.lower())
+        if user is None:
+            corporate = email.lower().rsplit("@", 1)[-1] in self.ldap_domains
+            code = "invalid-ldap-password" if corporate else "no-user"
+        elif user.password != data.get("password"):
+            code = "invalid-ldap-password"
+        else:
+            code = user.code
+        if code:
+            return 200, "application/json", _json({"status": "fail", "code": code,
+                                                   "message": LOGIN_MESSAGES.get(code, code)}), {}
+        token = secrets.token_hex(16)
+        with self._lock:
+            self._sessions[token] = user.email
+        cookies = [f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax",
+                   f"{CSRF_COOKIE}={secrets.token_hex(16)}; Path=/; SameSite=Lax"]
+        return 200, "application/json", _json({"status": "ok"}), {"Set-Cookie": cookies}
+
+    def _feed_fields(self, feed: Optional[StubFeed], data: Dict) -> Optional[StubResponse]:
+        """
+        Перевірити і застосувати поля фіду (викликається під self._lock)
+
+        Returns:
+            Відповідь з помилкою або None якщо поля застосовано
+        """
+        if data.get("is_active") and not (feed and feed.is_active):
+            if len(self.active_feed_ids()) >= self.active_limit:
+                return 400, "application/json", _json({"status": "fail", "message": ACTIVE_LIMIT_ERROR}), {}
+        if feed is not None:
+            if "origin_url" in data:
+                feed.origin_url = str(data["origin_url"]).strip()
+            if "is_active" in data:
+                feed.is_active = bool(data["is_active"])
+            if feed.is_active:
+                # Підключений фід HUB завантажує одразу - для сортування за "Останнє завантаження"
+                feed.last_upload = time.time()
+        return None
+
+    def _set_feeds(self, data: Dict, file: Optional[bytes]) -> StubResponse:
+        """
+        POST set-feeds: збереження налаштувань фіду з upsert за origin_url (новий URL валідується),
+        з file - завантаження Excel мапінгу фіду
+        """
+        def error(status: int, message: str) -> StubResponse:
+            return status, "application/json", _json({"status": "fail", "message": message}), {}
+
+        url = str(data.get("origin_url", "")).strip()
+        with self._lock:
+            existing = self._find_feed(url) if url else None
+        if file is not None:
+            if existing is None:
+                return error(404, f"Фід з URL '{url}' не знайдено")
+            problem = validate_mapping_workbook(file)
+            if problem:
+                return error(400, problem)
+            existing.mapping = file
+            return 200, "application/json", _json({"status": "ok", **existing.to_json()}), {}
+        if existing is None:
+            # Валідація (завантаження фіду) - поза локом, вона може тривати до таймаутів HUB
+            problem = self._validate(url)
+            if problem:
+                return error(400, problem)
+        with self._lock:
+            # Ключ upsert - origin_url, тому URL існуючого фіду set-feeds не змінює
+            fields = {key: value for key, value in data.items() if key != "origin_url"}
+            problem_response = self._feed_fields(existing, fields)
+            if problem_response:
+                return problem_response
+            feed = existing or self._create_feed(_base_feed_url(url), bool(data.get("is_active")))
+        return 200, "application/json", _json({"status": "ok", **feed.to_json()}), {}
+
+    def _gen_mapping_file(self, feed_id: str) -> StubResponse:
+        """GET gen-mapping-file?feed_id=: Excel мапінгу фіду (завантажений через set-feeds або згенерований)"""
+        feed = self.feeds.get(feed_id.strip())
+        if feed is None:
+            return 404, "application/json", _json({"status": "fail", "message": f"Фід {feed_id} не знайдено"}), {}
+        workbook = feed.mapping or _default_mapping_workbook()
+        disposition = f'attachment; filename="mapping_{feed.feed_id}.xlsx"'
+        return (200, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", workbook,
+                {"Content-Disposition": disposition})
+
+    def _feeds_api(self, method: str, parts: List[str], body: bytes) -> StubResponse:
+        """
+        Читання фідів для сторінки заміни: /api/supplier-content/xml/feeds[/<feed_id>].
+        Маршрут списку - власний маршрут заміни (у HUB він не задокументований; сторінка розпізнає список
+        за формою відповіді), збереження - лише через set-feeds
+        """
+        def error(status: int, message: str) -> StubResponse:
+            return status, "application/json", _json({"status": "fail", "message": message}), {}
+
+        if method != "GET":
+            return error(405, f"{method} не підтримується")
+        if not parts:
+            feeds = [feed.to_json() for feed in self.feeds.values()]
+            return 200, "application/json", _json({"feeds": feeds}), {}
+        feed = self.feeds.get(parts[0])
+        if feed is None or len(parts) > 1:
+            return error(404, f"Фід {parts[0]} не знайдено")
+        return 200, "application/json", _json(feed.to_json()), {}
+
+    def _route(self, method: str, path: str, query: Dict[str, str], body: bytes, session: str,
+               form: Optional[Dict[str, str]] = None) -> StubResponse:
+        """
+        Відповідь на запит (без затримок і збоїв - їх застосовує обробник)
+
+        Args:
+            form: Текстові поля multipart-форми (тоді body - вміст файлу з форми), None - звичайне тіло
+        """
+        authenticated = session in self._sessions
+        html = "text/html; charset=utf-8"
+        if path == LOGIN_PATH:
+            if method == "POST":
+                return self._login(body)
+            return 200, html, LOGIN_HTML.encode("utf-8"), {}
+        if path == "/" and query.get("supplier-reg"):
+            return 200, html, LOGIN_HTML.encode("utf-8"), {}
+        if path == SET_FEEDS_PATH and method == "POST":
+            if not authenticated:
+                return 401, "application/json", _json({"status": "fail", "code": "unauthorized"}), {}
+            if form is not None:
+                return self._set_feeds(form, body if body else None)
+            try:
+                data = json.loads(body) if body else {}
+            except ValueError:
+                return 400, "application/json", _json({"status": "fail", "message": "Некоректний JSON"}), {}
+            return self._set_feeds(data, None)
+        if path == GEN_MAPPING_FILE_PATH and method == "GET":
+            if not authenticated:
+                return 401, "application/json", _json({"status": "fail", "code": "unauthorized"}), {}
+            return self._gen_mapping_file(query.get("feed_id", ""))
+        if path.startswith(FEEDS_API_PATH):
+            if not authenticated:
+                return 401, "application/json", _json({"status": "fail", "code": "unauthorized"}), {}
+            parts = [part for part in path[len(FEEDS_API_PATH):].split("/") if part]
+            return self._feeds_api(method, parts, body)
+        if path == SUPPLIERS_API_PATH:
+            if not authenticated:
+                return 401, "application/json", _json({"status": "fail", "code": "unauthorized"}), {}
+            needle = query.get("q", "").casefold()
+            items = [{"id": supplier_id, "name": name} for supplier_id, name in self.suppliers.items()
+                     if needle in name.casefold()]
+            return 200, "application/json", _json({"items": items, "total": len(self.suppliers)}), {}
+        if path in ("/", FEEDS_PAGE_PATH):
+            if not authenticated:
+                return 302, html, b"", {"Location": LOGIN_PATH}
+            if "supplier_id" in query:
+                if query["supplier_id"] not in self.suppliers:
+                    return 404, "text/plain; charset=utf-8", "Постачальника не знайдено".encode("utf-8"), {}
+                with self._lock:
+                    self.session_suppliers[session] = query["supplier_id"]
+            page = FEEDS_HTML if path == FEEDS_PAGE_PATH else DASHBOARD_HTML
+            with self._lock:
+                supplier = self.suppliers.get(self.session_suppliers.get(session, ""), "")
+            page = page.replace(_SUPPLIER_SLOT, escape(supplier), 1)
+            return 200, html, page.encode("utf-8"), {}
+        return 404, "text/plain; charset=utf-8", b"Not found", {}
+
+    # --- Життєвий цикл ---
+
+    @property
+    def base_url(self) -> str:
+        """Базовий URL заміни HUB"""
+        return f"http://127.0.0.1:{self.port}"
+
+    def config_urls(self) -> Dict[str, str]:
+        """Атрибути TestConfig з URL HUB -> URL заміни"""
+        return {
+            "BASE_URL": self.base_url,
+            "LOGIN_URL": f"{self.base_url}{LOGIN_PATH}",
+            "DASHBOARD_URL": f"{self.base_url}/",
+            "XML_FEEDS_URL": f"{self.base_url}{FEEDS_PAGE_PATH}",
+            "XML_FEED_ADD_URL": f"{self.base_url}{FEEDS_PAGE_PATH}?feed_id=%20%20%20&tab=feed",
+            "SET_FEEDS_API_URL": f"{self.base_url}{SET_FEEDS_PATH}",
+            "GEN_MAPPING_FILE_API_URL": f"{self.base_url}{GEN_MAPPING_FILE_PATH}?feed_id={{feed_id}}",
+            "SUPPLIERS_API_URL": f"{self.base_url}{SUPPLIERS_API_PATH}",
+            "SUPPLIER_SWITCH_URL": f"{self.base_url}{FEEDS_PAGE_PATH}?supplier_id={{supplier_id}}",
+        }
+
+    def feed_store(self) -> "StubFeedStore":
+        """Стан фідів заміни з тим самим інтерфейсом, що FeedStore (utils/feed_api.py) над БД HUB"""
+        return StubFeedStore(self)
+
+    def requests_for(self, path: str) -> List[Dict]:
+        """Записи журналу запитів для шляху"""
+        with self._lock:
+            return [record for record in self.request_log if record["path"] == path]
+
+    def start(self) -> "HubStubServer":
+        """Запустити сервер у фоновому потоці"""
+        self._stopping.clear()
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _HubStubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.hub = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="hub-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Зупинити сервер (затримки запитів, що виконуються, перериваються)"""
+        self._stopping.set()
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self):
+        """Контекстний менеджер: запуск"""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Контекстний менеджер: зупинка"""
+        self.stop()
+
+
+class StubFeedStore:
+    """FeedStore для заміни HUB: feed_id, origin_url і is_active з пам'яті заміни замість БД"""
+
+    def __init__(self, hub: HubStubServer):
+        self.hub = hub
+
+    @staticmethod
+    def _record(feed: StubFeed) -> FeedRecord:
+        return FeedRecord.from_json(feed.to_json())
+
+    def find(self, origin_url: str) -> Optional[FeedRecord]:
+        with self.hub._lock:
+            feed = self.hub._find_feed(origin_url)
+        return self._record(feed) if feed else None
+
+    def find_all(self, url_part: str) -> List[FeedRecord]:
+        with self.hub._lock:
+            feeds = [feed for feed in self.hub.feeds.values() if url_part in feed.origin_url]
+        return [self._record(feed) for feed in feeds]
+
+    def get(self, feed_id: str) -> Optional[FeedRecord]:
+        feed = self.hub.feeds.get(feed_id.strip())
+        return self._record(feed) if feed else None
+
+    def delete(self, feed_id: str):
+        with self.hub._lock:
+            self.hub.feeds.pop(feed_id.strip(), None)
+
+    def close(self):
+        pass
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Локальна заміна HUB (логін, XML-фіди, мапінг)")
+    parser.add_argument("--port", type=int, default=9880)
+    parser.add_argument("--email", default="stub.user@kasta.ua")
+    parser.add_argument("--password", default="stub-password")
+    parser.add_argument("--latency", type=float, default=0.0, help="Затримка відповідей, с")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Частка відповідей 503")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = HubStubServer(port=args.port, seed=args.seed)
+    server.add_user(args.email, args.password)
+    if args.latency or args.failure_rate:
+        server.set_faults("", HubFaults(latency_s=args.latency, failure_rate=args.failure_rate))
+    server.start()
+    print(f"HUB stub: {server.base_url}{LOGIN_PATH} ({args.email} / {args.password})")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
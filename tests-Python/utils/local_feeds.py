@@ -0,0 +1,136 @@
+"""
+Набір тестових фідів для локального сервера фідів (utils/feed_server.py).
+Замінює зовнішні URL з TestConfig (gist, dropbox, floatrates) локальними маршрутами.
+"""
+import threading
+from typing import Dict, Iterator
+
+from utils.feed_generator import YmlFeedGenerator
+from utils.feed_server import FeedBehavior, FeedServer
+
+
+# Атрибут TestConfig -> шлях на локальному сервері
+LOCAL_FEED_PATHS = {
+    "TEST_XML_FEED_URL": "/valid.xml",
+    "TEST_HTTP_XML_FEED_URL": "/http-feed.xml",
+    "TEST_INVALID_XML_FEED_URL": "/json-inside.xml",
+    "TEST_INVALID_XML_STRUCTURE_URL": "/broken.xml",
+    "TEST_404_FEED_URL": "/missing.xml",
+    "TEST_XML_FEED_TWO_VERSIONS_URL": "/two-versions.xml",
+    "TEST_SLOW_FEED_URL": "/slow.xml",
+    "TEST_STALLED_FEED_URL": "/stalled.xml",
+}
+
+# Вміст з розширенням .xml, але у форматі JSON (очікується "Unexpected character")
+JSON_INSIDE_XML = '{"items": [{"id": "test-1", "title": "Test Product", "price": 100}]}'
+
+# Обірваний XML (незакриті теги) для TC-XML-008
+BROKEN_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<yml_catalog date="2024-01-01 00:00">
+<shop>
+<categories>
+<category id="1000">Парфуми
+</categories>
+<offers>
+<offer id="broken-1"><name>Broken offer</name>
+"""
+
+XML_ONE_ITEM = """<?xml version="1.0" encoding="UTF-8"?>
+<items>
+  <item>
+    <title>Item for disabled-feed test</title>
+    <id>blocked-test-1</id>
+    <price>100</price>
+  </item>
+</items>"""
+
+XML_TWO_ITEMS = """<?xml version="1.0" encoding="UTF-8"?>
+<items>
+  <item>
+    <title>Item for disabled-feed test</title>
+    <id>blocked-test-1</id>
+    <price>100</price>
+  </item>
+  <item>
+    <title>New item that must not be loaded when checkbox is off</title>
+    <id>blocked-test-2</id>
+    <price>200</price>
+  </item>
+</items>"""
+
+# Ліміти feed-download у HUB: conn-timeout 1 хв, socket-timeout 5 хв
+HUB_CONN_TIMEOUT_S = 60
+HUB_SOCKET_TIMEOUT_S = 300
+
+# Повільний фід: валідний документ віддається зі швидкістю SLOW_FEED_BYTES_PER_S
+SLOW_FEED_BYTES_PER_S = 512
+# Завислий фід: після заголовків і початку документа сервер мовчить довше за socket-timeout HUB
+STALLED_FEED_STALL_S = HUB_SOCKET_TIMEOUT_S * 2
+STALLED_FEED_AFTER_BYTES = 64
+
+# Додаткові сценарії таймаутів (URL - через local_feed_server.url(path))
+ACCEPT_THEN_STALL_PATH = "/accept-then-stall.xml"
+SLOW_HEADERS_PATH = "/slow-headers.xml"
+CLOSE_MID_BODY_PATH = "/close-mid-body.xml"
+SLOW_HEADERS_INTERVAL_S = 20.0
+CLOSE_MID_BODY_AFTER_BYTES = 512
+
+
+def register_test_feeds(server: FeedServer) -> Dict[str, str]:
+    """
+    Зареєструвати на сервері всі варіанти фідів, потрібні тестам
+
+    Args:
+        server: Локальний сервер фідів (маршрути можна додавати до і після запуску)
+
+    Returns:
+        Словник атрибут TestConfig -> URL фіду на локальному сервері
+    """
+    valid_feed = YmlFeedGenerator(categories=5, offers=20, images_per_offer=1)
+    server.add_generated_feed(LOCAL_FEED_PATHS["TEST_XML_FEED_URL"], valid_feed)
+    server.add_generated_feed(LOCAL_FEED_PATHS["TEST_HTTP_XML_FEED_URL"], valid_feed)
+
+    server.add_route(
+        LOCAL_FEED_PATHS["TEST_INVALID_XML_FEED_URL"], JSON_INSIDE_XML,
+        content_type="application/octet-stream"
+    )
+    server.add_route(LOCAL_FEED_PATHS["TEST_INVALID_XML_STRUCTURE_URL"], BROKEN_XML)
+    server.add_route(
+        LOCAL_FEED_PATHS["TEST_404_FEED_URL"], "Not found",
+        status=404, content_type="text/plain; charset=utf-8"
+    )
+
+    # 1-й запит — 1 товар, наступні — 2 товари (як serve-http-feed-two-versions.js у tests-ts)
+    two_versions_lock = threading.Lock()
+    two_versions_count = [0]
+
+    def two_versions(query: Dict[str, str]) -> Iterator[bytes]:
+        with two_versions_lock:
+            two_versions_count[0] += 1
+            first = two_versions_count[0] == 1
+        yield (XML_ONE_ITEM if first else XML_TWO_ITEMS).encode("utf-8")
+
+    server.add_route(LOCAL_FEED_PATHS["TEST_XML_FEED_TWO_VERSIONS_URL"], two_versions)
+
+    server.add_generated_feed(
+        LOCAL_FEED_PATHS["TEST_SLOW_FEED_URL"], valid_feed,
+        behavior=FeedBehavior.drip(SLOW_FEED_BYTES_PER_S)
+    )
+    server.add_generated_feed(
+        LOCAL_FEED_PATHS["TEST_STALLED_FEED_URL"], valid_feed,
+        behavior=FeedBehavior.stall_mid_body(STALLED_FEED_AFTER_BYTES, STALLED_FEED_STALL_S)
+    )
+    server.add_generated_feed(
+        ACCEPT_THEN_STALL_PATH, valid_feed,
+        behavior=FeedBehavior.accept_then_stall(STALLED_FEED_STALL_S)
+    )
+    server.add_generated_feed(
+        SLOW_HEADERS_PATH, valid_feed,
+        behavior=FeedBehavior.slow_headers(SLOW_HEADERS_INTERVAL_S)
+    )
+    server.add_generated_feed(
+        CLOSE_MID_BODY_PATH, valid_feed,
+        behavior=FeedBehavior.close_mid_body(CLOSE_MID_BODY_AFTER_BYTES)
+    )
+
+    return {attr: server.url(path) for attr, path in LOCAL_FEED_PATHS.items()}
@@ -0,0 +1,176 @@
+"""
+Реєстр варіантів локаторів з самоналаштуванням порядку.
+Замість послідовних спроб "варіант 1, потім варіант 2" з окремим очікуванням на кожен усі варіанти
+чекаються одночасно одним локатором (Locator.or_), а потім визначається, який саме спрацював.
+Варіант, що спрацьовував останнім часом, перевіряється першим (миттєво, без очікування).
+Статистика зберігається між запусками у JSON-файлі (TEST_LOCATOR_STATS) і виводиться в підсумку сесії.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from utils.worker_resources import ResourceLock
+
+
+# Згасання рейтингу варіанта на кожне розв'язання локатора: недавні збіги важать більше за давні,
+# тому після зміни UI новий варіант стає першим за кілька викликів
+SCORE_DECAY = 0.8
+
+Scope = Union[Page, Locator]
+
+
+class LocatorRegistry:
+    """Статистика варіантів локаторів і пошук елемента за всіма варіантами одночасно"""
+
+    def __init__(self, stats_path: Optional[str] = None):
+        """
+        Ініціалізація реєстру
+
+        Args:
+            stats_path: JSON-файл статистики, спільний для воркерів і запусків (None - лише в пам'яті)
+        """
+        self.stats_path = Path(stats_path) if stats_path else None
+        # name -> {"resolved": n, "not_found": n, "hits": {варіант: n}, "score": {варіант: рейтинг}}
+        self.stats: Dict[str, Dict] = self._load()
+        # Приріст за цей процес - додається до файлу при save(), щоб не затерти статистику інших воркерів
+        self._delta: Dict[str, Dict] = {}
+
+    def _load(self) -> Dict[str, Dict]:
+        if self.stats_path is None:
+            return {}
+        try:
+            return json.loads(self.stats_path.read_text(encoding="utf-8")).get("locators", {})
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _entry(stats: Dict[str, Dict], name: str) -> Dict:
+        return stats.setdefault(name, {"resolved": 0, "not_found": 0, "hits": {}, "score": {}})
+
+    def order(self, name: str, variants: Sequence[str]) -> List[str]:
+        """Варіанти в порядку перевірки: спершу з найвищим рейтингом, при рівності - як оголошено"""
+        score = self.stats.get(name, {}).get("score", {})
+        return sorted(variants, key=lambda variant: -score.get(variant, 0.0))
+
+    def record(self, name: str, variants: Sequence[str], winner: Optional[str]):
+        """
+        Записати результат розв'язання локатора
+
+        Args:
+            name: Назва локатора
+            variants: Усі варіанти (шаблони)
+            winner: Варіант, що спрацював (None - жоден)
+        """
+        for stats in (self.stats, self._delta):
+            entry = self._entry(stats, name)
+            if winner is None:
+                entry["not_found"] += 1
+                continue
+            entry["resolved"] += 1
+            entry["hits"][winner] = entry["hits"].get(winner, 0) + 1
+        if winner is not None:
+            score = self._entry(self.stats, name)["score"]
+            for variant in variants:
+                score[variant] = round(score.get(variant, 0.0) * SCORE_DECAY + (1 if variant == winner else 0), 4)
+
+    def resolve(self, scope: Scope, name: str, variants: Sequence[str], timeout: int = 10000,
+                state: str = "visible", **params) -> Optional[Locator]:
+        """
+        Знайти елемент за будь-яким з варіантів
+
+        Args:
+            scope: Сторінка або локатор-контейнер
+            name: Назва локатора (ключ статистики)
+            variants: Селектори-шаблони; {параметр} підставляється з params (статистика - за шаблоном)
+            timeout: Максимальний час очікування в мс (спільний для всіх варіантів)
+            state: "visible" або "attached" (напр. прихований input[type=file])
+            params: Значення для шаблонів (напр. supplier="Парфюмс")
+
+        Returns:
+            Локатор першого елемента варіанта, що спрацював, або None якщо жоден не з'явився до дедлайну
+        """
+        ordered = self.order(name, variants)
+        locators = {variant: scope.locator(variant.format(**params) if params else variant).first
+                    for variant in ordered}
+
+        def matches(locator: Locator) -> bool:
+            return locator.is_visible() if state == "visible" else locator.count() > 0
+
+        # Швидкий шлях: варіант-лідер вже на сторінці - одна миттєва перевірка
+        if matches(locators[ordered[0]]):
+            self.record(name, variants, ordered[0])
+            return locators[ordered[0]]
+        any_variant = locators[ordered[0]]
+        for variant in ordered[1:]:
+            any_variant = any_variant.or_(locators[variant])
+        try:
+            any_variant.first.wait_for(state=state, timeout=timeout)
+        except PlaywrightTimeoutError:
+            self.record(name, variants, None)
+            return None
+        for variant in ordered:
+            if matches(locators[variant]):
+                self.record(name, variants, variant)
+                return locators[variant]
+        # Елемент зник між очікуванням і перевіркою - повертаємо спільний локатор без запису статистики
+        return any_variant.first
+
+    def hit_rates(self) -> Dict[str, Dict[str, float]]:
+        """Частка спрацювань кожного варіанта серед усіх розв'язань локатора (за весь час)"""
+        rates = {}
+        for name, entry in self.stats.items():
+            total = entry["resolved"] + entry["not_found"]
+            rates[name] = {variant: hits / total for variant, hits in entry["hits"].items()} if total else {}
+        return rates
+
+    def summary(self) -> str:
+        """Підсумок: для кожного локатора - частка спрацювань варіантів і промахів усіх варіантів"""
+        lines = []
+        for name, variants in sorted(self.hit_rates().items()):
+            entry = self.stats[name]
+            total = entry["resolved"] + entry["not_found"]
+            parts = [f"{variant} {rate:.0%}" for variant, rate in sorted(variants.items(), key=lambda item: -item[1])]
+            if entry["not_found"]:
+                parts.append(f"не знайдено {entry['not_found'] / total:.0%}")
+            lines.append(f"  {name} ({total}): " + ", ".join(parts))
+        return "\n".join(lines)
+
+    def save(self):
+        """Додати приріст цього процесу до файлу статистики (під локом, атомарним записом)"""
+        if self.stats_path is None or not self._delta:
+            return
+        self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        with ResourceLock(str(self.stats_path.parent), "locator-stats", timeout=60):
+            merged = self._load()
+            for name, delta in self._delta.items():
+                entry = self._entry(merged, name)
+                entry["resolved"] += delta["resolved"]
+                entry["not_found"] += delta["not_found"]
+                for variant, hits in delta["hits"].items():
+                    entry["hits"][variant] = entry["hits"].get(variant, 0) + hits
+                # Рейтинг - з найсвіжішої картини цього процесу
+                entry["score"].update(self.stats.get(name, {}).get("score", {}))
+            fd, tmp = tempfile.mkstemp(dir=str(self.stats_path.parent))
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"locators": merged}, file, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.stats_path)
+        self.stats = merged
+        self._delta = {}
+
+
+_registry = LocatorRegistry()
+
+
+def get_registry() -> LocatorRegistry:
+    """Реєстр процесу, яким користуються Page Objects"""
+    return _registry
+
+
+def set_registry(registry: LocatorRegistry):
+    """Встановити реєстр процесу (conftest: з файлом статистики TEST_LOCATOR_STATS)"""
+    global _registry
+    _registry = registry
@@ -0,0 +1,301 @@
+"""
+Пакетні спроби логіну на рівні API - без повного циклу браузера на кожну спробу.
+Формат запиту логіну не зашитий у тести: він перехоплюється з однієї спроби через UI
+(LoginRequestTemplate.capture), після чого решта спроб відправляється тим самим запитом
+через fetch у контексті сторінки (ті самі origin і cookies), паралельно з обмеженням concurrency.
+"""
+import json
+import re
+import statistics
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+from playwright.sync_api import Page, Request
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+# Запит форми логіну (POST на URL з login/auth)
+LOGIN_REQUEST_RE = re.compile(r"(login|auth|ldap)", re.I)
+# Заголовки, які переносяться з перехопленого запиту (решту браузер ставить сам або забороняє)
+_TEMPLATE_HEADERS = re.compile(r"^(content-type|accept|x-[\w-]+)$", re.I)
+# Ознаки помилки СУБД у відповіді - injection дійшов до SQL
+SQL_ERROR_RE = re.compile(
+    r"(syntax error|unterminated quoted string|PSQLException|SQLException|SQLSTATE|"
+    r"pg_query|ORA-\d{5}|mysql_|sqlite3?\.|ERROR:\s+column|invalid input syntax)",
+    re.I
+)
+# На скільки мс відповідь може бути повільнішою за медіану, перш ніж це вважається time-based injection
+SLOW_RESPONSE_MARGIN_MS = 3000
+
+# Відправити тіла запитів пулом з concurrency "воркерів" fetch; результат - у порядку тіл
+_RUN_BATCH_JS = """
+async ({ url, method, headers, bodies, concurrency, timeout }) => {
+    const results = new Array(bodies.length);
+    let next = 0;
+    async function worker() {
+        while (next < bodies.length) {
+            const index = next++;
+            const started = performance.now();
+            try {
+                const response = await fetch(url, {
+                    method, headers, body: bodies[index], credentials: 'include', signal: AbortSignal.timeout(timeout),
+                });
+                const text = await response.text();
+                results[index] = {
+                    status: response.status, url: response.url, body: text.slice(0, 4000),
+                    elapsed_ms: performance.now() - started, error: '',
+                };
+            } catch (e) {
+                results[index] = { status: 0, url, body: '', elapsed_ms: performance.now() - started, error: String(e) };
+            }
+        }
+    }
+    await Promise.all(Array.from({ length: Math.min(concurrency, bodies.length) }, worker));
+    return results;
+}
+"""
+
+
+def load_payloads(path: str, groups: Optional[Iterable[str]] = None) -> List[Dict[str, str]]:
+    """
+    Завантажити payloads з JSON-файлу {"група": [{"payload": ..., "description": ...}, ...]}
+
+    Args:
+        path: Шлях до файлу
+        groups: Групи, які потрібні (None - усі)
+
+    Returns:
+        Список {"payload", "description", "group"} у порядку файлу
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    selected = list(groups) if groups is not None else list(data)
+    missing = [group for group in selected if group not in data]
+    if missing:
+        raise KeyError(f"Групи payloads не знайдено у {path}: {missing}")
+    return [dict(item, group=group) for group in selected for item in data[group]]
+
+
+def load_login_matrix(path: str, values: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Завантажити матрицю негативних кейсів логіну [{"id", "description", "email", "password", "expected"}, ...]
+
+    Args:
+        path: Шлях до JSON-файлу
+        values: Значення плейсхолдерів у email і паролі ({user_email}, {user_password}, ...)
+
+    Returns:
+        Кейси з підставленими email і паролем
+    """
+    cases = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [dict(case, email=case["email"].format_map(values), password=case["password"].format_map(values))
+            for case in cases]
+
+
+class LoginAttempt:
+    """Результат однієї спроби логіну через API"""
+
+    __slots__ = ("email", "password", "status", "url", "body", "elapsed_ms", "error")
+
+    def __init__(self, email: str, password: str, status: int, url: str, body: str,
+                 elapsed_ms: float, error: str = ""):
+        self.email = email
+        self.password = password
+        self.status = status
+        self.url = url
+        self.body = body
+        self.elapsed_ms = elapsed_ms
+        self.error = error
+
+    def json(self) -> Optional[Dict[str, Any]]:
+        """Тіло відповіді як JSON-об'єкт (None якщо це не JSON-об'єкт)"""
+        try:
+            data = json.loads(self.body)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+    @property
+    def code(self) -> str:
+        """Код помилки з відповіді ({"status": "fail", "code": ...})"""
+        data = self.json() or {}
+        return str(data.get("code") or "")
+
+    def __repr__(self) -> str:
+        return (f"LoginAttempt(email={self.email!r}, status={self.status}, code={self.code!r}, "
+                f"elapsed_ms={self.elapsed_ms:.0f})")
+
+
+class LoginRequestTemplate:
+    """Запит логіну, перехоплений з UI, у який підставляються інші email і пароль"""
+
+    def __init__(self, url: str, method: str, headers: Dict[str, str], body: str,
+                 email: str, password: str):
+        """
+        Args:
+            url: URL запиту логіну
+            method: HTTP метод
+            headers: Заголовки, що переносяться в fetch (content-type, accept, x-*)
+            body: Тіло перехопленого запиту
+            email: Email, з яким запит перехоплено (замінюється в тілі)
+            password: Пароль, з яким запит перехоплено (замінюється в тілі)
+        """
+        self.url = url
+        self.method = method
+        self.headers = headers
+        self.body = body
+        self.email = email
+        self.password = password
+        self._is_json = self._parse_json(body) is not None
+        if not self._is_json and "=" not in body:
+            raise ValueError(f"Невідомий формат тіла запиту логіну (не JSON і не form): {body[:200]!r}")
+
+    @staticmethod
+    def _parse_json(body: str) -> Optional[Any]:
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    @classmethod
+    def from_request(cls, request: Request, email: str, password: str) -> "LoginRequestTemplate":
+        """Шаблон з перехопленого запиту Playwright"""
+        headers = {name: value for name, value in request.headers.items() if _TEMPLATE_HEADERS.match(name)}
+        return cls(request.url, request.method, headers, request.post_data or "", email, password)
+
+    @classmethod
+    def capture(cls, page: Page, action: Callable[[], None], email: str, password: str,
+                timeout: int = 10000) -> Optional["LoginRequestTemplate"]:
+        """
+        Перехопити запит логіну під час дії в UI
+
+        Args:
+            page: Сторінка логіну
+            action: Дія, що відправляє форму (напр. login_page.attempt_login(...))
+            email: Email, введений у форму
+            password: Пароль, введений у форму
+            timeout: Скільки чекати запит (мс)
+
+        Returns:
+            Шаблон або None якщо запит логіну не перехоплено
+        """
+        try:
+            with page.expect_request(
+                lambda request: request.method in ("POST", "PUT") and bool(LOGIN_REQUEST_RE.search(request.url)),
+                timeout=timeout
+            ) as request_info:
+                action()
+            return cls.from_request(request_info.value, email, password)
+        except PlaywrightTimeoutError as e:
+            print(f">>> Запит логіну не перехоплено: {e}")
+            return None
+
+    def _substitute(self, value: Any, email: str, password: str) -> Any:
+        """Замінити значення email і пароля в розібраному тілі"""
+        if isinstance(value, dict):
+            return {key: self._substitute(item, email, password) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._substitute(item, email, password) for item in value]
+        if value == self.email:
+            return email
+        if value == self.password:
+            return password
+        return value
+
+    def render(self, email: str, password: str) -> str:
+        """Тіло запиту з іншими email і паролем"""
+        if self._is_json:
+            return json.dumps(self._substitute(self._parse_json(self.body), email, password), ensure_ascii=False)
+        pairs = [(key, self._substitute(value, email, password))
+                 for key, value in parse_qsl(self.body, keep_blank_values=True)]
+        return urlencode(pairs)
+
+
+def run_login_batch(page: Page, template: LoginRequestTemplate, credentials: List[Tuple[str, str]],
+                    concurrency: int = 8, timeout: int = 30000) -> List[LoginAttempt]:
+    """
+    Відправити спроби логіну пакетом через fetch у контексті сторінки
+
+    Args:
+        page: Сторінка на origin HUB (напр. сторінка логіну після UI-спроби)
+        template: Перехоплений запит логіну
+        credentials: Пари (email, пароль)
+        concurrency: Скільки запитів виконується одночасно
+        timeout: Таймаут одного запиту (мс)
+
+    Returns:
+        Результати у порядку credentials
+    """
+    if not credentials:
+        return []
+    bodies = [template.render(email, password) for email, password in credentials]
+    results = page.evaluate(_RUN_BATCH_JS, {
+        "url": template.url, "method": template.method, "headers": template.headers,
+        "bodies": bodies, "concurrency": max(1, concurrency), "timeout": timeout,
+    })
+    return [LoginAttempt(email, password, **result) for (email, password), result in zip(credentials, results)]
+
+
+def find_injection_failures(attempts: List[LoginAttempt], login_url: str,
+                            slow_margin_ms: float = SLOW_RESPONSE_MARGIN_MS) -> List[str]:
+    """
+    Спроби, у яких injection міг спрацювати
+
+    Ознаки: помилка мережі або 5xx, успішний логін (status "ok" або відповідь не зі сторінки логіну),
+    текст помилки СУБД у відповіді, відповідь повільніша за медіану пакета більше ніж на slow_margin_ms.
+
+    Args:
+        attempts: Результати run_login_batch
+        login_url: URL сторінки логіну (редирект з неї без помилки - ознака успішного логіну)
+        slow_margin_ms: Допустиме перевищення медіани часу відповіді (мс)
+
+    Returns:
+        Описи проблем (порожній список - усі спроби відхилено коректно)
+    """
+    failures = []
+    median_ms = statistics.median(attempt.elapsed_ms for attempt in attempts) if attempts else 0.0
+    for attempt in attempts:
+        label = f"{attempt.email!r} / {attempt.password!r}"
+        data = attempt.json()
+        if attempt.error or attempt.status == 0:
+            failures.append(f"{label}: запит не виконався ({attempt.error})")
+        elif attempt.status >= 500:
+            failures.append(f"{label}: {attempt.status} - сервер не обробив payload: {attempt.body[:200]}")
+        elif data is not None and data.get("status") == "ok":
+            failures.append(f"{label}: логін успішний: {attempt.body[:200]}")
+        elif data is None and attempt.status < 400 and attempt.url.split("?")[0] != login_url.split("?")[0]:
+            failures.append(f"{label}: відповідь не JSON і редирект на {attempt.url}")
+        sql_error = SQL_ERROR_RE.search(attempt.body)
+        if sql_error:
+            failures.append(f"{label}: помилка СУБД у відповіді: {sql_error.group(0)}")
+        if attempt.elapsed_ms > median_ms + slow_margin_ms:
+            failures.append(
+                f"{label}: відповідь {attempt.elapsed_ms:.0f} мс при медіані {median_ms:.0f} мс (time-based injection?)"
+            )
+    return failures
+
+
+def find_matrix_mismatches(cases: List[Dict[str, Any]], attempts: List[LoginAttempt]) -> List[str]:
+    """
+    Спроби, відповідь на які не збігається з очікуваною в матриці
+
+    Args:
+        cases: Кейси load_login_matrix ("expected": {"status": ..., "code": [допустимі коди] або null - будь-який})
+        attempts: Результати run_login_batch у порядку кейсів
+
+    Returns:
+        Описи розбіжностей (порожній список - усі кейси відповідають очікуванням)
+    """
+    mismatches = []
+    for case, attempt in zip(cases, attempts):
+        expected = case["expected"]
+        label = f"{case['id']} ({attempt.email!r})"
+        data = attempt.json()
+        if attempt.error or attempt.status == 0 or attempt.status >= 500:
+            mismatches.append(f"{label}: HTTP {attempt.status} {attempt.error or attempt.body[:200]}")
+        elif data is None:
+            mismatches.append(f"{label}: відповідь не JSON (HTTP {attempt.status}): {attempt.body[:200]}")
+        elif data.get("status") != expected["status"]:
+            mismatches.append(f"{label}: status={data.get('status')!r}, очікувався {expected['status']!r}")
+        elif expected.get("code") is not None and attempt.code not in expected["code"]:
+            mismatches.append(f"{label}: code={attempt.code!r}, очікувався один з {expected['code']}")
+    return mismatches
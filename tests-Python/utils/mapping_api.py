@@ -0,0 +1,251 @@
+"""
+Клієнт API Excel мапінгу фіду: скачування і завантаження файлу мапінгу без UI.
+Замість кнопок на сторінці фіду (expect_download до 90 с, пошук прихованого input[type=file]) файл
+скачується handler-ом gen-mapping-file з cookies авторизованої сторінки - потоково в пам'ять або на диск -
+і завантажується multipart-запитом set-feeds з полями origin_url і file (як кнопка "Завантажити ручний
+мапінг категорій"). Для кожної передачі окремо вимірюються час передачі даних і час обробки на сервері.
+Працює на requests (а не page.request): APIResponse Playwright віддає тіло лише цілком і без таймінгів.
+"""
+import io
+import secrets
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote
+import requests
+from playwright.sync_api import Page
+
+from utils.feed_api import FeedApiError, FeedStore
+
+
+# Розмір блоку при потоковому читанні/записі
+CHUNK_SIZE = 256 * 1024
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+# Поле multipart з файлом мапінгу у set-feeds (схема SupplierFeeds)
+MAPPING_FILE_FIELD = "file"
+
+
+class _TimedReader(io.BytesIO):
+    """Тіло запиту, яке запам'ятовує момент, коли requests дочитав його до кінця (відправлено останній блок)"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.finished_at: Optional[float] = None
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        chunk = super().read(size)
+        if not chunk and self.finished_at is None:
+            self.finished_at = time.perf_counter()
+        return chunk
+
+
+class MappingTransfer:
+    """Результат скачування або завантаження файлу мапінгу"""
+
+    __slots__ = ("feed_id", "direction", "status", "size_bytes", "transfer_s", "server_s", "total_s",
+                 "path", "content", "response")
+
+    def __init__(self, feed_id: str, direction: str, status: int, size_bytes: int, transfer_s: float,
+                 server_s: float, total_s: float, path: Optional[str] = None, content: Optional[bytes] = None,
+                 response: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            feed_id: ID фіду
+            direction: "download" або "upload"
+            status: HTTP статус відповіді
+            size_bytes: Розмір файлу мапінгу в байтах
+            transfer_s: Час передачі файлу (скачування тіла відповіді / відправлення тіла запиту)
+            server_s: Час обробки на сервері (до заголовків відповіді / від відправленого тіла до відповіді)
+            total_s: Загальний час запиту
+            path: Файл, у який збережено скачаний мапінг (якщо скачували на диск)
+            content: Скачаний мапінг (якщо скачували в пам'ять)
+            response: JSON-відповідь на завантаження
+        """
+        self.feed_id = feed_id
+        self.direction = direction
+        self.status = status
+        self.size_bytes = size_bytes
+        self.transfer_s = transfer_s
+        self.server_s = server_s
+        self.total_s = total_s
+        self.path = path
+        self.content = content
+        self.response = response
+
+    @property
+    def throughput_mb_s(self) -> float:
+        """Швидкість передачі файлу, МБ/с"""
+        return self.size_bytes / 1024 / 1024 / self.transfer_s if self.transfer_s else 0.0
+
+    def __str__(self) -> str:
+        action = "скачування" if self.direction == "download" else "завантаження"
+        return (f"{action} мапінгу {self.feed_id}: {self.size_bytes} байт, передача {self.transfer_s:.2f} с "
+                f"({self.throughput_mb_s:.1f} МБ/с), сервер {self.server_s:.2f} с, усього {self.total_s:.2f} с")
+
+
+class MappingApiClient:
+    """Скачування і завантаження Excel мапінгу фіду запитами з cookies авторизованої сесії"""
+
+    def __init__(self, download_url: str, set_feeds_url: str, store: Optional[FeedStore] = None,
+                 page: Optional[Page] = None, session: Optional[requests.Session] = None, timeout: float = 300):
+        """
+        Ініціалізація клієнта
+
+        Args:
+            download_url: URL gen-mapping-file з {feed_id} (TestConfig.GEN_MAPPING_FILE_API_URL)
+            set_feeds_url: URL set-feeds, на який завантажується мапінг (TestConfig.SET_FEEDS_API_URL)
+            store: Стан фідів для origin_url фіду при завантаженні (None - origin_url передає тест)
+            page: Сторінка, cookies контексту якої (і CSRF-токен, якщо HUB його видав) копіюються перед кожним
+                запитом - клієнт можна створити до логіну
+            session: requests.Session (напр. з cookies storage state); за замовчуванням - нова
+            timeout: Таймаут запиту в секундах (для великих мапінгів - хвилини)
+        """
+        self.download_url = download_url
+        self.set_feeds_url = set_feeds_url
+        self.store = store
+        self.page = page
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.transfers: List[MappingTransfer] = []
+
+    def _sync_cookies(self):
+        """Скопіювати в сесію актуальні cookies контексту сторінки"""
+        if self.page is None:
+            return
+        for cookie in self.page.context.cookies():
+            self.session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""),
+                                     path=cookie.get("path", "/"))
+            if cookie["name"] in ("csrftoken", "XSRF-TOKEN"):
+                self.session.headers["X-CSRFToken"] = cookie["value"]
+                self.session.headers["X-XSRF-TOKEN"] = cookie["value"]
+
+    def _origin_url(self, feed_id: str) -> str:
+        """origin_url фіду - ключ, за яким set-feeds знаходить фід для мапінгу"""
+        record = self.store.get(feed_id) if self.store is not None else None
+        if record is None:
+            raise FeedApiError(f"Фід {feed_id}: origin_url невідомий (немає в БД HUB), мапінг не завантажити")
+        return record.origin_url
+
+    def download(self, feed_id: str, path: Optional[Union[str, Path]] = None) -> MappingTransfer:
+        """
+        Скачати файл мапінгу фіду
+
+        Args:
+            feed_id: ID фіду
+            path: Файл або папка для збереження (папка - ім'я з Content-Disposition або mapping_<feed_id>.xlsx);
+                None - файл лишається в пам'яті (MappingTransfer.content)
+
+        Returns:
+            MappingTransfer з розміром, часом передачі і часом обробки на сервері (до заголовків відповіді)
+
+        Raises:
+            FeedApiError: Якщо запит не виконався, статус не 2xx або відповідь не файл (напр. HTML сторінки логіну)
+        """
+        url = self.download_url.format(feed_id=feed_id.strip())
+        self._sync_cookies()
+        started = time.perf_counter()
+        try:
+            response = self.session.get(url, stream=True, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise FeedApiError(f"GET {url}: {e}") from e
+        headers_at = time.perf_counter()
+        with response:
+            content_type = response.headers.get("Content-Type", "")
+            if not response.ok or "html" in content_type or "json" in content_type:
+                body = response.text[:500]
+                raise FeedApiError(f"GET {url} -> {response.status_code} ({content_type}): {body}",
+                                   response.status_code, body)
+            target = Path(path) if path is not None else None
+            if target is not None and target.is_dir():
+                filename = unquote(
+                    response.headers.get("Content-Disposition", "").partition("filename=")[2].strip('"; ')
+                )
+                target = target / (Path(filename).name or f"mapping_{feed_id}.xlsx")
+            size = 0
+            buffer = io.BytesIO() if target is None else None
+            with (target.open("wb") if target is not None else buffer) as sink:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    sink.write(chunk)
+                    size += len(chunk)
+                content = buffer.getvalue() if buffer is not None else None
+        finished = time.perf_counter()
+        transfer = MappingTransfer(
+            feed_id, "download", response.status_code, size, transfer_s=finished - headers_at,
+            server_s=headers_at - started, total_s=finished - started,
+            path=str(target) if target is not None else None, content=content
+        )
+        self.transfers.append(transfer)
+        print(f">>> {transfer}")
+        return transfer
+
+    @staticmethod
+    def _multipart(origin_url: str, filename: str, data: bytes) -> Tuple[bytes, str]:
+        """Тіло multipart/form-data set-feeds (origin_url і файл мапінгу) і його Content-Type"""
+        boundary = f"----hubmapping{secrets.token_hex(12)}"
+        head = (f"--{boundary}\r\nContent-Disposition: form-data; name=\"origin_url\"\r\n\r\n{origin_url}\r\n"
+                f"--{boundary}\r\nContent-Disposition: form-data; name=\"{MAPPING_FILE_FIELD}\"; "
+                f"filename=\"{filename}\"\r\nContent-Type: {XLSX_CONTENT_TYPE}\r\n\r\n").encode("utf-8")
+        return head + data + f"\r\n--{boundary}--\r\n".encode("ascii"), f"multipart/form-data; boundary={boundary}"
+
+    def upload(self, feed_id: str, file: Union[str, Path, bytes], filename: Optional[str] = None,
+               origin_url: Optional[str] = None) -> MappingTransfer:
+        """
+        Завантажити файл мапінгу у фід через set-feeds
+
+        Args:
+            feed_id: ID фіду
+            file: Шлях до .xlsx або вміст файлу
+            filename: Ім'я файлу в multipart (за замовчуванням - ім'я файлу або mapping_<feed_id>.xlsx)
+            origin_url: origin_url фіду (за замовчуванням - з БД HUB через store)
+
+        Returns:
+            MappingTransfer з розміром, часом відправлення файлу і часом обробки на сервері
+            (від відправленого останнього байта до відповіді)
+
+        Raises:
+            FeedApiError: Якщо origin_url фіду невідомий, запит не виконався, статус не 2xx, відповідь - HTML
+                або HUB відхилив файл ({"status": "fail"})
+        """
+        if isinstance(file, (str, Path)):
+            data = Path(file).read_bytes()
+            filename = filename or Path(file).name
+        else:
+            data = file
+        filename = filename or f"mapping_{feed_id}.xlsx"
+        body, content_type = self._multipart(origin_url or self._origin_url(feed_id), filename, data)
+        url = self.set_feeds_url
+        self._sync_cookies()
+        reader = _TimedReader(body)
+        started = time.perf_counter()
+        try:
+            response = self.session.post(url, data=reader, headers={"Content-Type": content_type,
+                                                                    "Accept": "application/json"},
+                                         timeout=self.timeout)
+        except requests.RequestException as e:
+            raise FeedApiError(f"POST {url}: {e}") from e
+        finished = time.perf_counter()
+        sent_at = reader.finished_at or finished
+        try:
+            payload = response.json()
+        except ValueError:
+            payload = None
+        # HTML у відповідь (сторінка застосунку або логіну) - endpoint не той або сесія не авторизована
+        if not response.ok or "html" in response.headers.get("Content-Type", "") \
+                or (isinstance(payload, dict) and payload.get("status") == "fail"):
+            raise FeedApiError(f"POST {url} -> {response.status_code}: {response.text[:500]}",
+                               response.status_code, response.text[:500])
+        transfer = MappingTransfer(
+            feed_id, "upload", response.status_code, len(data), transfer_s=sent_at - started,
+            server_s=finished - sent_at, total_s=finished - started,
+            response=payload if isinstance(payload, dict) else None
+        )
+        self.transfers.append(transfer)
+        print(f">>> {transfer}")
+        return transfer
+
+    def summary(self) -> str:
+        """Підсумок усіх передач клієнта (для звіту)"""
+        return "\n".join(f"  {transfer}" for transfer in self.transfers)
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,202 @@
+"""
+Генератор синтетичних Excel файлів мапінгу для тестів масштабування завантаження.
+Використовує write-only режим openpyxl: рядки пишуться потоково, пам'ять не залежить від розміру файлу.
+"""
+import random
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List
+from openpyxl import Workbook
+
+
+# Максимальна кількість рядків на аркуші .xlsx (з урахуванням рядка заголовків)
+EXCEL_MAX_DATA_ROWS = 1_048_576 - 1
+
+CATEGORY_SHEET = "Категорія+"
+OFFER_SHEET = "Оффер+"
+
+# Вкладки файлу мапінгу в тому порядку, в якому їх віддає HUB
+MAPPING_SHEETS = [
+    "Результат",
+    "Довідник кольорів",
+    "Каскад+",
+    "Конвертер+",
+    CATEGORY_SHEET,
+    "Інструкція щодо мапінгу Каскад",
+    "Підказки категорій",
+    "Ігнорувати+",
+    "Довідник Каста",
+    OFFER_SHEET,
+]
+
+# Заголовки вкладок (для вкладок без даних пишеться лише заголовок)
+SHEET_HEADERS: Dict[str, List[str]] = {
+    "Результат": ["Вкладка", "Кількість рядків", "Статус"],
+    "Довідник кольорів": ["Колір з фід", "Колір Каста"],
+    "Каскад+": ["ID категорії з фід", "Параметр", "Значення", "Категорія Каста"],
+    "Конвертер+": ["Параметр", "Значення з фід", "Значення Каста"],
+    CATEGORY_SHEET: ["ID категорії з фід", "Назва категорії з фід", "ID категорії Каста", "Назва категорії Каста"],
+    "Інструкція щодо мапінгу Каскад": ["Інструкція"],
+    "Підказки категорій": ["Назва категорії з фід", "Підказка"],
+    "Ігнорувати+": ["ID категорії з фід", "Причина"],
+    "Довідник Каста": ["ID категорії Каста", "Назва категорії Каста"],
+    OFFER_SHEET: ["ID оффера", "ID категорії з фід", "Назва товару", "Ціна"],
+}
+
+_CATEGORY_WORDS = [
+    "Парфуми", "Догляд", "Косметика", "Аксесуари", "Текстиль", "Взуття",
+    "Одяг", "Дім", "Сад", "Іграшки", "Спорт", "Посуд", "Прикраси", "Сумки",
+]
+_COLORS = ["чорний", "білий", "червоний", "синій", "зелений", "бежевий", "сірий", "рожевий"]
+
+
+class MappingWorkbookGenerator:
+    """Генератор реалістичних файлів мапінгу з заданою кількістю рядків"""
+
+    def __init__(self, category_rows: int = 1000, offer_rows: int = 0,
+                 kasta_categories: int = 500, seed: int = 0):
+        """
+        Ініціалізація генератора
+
+        Args:
+            category_rows: Кількість рядків у вкладці "Категорія+" (до EXCEL_MAX_DATA_ROWS)
+            offer_rows: Кількість рядків у вкладці "Оффер+" (до EXCEL_MAX_DATA_ROWS)
+            kasta_categories: Кількість категорій у довіднику Каста
+            seed: Зерно генератора випадкових чисел (однаковий seed - однаковий файл)
+        """
+        for name, value in (("category_rows", category_rows), ("offer_rows", offer_rows),
+                            ("kasta_categories", kasta_categories)):
+            if value < 0 or value > EXCEL_MAX_DATA_ROWS:
+                raise ValueError(f"{name} має бути в межах 0..{EXCEL_MAX_DATA_ROWS}, отримано: {value}")
+
+        self.category_rows = category_rows
+        self.offer_rows = offer_rows
+        self.kasta_categories = max(kasta_categories, 1)
+        self.seed = seed
+
+    def _kasta_category_name(self, kasta_id: int) -> str:
+        """Детермінована назва категорії Каста за її ID"""
+        first = _CATEGORY_WORDS[kasta_id % len(_CATEGORY_WORDS)]
+        second = _CATEGORY_WORDS[(kasta_id // len(_CATEGORY_WORDS)) % len(_CATEGORY_WORDS)]
+        return f"{first} > {second} {kasta_id}"
+
+    def iter_category_rows(self) -> Iterator[list]:
+        """
+        Рядки вкладки "Категорія+" (ID категорії з фід, назва, ID та назва категорії Каста)
+
+        Yields:
+            Список значень рядка
+        """
+        rnd = random.Random(self.seed)
+        for i in range(self.category_rows):
+            category_id = 1000 + i
+            parent = _CATEGORY_WORDS[i % len(_CATEGORY_WORDS)]
+            name = f"{parent} > {rnd.choice(_CATEGORY_WORDS)} {category_id}"
+            # Частина категорій залишається незамапленою, як у реальних файлах
+            if rnd.random() < 0.8:
+                kasta_id = rnd.randrange(self.kasta_categories)
+                yield [str(category_id), name, kasta_id, self._kasta_category_name(kasta_id)]
+            else:
+                yield [str(category_id), name, None, None]
+
+    def iter_offer_rows(self) -> Iterator[list]:
+        """
+        Рядки вкладки "Оффер+" (ID оффера, ID категорії з фід, назва товару, ціна)
+
+        Yields:
+            Список значень рядка
+        """
+        rnd = random.Random(self.seed + 1)
+        categories = max(self.category_rows, 1)
+        for i in range(self.offer_rows):
+            category_id = 1000 + rnd.randrange(categories)
+            yield [f"offer-{i}", str(category_id), f"Товар {i} {rnd.choice(_COLORS)}", round(rnd.uniform(50, 5000), 2)]
+
+    def _iter_sheet_rows(self, sheet_name: str) -> Iterator[list]:
+        """Рядки даних для вкладки (без заголовка)"""
+        if sheet_name == CATEGORY_SHEET:
+            yield from self.iter_category_rows()
+        elif sheet_name == OFFER_SHEET:
+            yield from self.iter_offer_rows()
+        elif sheet_name == "Довідник Каста":
+            for kasta_id in range(self.kasta_categories):
+                yield [kasta_id, self._kasta_category_name(kasta_id)]
+        elif sheet_name == "Довідник кольорів":
+            for color in _COLORS:
+                yield [color, color]
+        elif sheet_name == "Інструкція щодо мапінгу Каскад":
+            yield ["Синтетичний файл мапінгу, згенерований для тестів масштабування"]
+        elif sheet_name == "Результат":
+            yield [CATEGORY_SHEET, self.category_rows, "згенеровано"]
+            yield [OFFER_SHEET, self.offer_rows, "згенеровано"]
+
+    def generate(self, file_path: str) -> Dict[str, object]:
+        """
+        Згенерувати файл мапінгу з усіма очікуваними вкладками
+
+        Args:
+            file_path: Шлях до .xlsx файлу (папки створюються автоматично)
+
+        Returns:
+            Словник зі статистикою:
+            - path: шлях до файлу
+            - rows: кількість рядків даних по вкладках
+            - size_bytes: розмір файлу
+            - duration_s: час генерації в секундах
+        """
+        started = time.perf_counter()
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        workbook = Workbook(write_only=True)
+        rows_written: Dict[str, int] = {}
+        for sheet_name in MAPPING_SHEETS:
+            sheet = workbook.create_sheet(sheet_name)
+            sheet.append(SHEET_HEADERS[sheet_name])
+            count = 0
+            for row in self._iter_sheet_rows(sheet_name):
+                sheet.append(row)
+                count += 1
+            rows_written[sheet_name] = count
+        workbook.save(path)
+
+        return {
+            "path": str(path),
+            "rows": rows_written,
+            "size_bytes": path.stat().st_size,
+            "duration_s": round(time.perf_counter() - started, 3),
+        }
+
+
+def generate_mapping_workbook(file_path: str, category_rows: int = 1000, offer_rows: int = 0,
+                              seed: int = 0) -> Dict[str, object]:
+    """
+    Згенерувати синтетичний файл мапінгу (скорочений виклик MappingWorkbookGenerator)
+
+    Args:
+        file_path: Шлях до .xlsx файлу
+        category_rows: Кількість рядків у вкладці "Категорія+"
+        offer_rows: Кількість рядків у вкладці "Оффер+"
+        seed: Зерно генератора випадкових чисел
+
+    Returns:
+        Статистика генерації (див. MappingWorkbookGenerator.generate)
+    """
+    generator = MappingWorkbookGenerator(category_rows=category_rows, offer_rows=offer_rows, seed=seed)
+    return generator.generate(file_path)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Генерація синтетичного Excel файлу мапінгу")
+    parser.add_argument("output", help="Шлях до .xlsx файлу")
+    parser.add_argument("--category-rows", type=int, default=1000, help="Рядків у вкладці 'Категорія+'")
+    parser.add_argument("--offer-rows", type=int, default=0, help="Рядків у вкладці 'Оффер+'")
+    parser.add_argument("--seed", type=int, default=0, help="Зерно генератора")
+    args = parser.parse_args()
+
+    stats = generate_mapping_workbook(args.output, args.category_rows, args.offer_rows, args.seed)
+    print(f"Файл мапінгу згенеровано: {stats['path']}")
+    print(f"  Рядки: {stats['rows']}")
+    print(f"  Розмір: {stats['size_bytes']} байт, час: {stats['duration_s']} с")
@@ -0,0 +1,74 @@
+"""
+Профіль маршрутизації запитів для контекстів браузера: блокує необов'язкові ресурси
+(зображення, шрифти, медіа) і сторонню аналітику, яка затягує wait_for_load_state("networkidle").
+Запити, що не заблоковані, передаються далі (route.fallback) - іншим обробникам або в мережу.
+"""
+from collections import Counter
+from typing import Dict, Iterable
+from urllib.parse import urlparse
+from playwright.sync_api import BrowserContext, Route
+
+
+class RouteProfile:
+    """Deny-list типів ресурсів і хостів з лічильниками заблокованих запитів"""
+
+    def __init__(self, blocked_resource_types: Iterable[str] = (), blocked_hosts: Iterable[str] = ()):
+        """
+        Ініціалізація профілю
+
+        Args:
+            blocked_resource_types: Типи ресурсів Playwright (image, font, media, ...)
+            blocked_hosts: Хости; блокуються і їхні піддомени (google-analytics.com -> www.google-analytics.com)
+        """
+        self.blocked_resource_types = {item.strip().lower() for item in blocked_resource_types if item.strip()}
+        self.blocked_hosts = tuple(item.strip().lower().lstrip(".") for item in blocked_hosts if item.strip())
+        self.blocked_by_type: Counter = Counter()
+        self.blocked_by_host: Counter = Counter()
+        self.passed = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Чи є що блокувати"""
+        return bool(self.blocked_resource_types or self.blocked_hosts)
+
+    def _blocked_host(self, url: str) -> str:
+        """Хост з deny-list, під який підпадає URL (порожньо - не заблоковано)"""
+        host = (urlparse(url).hostname or "").lower()
+        for blocked in self.blocked_hosts:
+            if host == blocked or host.endswith("." + blocked):
+                return blocked
+        return ""
+
+    def handle(self, route: Route):
+        """Обробник context.route: abort для deny-list, інакше fallback"""
+        request = route.request
+        host = self._blocked_host(request.url)
+        if host:
+            self.blocked_by_host[host] += 1
+            route.abort("blockedbyclient")
+            return
+        if request.resource_type in self.blocked_resource_types:
+            self.blocked_by_type[request.resource_type] += 1
+            route.abort("blockedbyclient")
+            return
+        self.passed += 1
+        route.fallback()
+
+    def install(self, context: BrowserContext):
+        """Встановити профіль на контекст (порожній профіль нічого не встановлює)"""
+        if self.enabled:
+            context.route("**/*", self.handle)
+
+    def snapshot(self) -> Dict[str, int]:
+        """Поточні лічильники (для різниці до/після тесту)"""
+        stats = {f"заблоковано {key}": value for key, value in self.blocked_by_type.items()}
+        stats.update({f"заблоковано {key}": value for key, value in self.blocked_by_host.items()})
+        stats["пропущено"] = self.passed
+        return stats
+
+    def summary(self) -> str:
+        """Підсумок за сесію"""
+        blocked = sum(self.blocked_by_type.values()) + sum(self.blocked_by_host.values())
+        details = ", ".join(f"{key}: {value}" for key, value in
+                            (self.blocked_by_type + self.blocked_by_host).most_common())
+        return f"заблоковано {blocked} запитів ({details or 'немає'}), пропущено {self.passed}"
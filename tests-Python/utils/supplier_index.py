@@ -0,0 +1,330 @@
+"""
+Індекс постачальників (назва -> supplier_id) і перемикання постачальника без меню користувача.
+Замість пошуку серед усіх постачальників ("Всі (8859)") через UI на кожному тесті:
+- індекс будується з відповіді API списку постачальників, яку сторінка отримує при першому виборі через UI,
+  і кешується у JSON-файлі (TEST_SUPPLIER_INDEX) для наступних тестів, воркерів і запусків;
+- перемикання - той самий запит, що відправив UI при виборі, з іншим supplier_id (перехоплюється при
+  першому виборі через UI), або перехід за шаблоном URL (TEST_SUPPLIER_SWITCH_URL), якщо HUB
+  приймає постачальника параметром.
+Кеш розділений за BASE_URL, тому стенд і локальна заміна HUB не змішуються.
+"""
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from playwright.sync_api import Page, Request, Response
+from playwright.sync_api import Error as PlaywrightError
+
+from utils.worker_resources import ResourceLock
+
+
+# Запити, що стосуються постачальників (список, пошук, перемикання)
+SUPPLIER_API_RE = re.compile(r"supplier", re.I)
+# Плейсхолдер supplier_id у шаблоні перемикання
+SUPPLIER_ID_PLACEHOLDER = "{supplier_id}"
+# Поля елемента списку постачальників і ключі, під якими API може віддавати сам список
+_NAME_KEYS = ("name", "title", "supplier_name", "label")
+_ID_KEYS = ("id", "supplier_id", "value")
+_LIST_KEYS = ("items", "data", "results", "suppliers", "rows")
+# Заголовки, які переносяться з перехопленого запиту (решту браузер ставить сам або забороняє)
+_TEMPLATE_HEADERS = re.compile(r"^(content-type|accept|x-[\w-]+)$", re.I)
+
+
+def parse_supplier_list(payload: Any) -> Dict[str, str]:
+    """
+    Постачальники з JSON-відповіді API списку
+
+    Args:
+        payload: Список об'єктів {"id", "name"} або об'єкт зі списком під items/data/results/...
+
+    Returns:
+        {назва: supplier_id} (порожній словник, якщо це не список постачальників)
+    """
+    items = payload
+    if isinstance(payload, dict):
+        items = next((payload[key] for key in _LIST_KEYS if isinstance(payload.get(key), list)), None)
+    if not isinstance(items, list):
+        return {}
+    suppliers = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        name = next((str(item[key]).strip() for key in _NAME_KEYS if item.get(key)), "")
+        supplier_id = next((str(item[key]) for key in _ID_KEYS if item.get(key) not in (None, "")), "")
+        if name and supplier_id:
+            suppliers[name] = supplier_id
+    return suppliers
+
+
+def _id_pattern(supplier_id: str) -> "re.Pattern":
+    """supplier_id як окремий токен (123 не збігається всередині 41234)"""
+    return re.compile(rf"(?<![\w-]){re.escape(supplier_id)}(?![\w-])")
+
+
+class SupplierSwitch:
+    """Спосіб перемкнути постачальника: запит або перехід за URL з плейсхолдером {supplier_id}"""
+
+    def __init__(self, url: str, method: str = "GET", body: str = "", headers: Optional[Dict[str, str]] = None,
+                 navigate: bool = True):
+        """
+        Args:
+            url: URL з {supplier_id}
+            method: HTTP метод запиту (для navigate - GET)
+            body: Тіло запиту з {supplier_id}
+            headers: Заголовки запиту (content-type, accept, x-*)
+            navigate: True - перейти сторінкою за URL, False - відправити запит і перезавантажити сторінку
+        """
+        self.url = url
+        self.method = method
+        self.body = body
+        self.headers = headers or {}
+        self.navigate = navigate
+
+    @classmethod
+    def from_request(cls, request: Request, supplier_id: str) -> Optional["SupplierSwitch"]:
+        """Шаблон з перехопленого запиту, якщо supplier_id є в його URL або тілі"""
+        pattern = _id_pattern(supplier_id)
+        body = request.post_data or ""
+        if not pattern.search(request.url) and not pattern.search(body):
+            return None
+        headers = {name: value for name, value in request.headers.items() if _TEMPLATE_HEADERS.match(name)}
+        return cls(pattern.sub(SUPPLIER_ID_PLACEHOLDER, request.url), request.method,
+                   pattern.sub(SUPPLIER_ID_PLACEHOLDER, body), headers,
+                   navigate=request.is_navigation_request() and request.method == "GET")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SupplierSwitch":
+        return cls(data["url"], data.get("method", "GET"), data.get("body", ""), data.get("headers"),
+                   data.get("navigate", True))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"url": self.url, "method": self.method, "body": self.body, "headers": self.headers,
+                "navigate": self.navigate}
+
+    def apply(self, page: Page, supplier_id: str, timeout: int = 15000) -> bool:
+        """
+        Перемкнути постачальника
+
+        Returns:
+            True якщо HUB прийняв перемикання (2xx/3xx) і сторінка перезавантажена з новим постачальником
+        """
+        url = self.url.replace(SUPPLIER_ID_PLACEHOLDER, supplier_id)
+        if self.navigate:
+            response = page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+            return response is None or response.ok
+        response = page.request.fetch(url, method=self.method, headers=self.headers, timeout=timeout,
+                                      data=self.body.replace(SUPPLIER_ID_PLACEHOLDER, supplier_id) or None)
+        if not response.ok:
+            print(f">>> Перемикання постачальника {self.method} {url} -> {response.status}: {response.text()[:200]}")
+            return False
+        page.reload(wait_until="domcontentloaded", timeout=timeout)
+        return True
+
+
+class SupplierIndex:
+    """Кешований індекс постачальників одного HUB і спосіб перемикання між ними"""
+
+    def __init__(self, cache_path: Optional[str] = None, base_url: str = "", ttl_hours: float = 24,
+                 list_url: str = "", switch_url: str = ""):
+        """
+        Ініціалізація індексу
+
+        Args:
+            cache_path: JSON-файл кешу, спільний для воркерів і запусків (None - лише в пам'яті)
+            base_url: HUB, до якого належить індекс (ключ у файлі кешу)
+            ttl_hours: Через скільки годин список постачальників завантажується заново
+            list_url: URL API списку постачальників (порожньо - перехоплюється з UI)
+            switch_url: Шаблон URL перемикання з {supplier_id} (порожньо - запит перехоплюється з UI)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.base_url = base_url.rstrip("/")
+        self.ttl_s = ttl_hours * 3600
+        self.suppliers: Dict[str, str] = {}
+        self.list_url = ""
+        self.switch: Optional[SupplierSwitch] = None
+        self.updated_at = 0.0
+        self._refreshed = False
+        self._load()
+        # Значення з конфігурації мають пріоритет над перехопленими і не записуються в кеш
+        self._list_url_configured = bool(list_url)
+        self._switch_configured = bool(switch_url)
+        if list_url:
+            self.list_url = list_url
+        if switch_url:
+            self.switch = SupplierSwitch(switch_url)
+
+    def _read_cache(self) -> Dict[str, Any]:
+        if self.cache_path is None:
+            return {}
+        try:
+            return json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _load(self):
+        entry = self._read_cache().get(self.base_url, {})
+        self.suppliers = dict(entry.get("suppliers", {}))
+        self.list_url = entry.get("list_url", "")
+        self.switch = SupplierSwitch.from_dict(entry["switch"]) if entry.get("switch") else None
+        self.updated_at = entry.get("updated_at", 0.0)
+
+    def save(self):
+        """Злити індекс з файлом кешу (під локом, атомарним записом)"""
+        if self.cache_path is None:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with ResourceLock(str(self.cache_path.parent), "supplier-index", timeout=60):
+            data = self._read_cache()
+            entry = data.setdefault(self.base_url, {})
+            entry.setdefault("suppliers", {}).update(self.suppliers)
+            if self.list_url and not self._list_url_configured:
+                entry["list_url"] = self.list_url
+            if self.switch is not None and not self._switch_configured:
+                entry["switch"] = self.switch.to_dict()
+            entry["updated_at"] = max(entry.get("updated_at", 0.0), self.updated_at)
+            fd, tmp = tempfile.mkstemp(dir=str(self.cache_path.parent))
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(data, file, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.cache_path)
+        self.suppliers = dict(entry["suppliers"])
+
+    def add(self, name: str, supplier_id: str):
+        """Додати постачальника (напр. TEST_SUPPLIER_NAME з відомим TEST_SUPPLIER_ID)"""
+        if name and supplier_id:
+            self.suppliers[name] = str(supplier_id)
+
+    def find(self, name: str) -> Optional[str]:
+        """
+        supplier_id за назвою: точний збіг, без урахування регістру, потім єдина назва, що містить name
+        (у списку HUB назва може мати префікс, напр. "v4Парфюмс")
+
+        Returns:
+            supplier_id або None якщо постачальника немає в індексі або збіг неоднозначний
+        """
+        if name in self.suppliers:
+            return self.suppliers[name]
+        wanted = name.strip().casefold()
+        exact = [supplier_id for key, supplier_id in self.suppliers.items() if key.casefold() == wanted]
+        if exact:
+            return exact[0]
+        partial = {supplier_id for key, supplier_id in self.suppliers.items() if wanted in key.casefold()}
+        return partial.pop() if len(partial) == 1 else None
+
+    def refresh(self, page: Page, timeout: int = 30000):
+        """
+        Один раз за сесію: завантажити список постачальників напряму, якщо кеш застарів (TTL) або порожній
+
+        Args:
+            page: Авторизована сторінка (запит іде з cookies її контексту)
+            timeout: Таймаут запиту в мс
+        """
+        if self._refreshed or not self.list_url:
+            return
+        self._refreshed = True
+        if self.suppliers and time.time() - self.updated_at < self.ttl_s:
+            return
+        started = time.perf_counter()
+        try:
+            response = page.request.get(self.list_url, headers={"Accept": "application/json"}, timeout=timeout)
+            suppliers = parse_supplier_list(response.json()) if response.ok else {}
+        except (PlaywrightError, ValueError) as e:
+            print(f">>> Список постачальників {self.list_url} не завантажено: {e}")
+            return
+        if not suppliers:
+            print(f">>> Список постачальників {self.list_url}: {response.status}, постачальників не знайдено")
+            return
+        self.suppliers.update(suppliers)
+        self.updated_at = time.time()
+        self.save()
+        print(f">>> Індекс постачальників оновлено: {len(suppliers)} за {time.perf_counter() - started:.2f} с")
+
+    def learn(self, name: str, responses: List[Response], requests: List[Request]):
+        """
+        Запам'ятати список постачальників і запит перемикання з вибору постачальника через UI
+
+        Args:
+            name: Назва вибраного постачальника
+            responses: Відповіді API постачальників під час вибору (з них - список)
+            requests: Запити після кліку на постачальника (з них - перемикання)
+        """
+        largest = 0
+        for response in responses:
+            try:
+                suppliers = parse_supplier_list(response.json())
+            except (PlaywrightError, ValueError):
+                continue
+            self.suppliers.update(suppliers)
+            if response.request.method == "GET" and len(suppliers) > largest:
+                largest = len(suppliers)
+                if not self._list_url_configured:
+                    self.list_url = response.url
+        if largest:
+            self.updated_at = time.time()
+        supplier_id = self.find(name)
+        if supplier_id is not None and self.switch is None:
+            # Перевага - запитам, що змінюють стан, потім переходам сторінкою
+            ranked = sorted(requests, key=lambda request: (request.method == "GET",
+                                                           not request.is_navigation_request()))
+            for request in ranked:
+                self.switch = SupplierSwitch.from_request(request, supplier_id)
+                if self.switch is not None:
+                    break
+        if largest or self.switch is not None:
+            self.save()
+        print(f">>> Індекс постачальників: {len(self.suppliers)} постачальників, "
+              f"{name} -> {supplier_id or 'не знайдено'}, перемикання: "
+              f"{'перехоплено' if self.switch is not None else 'не перехоплено'}")
+
+    def switch_to(self, page: Page, name: str, timeout: int = 15000,
+                  verify: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        Вибрати постачальника без меню користувача
+
+        Args:
+            page: Авторизована сторінка
+            name: Назва постачальника
+            timeout: Таймаут перемикання в мс
+            verify: Перевірка, що сторінка після перемикання показує постачальника (напр. назва в шапці);
+                перехоплений шаблон може бути звичайним запитом даних, а не перемиканням, і 2xx ще нічого не означає
+
+        Returns:
+            True якщо постачальника вибрано; False - індекс не знає постачальника або способу перемикання,
+            HUB відхилив перемикання чи сторінка не показує постачальника (тоді потрібен вибір через UI)
+        """
+        self.refresh(page)
+        supplier_id = self.find(name)
+        if supplier_id is None or self.switch is None:
+            return False
+        started = time.perf_counter()
+        try:
+            switched = self.switch.apply(page, supplier_id, timeout)
+        except PlaywrightError as e:
+            print(f">>> Перемикання постачальника {name} ({supplier_id}) не вдалося: {e}")
+            switched = False
+        if switched and verify is not None and not verify():
+            print(f">>> Після перемикання {self.switch.method} {self.switch.url} сторінка не показує {name}")
+            switched = False
+        if not switched:
+            # Спосіб перемикання більше не працює - UI перехопить новий
+            self.switch = None
+            self._switch_configured = False
+            return False
+        print(f">>> Постачальник {name} ({supplier_id}) вибрано напряму за {time.perf_counter() - started:.2f} с")
+        return True
+
+
+_index = SupplierIndex()
+
+
+def get_supplier_index() -> SupplierIndex:
+    """Індекс процесу, яким користуються Page Objects"""
+    return _index
+
+
+def set_supplier_index(index: SupplierIndex):
+    """Встановити індекс процесу (conftest: з файлом кешу TEST_SUPPLIER_INDEX)"""
+    global _index
+    _index = index
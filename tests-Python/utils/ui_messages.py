@@ -0,0 +1,213 @@
+"""
+Журнал повідомлень UI (alert, toast, помилки валідації), що веде сама сторінка.
+Скрипт ініціалізації ставить MutationObserver і записує кожне повідомлення Ant Design з міткою часу
+в момент появи, тому перевірки читають журнал одним викликом замість опитування набору селекторів
+з таймаутами, а toast, що зник до перевірки, все одно є в журналі.
+Журнал дублюється в sessionStorage і переживає повне перезавантаження сторінки в межах origin.
+"""
+import json
+import re
+import weakref
+from typing import Dict, List, Optional, Sequence, Union
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+
+# Види повідомлень і їх селектори; елемент отримує перший вид, під який підходить
+MESSAGE_KINDS = (
+    ("validation", ".ant-form-item-explain-error"),
+    ("toast", ".ant-message-notice, .ant-notification-notice"),
+    ("alert", ".ant-alert, [role='alert']"),
+)
+# Скільки записів тримати (журнал не росте безмежно на довгих сторінках)
+MAX_ENTRIES = 500
+
+# Встановлює window.__hubMessageLog: записує видиме повідомлення, коли воно з'являється або змінює текст.
+# Вкладені збіги (напр. [role=alert] всередині .ant-message-notice) не записуються окремо.
+OBSERVER_JS = """
+([kinds, maxEntries]) => {
+    if (window.__hubMessageLog) return;
+    const storageKey = '__hubMessageLog';
+    const anySelector = kinds.map(([, selector]) => selector).join(', ');
+    let saved = {};
+    try { saved = JSON.parse(sessionStorage.getItem(storageKey) || '{}'); } catch (e) { saved = {}; }
+    let entries = Array.isArray(saved.entries) ? saved.entries : [];
+    let nextId = saved.nextId || 1;
+    const elements = [];
+    const lastText = new WeakMap();
+    const isVisible = (el) => el.isConnected && !el.closest('[hidden]')
+        && !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+    const persist = () => {
+        try { sessionStorage.setItem(storageKey, JSON.stringify({ entries, nextId })); } catch (e) { /* quota / заборонено */ }
+    };
+    const scan = () => {
+        if (!document.documentElement) return;
+        let changed = false;
+        for (const el of document.querySelectorAll(anySelector)) {
+            if (el.parentElement && el.parentElement.closest(anySelector)) continue;
+            const text = (el.innerText || el.textContent || '').trim();
+            if (!text || !isVisible(el) || lastText.get(el) === text) continue;
+            lastText.set(el, text);
+            const kind = kinds.find(([, selector]) => el.matches(selector))[0];
+            entries.push({ id: nextId++, kind, text, ts: Date.now(), url: location.href, cls: String(el.className || '') });
+            elements.push([entries.length - 1, new WeakRef(el)]);
+            changed = true;
+        }
+        if (changed) {
+            if (entries.length > maxEntries) {
+                const drop = entries.length - maxEntries;
+                entries.splice(0, drop);
+                for (const item of elements) item[0] -= drop;
+                while (elements.length && elements[0][0] < 0) elements.shift();
+            }
+            persist();
+        }
+    };
+    const query = ({ kinds: wanted, text, source, flags, afterId, visibleOnly }) => {
+        const pattern = source ? new RegExp(source, flags) : null;
+        const needle = text ? text.toLowerCase() : null;
+        const live = new Map(elements.map(([index, ref]) => [index, ref.deref()]));
+        return entries
+            .map((entry, index) => Object.assign({}, entry, { visible: !!live.get(index) && isVisible(live.get(index)) }))
+            .filter((entry) => (!wanted || wanted.includes(entry.kind))
+                && (!needle || entry.text.toLowerCase().includes(needle))
+                && (!pattern || pattern.test(entry.text))
+                && (!afterId || entry.id > afterId)
+                && (!visibleOnly || entry.visible));
+    };
+    const clear = () => { entries = []; elements.length = 0; persist(); };
+    window.__hubMessageLog = { scan, query, clear };
+    const start = () => {
+        scan();
+        new MutationObserver(scan).observe(document.documentElement, {
+            childList: true, subtree: true, characterData: true, attributes: true,
+            attributeFilter: ['class', 'style', 'hidden'],
+        });
+    };
+    if (document.documentElement) start();
+    else document.addEventListener('readystatechange', start, { once: true });
+}
+"""
+
+# Записи журналу за фільтром (порожній список якщо журнал ще не встановлено)
+QUERY_JS = "(q) => window.__hubMessageLog ? window.__hubMessageLog.query(q) : []"
+# Перший запис за фільтром або null - для wait_for_function
+FIRST_MATCH_JS = "(q) => (window.__hubMessageLog && window.__hubMessageLog.query(q)[0]) || null"
+
+TextFilter = Union[str, "re.Pattern", None]
+
+
+class MessageLog:
+    """Журнал повідомлень UI однієї сторінки Playwright"""
+
+    _logs: "weakref.WeakKeyDictionary[Page, MessageLog]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: Page):
+        """
+        Args:
+            page: Сторінка, на якій ведеться журнал
+        """
+        self.page = page
+        # id останнього запису, вже використаного wait_for_next (наступні перевірки його не бачать)
+        self.last_id = 0
+        self._args = [[list(kind) for kind in MESSAGE_KINDS], MAX_ENTRIES]
+
+    @classmethod
+    def for_page(cls, page: Page) -> "MessageLog":
+        """Журнал сторінки: встановлюється при першому виклику, далі повертається той самий"""
+        log = cls._logs.get(page)
+        if log is None:
+            log = cls(page)
+            log.install()
+            cls._logs[page] = log
+        return log
+
+    def install(self):
+        """Встановити спостерігач на наступні документи сторінки і на поточний"""
+        self.page.add_init_script(f"({OBSERVER_JS})({json.dumps(self._args, ensure_ascii=False)})")
+        if self.page.url not in ("", "about:blank"):
+            self.page.evaluate(OBSERVER_JS, self._args)
+
+    @staticmethod
+    def _query(kinds: Optional[Sequence[str]], text: TextFilter, after_id: int,
+               visible_only: bool) -> Dict:
+        query = {"kinds": list(kinds) if kinds else None, "text": None, "source": None, "flags": "",
+                 "afterId": after_id, "visibleOnly": visible_only}
+        if isinstance(text, str):
+            query["text"] = text
+        elif text is not None:
+            query["source"] = text.pattern
+            query["flags"] = "i" if text.flags & re.I else ""
+        return query
+
+    def entries(self, kinds: Optional[Sequence[str]] = None, text: TextFilter = None,
+                after_id: int = 0, visible_only: bool = False) -> List[Dict]:
+        """
+        Записи журналу за фільтром (один виклик у сторінку)
+
+        Args:
+            kinds: Види повідомлень ("alert", "toast", "validation"); None - усі
+            text: Підрядок (без урахування регістру) або регулярний вираз (синтаксис JS)
+            after_id: Лише записи, новіші за запис з цим id (див. mark())
+            visible_only: Лише повідомлення, видимі зараз
+
+        Returns:
+            Записи {"id", "kind", "text", "ts", "url", "cls", "visible"} у порядку появи
+        """
+        return self.page.evaluate(QUERY_JS, self._query(kinds, text, after_id, visible_only))
+
+    def texts(self, kinds: Optional[Sequence[str]] = None, after_id: int = 0) -> List[str]:
+        """Тексти всіх записаних повідомлень"""
+        return [entry["text"] for entry in self.entries(kinds, after_id=after_id)]
+
+    def find(self, text: TextFilter = None, kinds: Optional[Sequence[str]] = None,
+             after_id: int = 0, visible_only: bool = False) -> Optional[Dict]:
+        """Перший запис за фільтром без очікування (None якщо немає)"""
+        found = self.entries(kinds, text, after_id, visible_only)
+        return found[0] if found else None
+
+    def wait_for(self, text: TextFilter = None, kinds: Optional[Sequence[str]] = None, timeout: int = 10000,
+                 after_id: int = 0, visible_only: bool = False) -> Optional[Dict]:
+        """
+        Чекати запис за фільтром (умова перевіряється в сторінці, без опитування з Python)
+
+        Args:
+            text: Підрядок (без урахування регістру) або регулярний вираз (синтаксис JS)
+            kinds: Види повідомлень; None - усі
+            timeout: Максимальний час очікування в мс (0 - лише поточний стан журналу, без очікування)
+            after_id: Лише записи, новіші за запис з цим id (див. mark())
+            visible_only: Лише повідомлення, видимі зараз
+
+        Returns:
+            Перший запис або None якщо не з'явився до дедлайну
+        """
+        if timeout <= 0:
+            # wait_for_function з timeout=0 чекав би без обмеження
+            return self.find(text, kinds, after_id, visible_only)
+        try:
+            handle = self.page.wait_for_function(FIRST_MATCH_JS, arg=self._query(kinds, text, after_id, visible_only),
+                                                 timeout=timeout)
+        except PlaywrightTimeoutError:
+            return None
+        return handle.json_value()
+
+    def wait_for_next(self, text: TextFilter = None, kinds: Optional[Sequence[str]] = None,
+                      timeout: int = 10000) -> Optional[Dict]:
+        """
+        Чекати запис, новіший за останній використаний, і позначити його використаним
+        (повторна перевірка того самого повідомлення після наступної дії не спрацює на старому записі)
+        """
+        entry = self.wait_for(text, kinds, timeout=timeout, after_id=self.last_id)
+        if entry is not None:
+            self.last_id = entry["id"]
+        return entry
+
+    def mark(self) -> int:
+        """id останнього запису - для after_id, щоб брати лише повідомлення після дії"""
+        entries = self.entries()
+        return entries[-1]["id"] if entries else 0
+
+    def clear(self):
+        """Очистити журнал (і його копію в sessionStorage)"""
+        self.page.evaluate("() => window.__hubMessageLog && window.__hubMessageLog.clear()")
+
@@ -0,0 +1,254 @@
+"""
+Розподіл спільних ресурсів HUB між воркерами паралельного запуску (pytest -n N, pytest-xdist).
+Кожен воркер отримує свій слот (постачальник і його фіди), тести з ексклюзивними ресурсами
+(один і той самий URL фіду, ліміт активних фідів постачальника) серіалізуються файловим локом,
+а артефакти (скачані файли, скріншоти) отримують у назві ID воркера.
+"""
+import hashlib
+import os
+import re
+import time
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def worker_id() -> str:
+    """ID воркера xdist (gw0, gw1, ...) або "main" при звичайному запуску"""
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def worker_index() -> int:
+    """Номер воркера (0 для gw0 і для запуску без xdist)"""
+    match = re.search(r"\d+$", worker_id())
+    return int(match.group()) if match else 0
+
+
+def worker_count() -> int:
+    """Кількість воркерів (1 при запуску без xdist)"""
+    return int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+
+def artifact_name(stem: str, suffix: str = "") -> str:
+    """
+    Назва файлу артефакту, унікальна між воркерами
+
+    Args:
+        stem: Основа назви (напр. R3DV_20250101_120000)
+        suffix: Розширення з крапкою (напр. .xlsx)
+
+    Returns:
+        stem + "_gwN" + suffix під xdist, інакше stem + suffix
+    """
+    if worker_id() == "main":
+        return f"{stem}{suffix}"
+    return f"{stem}_{worker_id()}{suffix}"
+
+
+class WorkerSlot:
+    """Набір ресурсів HUB, який використовує один воркер: постачальник і його фіди"""
+
+    __slots__ = ("supplier_name", "supplier_id", "existing_feed_id", "feed_ids_for_limit")
+
+    def __init__(self, supplier_name: str, supplier_id: str = "", existing_feed_id: str = "",
+                 feed_ids_for_limit: Optional[List[str]] = None):
+        """
+        Ініціалізація слоту
+
+        Args:
+            supplier_name: Назва постачальника (TEST_SUPPLIER_NAME)
+            supplier_id: ID постачальника (TEST_SUPPLIER_ID)
+            existing_feed_id: Фід для тестів мапінгу (TEST_EXISTING_FEED_ID)
+            feed_ids_for_limit: 4 фіди для тесту ліміту активних фідів (TEST_FEED_IDS_FOR_LIMIT)
+        """
+        self.supplier_name = supplier_name
+        self.supplier_id = supplier_id
+        self.existing_feed_id = existing_feed_id
+        self.feed_ids_for_limit = list(feed_ids_for_limit or [])
+
+    @classmethod
+    def from_string(cls, value: str) -> "WorkerSlot":
+        """
+        Розібрати слот з рядка "постачальник|supplier_id|existing_feed_id|feed_id,feed_id,..."
+
+        Порожні або відсутні частини залишаються порожніми (тоді діє значення з TestConfig).
+        """
+        parts = [part.strip() for part in value.split("|")] + [""] * 4
+        feed_ids = [feed_id.strip() for feed_id in parts[3].split(",") if feed_id.strip()]
+        return cls(parts[0], parts[1], parts[2], feed_ids)
+
+    def apply_to(self, config) -> dict:
+        """
+        Підставити значення слоту в TestConfig
+
+        Args:
+            config: Клас TestConfig
+
+        Returns:
+            Попередні значення змінених атрибутів (для відновлення через setattr)
+        """
+        values = {
+            "TEST_SUPPLIER_NAME": self.supplier_name,
+            "TEST_SUPPLIER_ID": self.supplier_id,
+            "TEST_EXISTING_FEED_ID": self.existing_feed_id,
+            "TEST_FEED_IDS_FOR_LIMIT": self.feed_ids_for_limit,
+        }
+        original = {}
+        for attr, value in values.items():
+            if value:
+                original[attr] = getattr(config, attr)
+                setattr(config, attr, value)
+        return original
+
+    def __repr__(self) -> str:
+        return (f"WorkerSlot(supplier_name={self.supplier_name!r}, existing_feed_id={self.existing_feed_id!r}, "
+                f"feed_ids_for_limit={self.feed_ids_for_limit!r})")
+
+
+def parse_worker_slots(value: str) -> List[WorkerSlot]:
+    """Слоти з TEST_WORKER_SLOTS (розділені ";"); порожній рядок - порожній список"""
+    return [WorkerSlot.from_string(item) for item in value.split(";") if item.strip()]
+
+
+def slot_for_worker(slots: List[WorkerSlot], index: Optional[int] = None) -> Optional[WorkerSlot]:
+    """
+    Слот для воркера: воркер i отримує слот i % len(slots)
+
+    Якщо воркерів більше ніж слотів, кілька воркерів ділять слот - тоді їхні ексклюзивні
+    тести серіалізуються через ResourceLock.
+    """
+    if not slots:
+        return None
+    return slots[(worker_index() if index is None else index) % len(slots)]
+
+
+class ResourceLockTimeout(Exception):
+    """Не вдалося захопити лок ресурсу до дедлайну"""
+
+
+class ResourceLock:
+    """
+    Міжпроцесний лок іменованого ресурсу на файлі (спільний для воркерів на одній машині)
+
+    shared=True - спільний лок (тест лише читає/додає дані ресурсу), shared=False - ексклюзивний.
+    Ексклюзивний лок має перевагу: очікуючи, він тримає файл-шлагбаум (<лок>.gate), через який
+    проходить кожен новий спільний лок, тому потік спільних локів, що перекриваються, не відкладає його
+    безкінечно - нові спільні чекають, поки вже захоплені звільняться і ексклюзивний відпрацює.
+    На Windows спільних локів немає, тому там кожен лок ексклюзивний.
+    """
+
+    def __init__(self, lock_dir: str, name: str, shared: bool = False, timeout: float = 900,
+                 poll_interval: float = 0.2):
+        """
+        Ініціалізація лока
+
+        Args:
+            lock_dir: Каталог файлів локів (спільний для всіх воркерів)
+            name: Назва ресурсу (напр. "Парфюмс:url:https://...")
+            shared: Спільний (True) чи ексклюзивний (False) лок
+            timeout: Максимальний час очікування лока в секундах
+            poll_interval: Інтервал повторної спроби в секундах
+        """
+        self.name = name
+        self.shared = shared
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        safe = re.sub(r"[^\w.-]+", "_", name)[:40]
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:12]
+        self.path = Path(lock_dir) / f"{safe}_{digest}.lock"
+        self.gate_path = self.path.with_suffix(".gate")
+        self.waited_s = 0.0
+        self._file = None
+        self._gate = None
+
+    def _try_lock(self, file, shared: bool) -> bool:
+        """Одна неблокуюча спроба захопити лок файлу"""
+        try:
+            if fcntl is not None:
+                mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                fcntl.flock(file.fileno(), mode | fcntl.LOCK_NB)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def _unlock(file):
+        """Зняти лок файлу і закрити його"""
+        try:
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            file.close()
+
+    def _wait_lock(self, path: Path, shared: bool, started: float):
+        """
+        Відкрити файл і чекати на ньому лок до дедлайну acquire
+
+        Returns:
+            Відкритий файл із захопленим локом
+
+        Raises:
+            ResourceLockTimeout: Якщо лок не звільнився до дедлайну
+        """
+        file = open(path, "a+")
+        while not self._try_lock(file, shared):
+            if time.perf_counter() - started > self.timeout:
+                file.close()
+                raise ResourceLockTimeout(f"Ресурс '{self.name}' зайнятий довше {self.timeout} с")
+            time.sleep(self.poll_interval)
+        return file
+
+    def acquire(self):
+        """
+        Захопити лок, чекаючи не довше timeout
+
+        Raises:
+            ResourceLockTimeout: Якщо лок не звільнився до дедлайну
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        # Спільний лок лише проходить шлагбаум; ексклюзивний тримає його до release,
+        # щоб нові спільні локи не захоплювали ресурс, поки він чекає і працює
+        gate = self._wait_lock(self.gate_path, self.shared, started)
+        try:
+            self._file = self._wait_lock(self.path, self.shared, started)
+        except BaseException:
+            self._unlock(gate)
+            raise
+        if self.shared:
+            self._unlock(gate)
+        else:
+            self._gate = gate
+        self.waited_s = round(time.perf_counter() - started, 3)
+        if self.waited_s >= 1:
+            print(f">>> [{worker_id()}] Очікування ресурсу '{self.name}': {self.waited_s} с")
+
+    def release(self):
+        """Звільнити лок"""
+        if self._file is None:
+            return
+        try:
+            self._unlock(self._file)
+        finally:
+            self._file = None
+            if self._gate is not None:
+                gate, self._gate = self._gate, None
+                self._unlock(gate)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()